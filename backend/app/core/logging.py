@@ -1,24 +1,135 @@
 """Logging configuration for the application."""
 
+import atexit
 import logging
 import sys
-from typing import Literal
+import threading
+from logging.handlers import MemoryHandler
+from typing import Literal, Optional, TextIO
 
 LogLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
 
 
-def setup_logging(level: LogLevel = "INFO") -> None:
+class OneWriteStreamHandler(logging.StreamHandler[TextIO]):
+    """StreamHandler that can write a batch of records with a single write()."""
+
+    def emit_batch(self, records: list[logging.LogRecord]) -> None:
+        """Format records and write them to the stream in one call.
+
+        Args:
+            records: The log records to emit, in order.
+        """
+        if not records:
+            return
+        try:
+            payload = "".join(self.format(record) + self.terminator for record in records)
+            self.acquire()
+            try:
+                self.stream.write(payload)
+                self.flush()
+            finally:
+                self.release()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(records[-1])
+
+
+class _BatchingMemoryHandler(MemoryHandler):
+    """MemoryHandler that hands its whole buffer to the target at once.
+
+    A daemon thread also flushes every flush_interval seconds, so records
+    logged during a quiet period reach stdout promptly instead of waiting
+    for the buffer to fill.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        flushLevel: int = logging.ERROR,
+        target: Optional[logging.Handler] = None,
+        flushOnClose: bool = True,
+        flush_interval: float = 1.0,
+    ) -> None:
+        """Initialize the handler and start its flush thread.
+
+        Args:
+            capacity: Number of records to buffer before flushing.
+            flushLevel: Records at or above this level flush immediately.
+            target: Handler that receives the flushed records.
+            flushOnClose: Whether close() flushes the remaining buffer.
+            flush_interval: Seconds between periodic flushes.
+        """
+        super().__init__(capacity, flushLevel, target, flushOnClose)
+        self._flush_interval = flush_interval
+        self._stop_flushing = threading.Event()
+        threading.Thread(
+            target=self._flush_periodically, name="log-flush", daemon=True
+        ).start()
+
+    def _flush_periodically(self) -> None:
+        """Flush on a fixed interval until the handler is closed."""
+        while not self._stop_flushing.wait(self._flush_interval):
+            self.flush()
+
+    def close(self) -> None:
+        """Stop the flush thread, then flush and close as MemoryHandler does."""
+        self._stop_flushing.set()
+        super().close()
+
+    def flush(self) -> None:
+        """Hand every buffered record to the target, in one write if possible."""
+        self.acquire()
+        try:
+            if not self.buffer or self.target is None:
+                return
+            if isinstance(self.target, OneWriteStreamHandler):
+                # emit_batch bypasses Handler.handle(), so apply the target's
+                # level and filters here as handle() would
+                self.target.emit_batch([
+                    record
+                    for record in self.buffer
+                    if record.levelno >= self.target.level and self.target.filter(record)
+                ])
+            else:
+                for record in self.buffer:
+                    self.target.handle(record)
+            self.buffer.clear()
+        finally:
+            self.release()
+
+
+def setup_logging(
+    level: LogLevel = "INFO",
+    buffer_capacity: int = 64,
+    flush_interval: float = 1.0,
+) -> None:
     """Configure application logging.
 
+    Records are buffered in memory and written to stdout in batches; the
+    buffer is flushed when full, every flush_interval seconds, on any ERROR
+    record, and at shutdown.
+
     Args:
         level: The logging level to use.
+        buffer_capacity: Number of records to buffer before flushing.
+        flush_interval: Maximum seconds a record waits in the buffer.
     """
-    logging.basicConfig(
-        level=level,
-        format="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-        handlers=[logging.StreamHandler(sys.stdout)],
+    stream_handler = OneWriteStreamHandler(sys.stdout)
+    stream_handler.setFormatter(
+        logging.Formatter(
+            fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
+    )
+    memory_handler = _BatchingMemoryHandler(
+        capacity=buffer_capacity,
+        flushLevel=logging.ERROR,
+        target=stream_handler,
+        flushOnClose=True,
+        flush_interval=flush_interval,
     )
+    logging.basicConfig(level=level, handlers=[memory_handler], force=True)
 
     # Reduce noise from third-party libraries
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -38,3 +149,11 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
+def flush_logging() -> None:
+    """Flush any buffered log records on the root logger's handlers."""
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
+
+# Registered once: flushes whichever handlers are installed at exit
+atexit.register(flush_logging)
@@ -0,0 +1,18 @@
+"""ASGI middleware for the application."""
+
+from starlette.middleware.cors import CORSMiddleware
+from starlette.types import Receive, Scope, Send
+
+
+class CORSForApi(CORSMiddleware):
+    """CORS middleware that only applies to API routes.
+
+    The HTMX dashboard and static files are served same-origin, so requests
+    outside ``/api`` bypass CORS processing entirely.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and not scope["path"].startswith("/api"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
@@ -1,37 +1,161 @@
 """FastAPI application factory and main entry point."""
 
 import asyncio
+import fcntl
 import os
+import tempfile
+import time
 from contextlib import asynccontextmanager
+from functools import lru_cache
+from pathlib import Path
 from typing import AsyncGenerator
 
+import httpx
+import orjson
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
+from sqlalchemy import text
 
 from app.core.config import get_settings
-from app.core.logging import get_logger, setup_logging
-from app.rwa_aggregator.infrastructure.tasks.price_tasks import _fetch_all_prices_async
+from app.core.logging import flush_logging, get_logger, setup_logging
+from app.core.middleware import CORSForApi
+from app.rwa_aggregator.infrastructure.db.session import get_engine
+from app.rwa_aggregator.infrastructure.external.http_client import (
+    close_shared_http_client,
+    get_shared_http_client,
+)
+from app.rwa_aggregator.infrastructure.external.quote_cache import (
+    close_shared_quote_cache,
+)
 from app.rwa_aggregator.presentation.api import alerts, health, prices, tokens
 from app.rwa_aggregator.presentation.web import dashboard
 
 settings = get_settings()
 logger = get_logger(__name__)
 
+PRICE_FETCH_INTERVAL_SECONDS = 10
+PARTITION_MAINTENANCE_INTERVAL_SECONDS = 24 * 60 * 60
 
-async def price_fetcher_loop() -> None:
-    """Background task to fetch prices every 10 seconds."""
+# Held for the process lifetime by the one worker that owns background jobs
+_LEADER_LOCK_PATH = os.path.join(tempfile.gettempdir(), "rwa_aggregator_leader.lock")
+
+
+def _try_acquire_leader_lock() -> int | None:
+    """Try to become the leader among workers sharing this host.
+
+    When running under Gunicorn with several workers, only the leader runs
+    the in-process price fetcher and partition upkeep. Migrations and
+    seeding run earlier, in the Gunicorn master (see app.prestart). The
+    lock is per host, so with several replicas each one elects a leader;
+    run price fetching through Celery (PRICE_FETCHER_IN_PROCESS=false) there.
+
+    Returns:
+        The open lock file descriptor if acquired, None otherwise.
+    """
+    fd = os.open(_LEADER_LOCK_PATH, os.O_CREAT | os.O_RDWR, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
+        return None
+    return fd
+
+
+async def price_fetcher_loop(http_client: httpx.AsyncClient) -> None:
+    """Background task to fetch prices every 10 seconds.
+
+    Ticks are scheduled against the loop's monotonic clock so fetch time
+    does not add to the interval. A fetch that overruns its slot drops the
+    missed ticks instead of running them back to back.
+
+    Args:
+        http_client: Shared HTTP client reused across polling cycles.
+    """
+    # Deferred: pulls in Celery and the venue adapters
+    from app.rwa_aggregator.infrastructure.tasks.price_tasks import _fetch_all_prices_async
+
+    loop = asyncio.get_running_loop()
+    tick = loop.time()
     while True:
         try:
             logger.debug("Fetching prices from all venues...")
-            result = await _fetch_all_prices_async()
+            result = await _fetch_all_prices_async(http_client=http_client)
             logger.info(
                 f"Price fetch complete: {result['snapshots_created']} snapshots "
                 f"for {result['tokens_processed']} tokens"
             )
         except Exception as e:
             logger.error(f"Price fetch error: {e}")
-        await asyncio.sleep(10)
+
+        tick += PRICE_FETCH_INTERVAL_SECONDS
+        delay = tick - loop.time()
+        if delay < 0:
+            tick = loop.time()
+            delay = 0
+        await asyncio.sleep(delay)
+
+
+async def partition_maintenance_loop() -> None:
+    """Background task keeping upcoming price_snapshots partitions in place.
+
+    Runs at startup and then daily on the leader worker, so new months get
+    their partition even when no Celery beat is deployed.
+    """
+    # Deferred: pulls in Celery
+    from app.rwa_aggregator.infrastructure.tasks.maintenance_tasks import (
+        _ensure_snapshot_partitions_async,
+    )
+
+    while True:
+        try:
+            result = await _ensure_snapshot_partitions_async()
+            logger.info(f"Snapshot partitions ensured for {result['months']}")
+        except Exception as e:
+            logger.error(f"Partition maintenance error: {e}")
+        await asyncio.sleep(PARTITION_MAINTENANCE_INTERVAL_SECONDS)
+
+
+class UTCORJSONResponse(ORJSONResponse):
+    """ORJSONResponse that serializes naive datetimes as UTC."""
+
+    def render(self, content: object) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NAIVE_UTC)
+
+
+@lru_cache
+def _static_dir() -> str | None:
+    """Resolve the static files directory once.
+
+    Returns:
+        Absolute path to the static directory, or None if it does not exist.
+    """
+    path = Path(__file__).parent / "rwa_aggregator" / "presentation" / "static"
+    return str(path) if path.is_dir() else None
+
+
+async def _warm_up() -> None:
+    """Pay cold-start costs at startup instead of on the first request.
+
+    Opens (and returns to the pool) a database connection and compiles the
+    dashboard templates. Outbound venue connections are warmed by the first
+    price fetch, which runs immediately after startup.
+    """
+    started = time.perf_counter()
+    try:
+        async with get_engine().connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    except Exception as e:
+        logger.warning(f"⚠️ Database warm-up failed (continuing anyway): {e}")
+
+    for template_name in (
+        "dashboard.html",
+        "partials/kpi_cards.html",
+        "partials/price_table.html",
+    ):
+        dashboard.templates.get_template(template_name)
+
+    logger.info(f"Warm-up complete in {(time.perf_counter() - started) * 1000:.0f}ms")
 
 
 @asynccontextmanager
@@ -42,80 +166,49 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("RWA Liquidity Aggregator starting up...")
     logger.info(f"Environment: {settings.app_env}")
 
-    # Run database migrations on startup (Railway deployment)
-    if settings.is_production:
-        try:
-            logger.info("Running database migrations...")
-            import os
-            import subprocess
-            import sys
-            
-            # Find alembic.ini - it's in the backend directory
-            backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            alembic_ini_path = os.path.join(backend_dir, "alembic.ini")
-            
-            if os.path.exists(alembic_ini_path):
-                # Change to backend directory and run alembic command
-                original_cwd = os.getcwd()
-                try:
-                    os.chdir(backend_dir)
-                    result = subprocess.run(
-                        [sys.executable, "-m", "alembic", "upgrade", "head"],
-                        capture_output=True,
-                        text=True,
-                        timeout=60,
-                    )
-                    if result.returncode == 0:
-                        logger.info("✅ Database migrations completed")
-                        if result.stdout:
-                            logger.debug(f"Migration output: {result.stdout}")
-                        
-                        # Run seed data script after migrations (async)
-                        logger.info("Seeding initial data...")
-                        try:
-                            # Import and run seed function directly (it's async)
-                            import sys
-                            import importlib.util
-                            seed_script_path = os.path.join(backend_dir, "scripts", "seed_data.py")
-                            if os.path.exists(seed_script_path):
-                                spec = importlib.util.spec_from_file_location("seed_data", seed_script_path)
-                                seed_module = importlib.util.module_from_spec(spec)
-                                sys.modules["seed_data"] = seed_module
-                                spec.loader.exec_module(seed_module)
-                                
-                                # Run the async seed function
-                                await seed_module.seed()
-                                logger.info("✅ Initial data seeded successfully")
-                            else:
-                                logger.warning(f"⚠️ Seed script not found at {seed_script_path}")
-                        except Exception as seed_error:
-                            logger.warning(f"⚠️ Seed data error (continuing anyway): {seed_error}")
-                            import traceback
-                            logger.debug(traceback.format_exc())
-                    else:
-                        logger.error(f"⚠️ Migration failed: {result.stderr}")
-                finally:
-                    os.chdir(original_cwd)
-            else:
-                logger.warning(f"⚠️ alembic.ini not found at {alembic_ini_path}, skipping migrations")
-        except Exception as e:
-            logger.error(f"⚠️ Migration error (continuing anyway): {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+    leader_fd = _try_acquire_leader_lock()
+    if leader_fd is None:
+        logger.info(f"Worker {os.getpid()} is not the leader; skipping background jobs")
+
+    # Engine (and its connection pool) lives for the application lifetime
+    app.state.engine = get_engine()
+    await _warm_up()
+
+    # Partition upkeep is idempotent, so it runs even alongside Celery beat
+    maintenance_task: asyncio.Task | None = None
+    if leader_fd is not None:
+        maintenance_task = asyncio.create_task(partition_maintenance_loop())
 
-    # Start background price fetcher
-    logger.info("Starting price fetcher background task (every 10s)...")
-    price_task = asyncio.create_task(price_fetcher_loop())
+    # Start background price fetcher (unless Celery beat owns the schedule)
+    price_task: asyncio.Task | None = None
+    if leader_fd is not None and settings.price_fetcher_in_process:
+        logger.info("Starting price fetcher background task (every 10s)...")
+        price_task = asyncio.create_task(price_fetcher_loop(get_shared_http_client()))
+    elif not settings.price_fetcher_in_process:
+        logger.info("In-process price fetcher disabled; relying on Celery beat")
 
     yield
 
     # Shutdown
     logger.info("RWA Liquidity Aggregator shutting down...")
-    price_task.cancel()
-    try:
-        await price_task
-    except asyncio.CancelledError:
-        logger.info("Price fetcher task cancelled")
+    if price_task is not None:
+        price_task.cancel()
+        try:
+            await price_task
+        except asyncio.CancelledError:
+            logger.info("Price fetcher task cancelled")
+    if maintenance_task is not None:
+        maintenance_task.cancel()
+        try:
+            await maintenance_task
+        except asyncio.CancelledError:
+            logger.info("Partition maintenance task cancelled")
+    await close_shared_http_client()
+    await close_shared_quote_cache()
+    await app.state.engine.dispose()
+    if leader_fd is not None:
+        os.close(leader_fd)
+    flush_logging()
 
 
 def create_app() -> FastAPI:
@@ -125,13 +218,14 @@ def create_app() -> FastAPI:
         description="Real-time price aggregation for RWA tokens across multiple venues",
         version="0.1.0",
         lifespan=lifespan,
+        default_response_class=UTCORJSONResponse,
         docs_url="/api/docs" if settings.is_development else None,
         redoc_url="/api/redoc" if settings.is_development else None,
     )
 
-    # CORS middleware
+    # CORS middleware (API routes only)
     app.add_middleware(
-        CORSMiddleware,
+        CORSForApi,
         allow_origins=["*"] if settings.is_development else [],
         allow_credentials=True,
         allow_methods=["*"],
@@ -148,13 +242,7 @@ def create_app() -> FastAPI:
     app.include_router(dashboard.router, tags=["Web"])
 
     # Static files (if directory exists)
-    static_dir = os.path.join(
-        os.path.dirname(__file__),
-        "rwa_aggregator",
-        "presentation",
-        "static",
-    )
-    if os.path.isdir(static_dir):
+    if static_dir := _static_dir():
         app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
     return app
@@ -0,0 +1,92 @@
+"""Pre-start jobs: database migrations and seed data.
+
+Runs once per deployment before any web worker serves traffic. Gunicorn
+calls run_prestart() from its on_starting hook in the master process (see
+gunicorn.conf.py); it can also be run by hand:
+
+    cd backend && python -m app.prestart
+"""
+
+import asyncio
+import importlib.util
+import os
+import sys
+import traceback
+
+from alembic import command
+from alembic.config import Config
+
+from app.core.config import get_settings
+from app.core.logging import get_logger, setup_logging
+from app.rwa_aggregator.infrastructure.db.session import dispose_engine
+
+logger = get_logger(__name__)
+
+# Directory containing alembic.ini, scripts/ and the app package
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_migrations() -> None:
+    """Upgrade the database schema to head using the in-process Alembic API."""
+    alembic_ini_path = os.path.join(BACKEND_DIR, "alembic.ini")
+    if not os.path.exists(alembic_ini_path):
+        logger.warning(f"⚠️ alembic.ini not found at {alembic_ini_path}, skipping migrations")
+        return
+
+    logger.info("Running database migrations...")
+    alembic_cfg = Config(alembic_ini_path)
+    # script_location in alembic.ini is relative to the backend directory
+    alembic_cfg.set_main_option(
+        "script_location",
+        os.path.join(BACKEND_DIR, "app", "rwa_aggregator", "infrastructure", "db", "migrations"),
+    )
+    # Keep the application's logging configuration intact
+    alembic_cfg.attributes["configure_logger"] = False
+    command.upgrade(alembic_cfg, "head")
+    logger.info("✅ Database migrations completed")
+
+
+async def seed_initial_data() -> None:
+    """Run scripts/seed_data.py, then release the connections it opened.
+
+    The engine is disposed so a forking caller does not hand the seed's
+    pooled connections to its children.
+    """
+    seed_script_path = os.path.join(BACKEND_DIR, "scripts", "seed_data.py")
+    if not os.path.exists(seed_script_path):
+        logger.warning(f"⚠️ Seed script not found at {seed_script_path}")
+        return
+
+    logger.info("Seeding initial data...")
+    try:
+        spec = importlib.util.spec_from_file_location("seed_data", seed_script_path)
+        seed_module = importlib.util.module_from_spec(spec)
+        sys.modules["seed_data"] = seed_module
+        spec.loader.exec_module(seed_module)
+        await seed_module.seed()
+        logger.info("✅ Initial data seeded successfully")
+    except Exception as e:
+        logger.warning(f"⚠️ Seed data error (continuing anyway): {e}")
+        logger.debug(traceback.format_exc())
+    finally:
+        await dispose_engine()
+
+
+def run_prestart() -> None:
+    """Migrate and seed the database in production; no-op elsewhere.
+
+    A migration failure propagates so the deployment fails instead of
+    serving against an outdated schema.
+    """
+    settings = get_settings()
+    if not settings.is_production:
+        logger.info(f"Skipping pre-start jobs in {settings.app_env}")
+        return
+
+    run_migrations()
+    asyncio.run(seed_initial_data())
+
+
+if __name__ == "__main__":
+    setup_logging()
+    run_prestart()
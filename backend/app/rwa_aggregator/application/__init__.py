@@ -4,53 +4,50 @@ This layer contains:
 - DTOs: Data Transfer Objects for API input/output
 - Use Cases: Application services that orchestrate domain logic
 - Exceptions: Application-level error types
+
+Public names are resolved lazily on first attribute access, so importing
+the package does not pull in every submodule. Prefer importing from the
+submodules directly.
 """
 
-from app.rwa_aggregator.application.dto import (
-    AggregatedPricesDTO,
-    AlertDTO,
-    AlertListDTO,
-    BestPriceDTO,
-    CreateAlertRequest,
-    UpdateAlertRequest,
-    VenuePriceDTO,
-)
-from app.rwa_aggregator.application.exceptions import (
-    AlertAlreadyExistsError,
-    AlertNotFoundError,
-    ApplicationError,
-    InvalidEmailError,
-    NoPriceDataError,
-    TokenNotFoundError,
-    VenueNotFoundError,
-)
-from app.rwa_aggregator.application.use_cases import (
-    CreateAlertUseCase,
-    DeleteAlertUseCase,
-    GetAggregatedPricesUseCase,
-    GetAlertsByEmailUseCase,
-)
+import importlib
+from typing import Any
 
-__all__ = [
+# Public name -> defining submodule
+_LAZY_EXPORTS: dict[str, str] = {
     # DTOs
-    "VenuePriceDTO",
-    "BestPriceDTO",
-    "AggregatedPricesDTO",
-    "CreateAlertRequest",
-    "UpdateAlertRequest",
-    "AlertDTO",
-    "AlertListDTO",
+    "VenuePriceDTO": "app.rwa_aggregator.application.dto",
+    "BestPriceDTO": "app.rwa_aggregator.application.dto",
+    "AggregatedPricesDTO": "app.rwa_aggregator.application.dto",
+    "CreateAlertRequest": "app.rwa_aggregator.application.dto",
+    "CreateAlertsBatchRequest": "app.rwa_aggregator.application.dto",
+    "UpdateAlertRequest": "app.rwa_aggregator.application.dto",
+    "AlertDTO": "app.rwa_aggregator.application.dto",
+    "AlertListDTO": "app.rwa_aggregator.application.dto",
     # Use Cases
-    "GetAggregatedPricesUseCase",
-    "CreateAlertUseCase",
-    "GetAlertsByEmailUseCase",
-    "DeleteAlertUseCase",
+    "GetAggregatedPricesUseCase": "app.rwa_aggregator.application.use_cases",
+    "CreateAlertUseCase": "app.rwa_aggregator.application.use_cases",
+    "CreateAlertsBatchUseCase": "app.rwa_aggregator.application.use_cases",
+    "GetAlertsByEmailUseCase": "app.rwa_aggregator.application.use_cases",
+    "DeleteAlertUseCase": "app.rwa_aggregator.application.use_cases",
     # Exceptions
-    "ApplicationError",
-    "TokenNotFoundError",
-    "VenueNotFoundError",
-    "AlertNotFoundError",
-    "AlertAlreadyExistsError",
-    "InvalidEmailError",
-    "NoPriceDataError",
-]
+    "ApplicationError": "app.rwa_aggregator.application.exceptions",
+    "TokenNotFoundError": "app.rwa_aggregator.application.exceptions",
+    "VenueNotFoundError": "app.rwa_aggregator.application.exceptions",
+    "AlertNotFoundError": "app.rwa_aggregator.application.exceptions",
+    "AlertAlreadyExistsError": "app.rwa_aggregator.application.exceptions",
+    "InvalidEmailError": "app.rwa_aggregator.application.exceptions",
+    "NoPriceDataError": "app.rwa_aggregator.application.exceptions",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
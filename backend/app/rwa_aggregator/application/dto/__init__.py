@@ -4,6 +4,7 @@ from app.rwa_aggregator.application.dto.alert_dto import (
     AlertDTO,
     AlertListDTO,
     CreateAlertRequest,
+    CreateAlertsBatchRequest,
     UpdateAlertRequest,
 )
 from app.rwa_aggregator.application.dto.price_dto import (
@@ -19,6 +20,7 @@ __all__ = [
     "AggregatedPricesDTO",
     # Alert DTOs
     "CreateAlertRequest",
+    "CreateAlertsBatchRequest",
     "UpdateAlertRequest",
     "AlertDTO",
     "AlertListDTO",
@@ -7,12 +7,22 @@ optimized for JSON serialization.
 
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import Annotated, Optional
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, TypeAdapter
 
 from app.rwa_aggregator.domain.entities.alert import AlertStatus, AlertType
 
+# Cheap shape check only; full validation happens once in CreateAlertUseCase
+Email = Annotated[
+    str,
+    StringConstraints(
+        strip_whitespace=True,
+        to_lower=True,
+        pattern=r"^[^@]+@[^@]+\.[^@]+$",
+    ),
+]
+
 
 class CreateAlertRequest(BaseModel):
     """Request payload for creating a new price alert.
@@ -24,7 +34,7 @@ class CreateAlertRequest(BaseModel):
         json_encoders={Decimal: lambda v: float(v)},
     )
 
-    email: EmailStr = Field(description="Email address to receive alert notifications")
+    email: Email = Field(description="Email address to receive alert notifications")
     base_token_symbol: str = Field(description="Base token symbol to monitor (e.g., 'USDY')")
     quote_token_symbol: str = Field(default="USD", description="Quote token symbol (e.g., 'USD')")
     threshold_pct: Decimal = Field(
@@ -44,6 +54,19 @@ class CreateAlertRequest(BaseModel):
     )
 
 
+class CreateAlertsBatchRequest(BaseModel):
+    """Request payload for creating several alerts in one call.
+
+    Used by the bulk import endpoint; all alerts are created or none are.
+    """
+
+    alerts: list[CreateAlertRequest] = Field(
+        min_length=1,
+        max_length=100,
+        description="Alerts to create (1-100)"
+    )
+
+
 class UpdateAlertRequest(BaseModel):
     """Request payload for updating an existing alert.
 
@@ -85,7 +108,7 @@ class AlertDTO(BaseModel):
     )
 
     id: int = Field(description="Unique alert identifier")
-    email: EmailStr = Field(description="Email address receiving notifications")
+    email: Email = Field(description="Email address receiving notifications")
     base_token_symbol: str = Field(description="Base token symbol being monitored")
     base_token_name: str = Field(description="Human-readable base token name")
     quote_token_symbol: str = Field(default="USD", description="Quote token symbol")
@@ -111,3 +134,10 @@ class AlertListDTO(BaseModel):
     total: int = Field(description="Total number of alerts matching the query")
     page: int = Field(default=1, ge=1, description="Current page number")
     page_size: int = Field(default=20, ge=1, le=100, description="Number of alerts per page")
+
+
+# Prebuilt serializers so routes can emit JSON bytes without a
+# response_model re-validation pass
+AlertAdapter = TypeAdapter(AlertDTO)
+AlertBatchAdapter = TypeAdapter(list[AlertDTO])
+AlertListAdapter = TypeAdapter(AlertListDTO)
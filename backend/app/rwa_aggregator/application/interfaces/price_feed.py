@@ -1,13 +1,14 @@
 """Price feed interface for fetching normalized price quotes from external venues."""
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
-from decimal import Decimal
 from typing import Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NormalizedQuote:
     """A normalized price quote from any venue.
 
@@ -25,28 +26,28 @@ class NormalizedQuote:
 
     venue_name: str
     token_symbol: str
-    bid: Decimal
-    ask: Decimal
-    volume_24h: Optional[Decimal]
+    bid: float
+    ask: float
+    volume_24h: Optional[float]
     timestamp: datetime
 
     @property
-    def mid_price(self) -> Decimal:
+    def mid_price(self) -> float:
         """Calculate the mid-market price."""
-        return (self.bid + self.ask) / Decimal("2")
+        return (self.bid + self.ask) * 0.5
 
     @property
-    def spread(self) -> Decimal:
+    def spread(self) -> float:
         """Calculate the absolute spread (ask - bid)."""
         return self.ask - self.bid
 
     @property
-    def spread_bps(self) -> Decimal:
+    def spread_bps(self) -> float:
         """Calculate the spread in basis points relative to mid price."""
         mid = self.mid_price
         if mid == 0:
-            return Decimal("0")
-        return (self.spread / mid) * Decimal("10000")
+            return 0.0
+        return (self.spread / mid) * 10000.0
 
 
 class PriceFeed(ABC):
@@ -75,6 +76,25 @@ class PriceFeed(ABC):
         """
         ...
 
+    async def fetch_quotes(
+        self, token_symbols: Iterable[str]
+    ) -> dict[str, NormalizedQuote]:
+        """Fetch quotes for several tokens from this venue.
+
+        The default issues one fetch_quote per token concurrently. Venues
+        with a multi-symbol endpoint override this to use a single request.
+
+        Args:
+            token_symbols: Normalized token symbols.
+
+        Returns:
+            Mapping of upper-cased token symbol to quote. Tokens without a
+            quote are omitted.
+        """
+        symbols = list({symbol.upper() for symbol in token_symbols})
+        quotes = await asyncio.gather(*(self.fetch_quote(s) for s in symbols))
+        return {s: q for s, q in zip(symbols, quotes, strict=True) if q is not None}
+
     @abstractmethod
     def supports_token(self, token_symbol: str) -> bool:
         """Check if this feed supports the given token.
@@ -1,6 +1,7 @@
 """Application use cases for orchestrating domain logic."""
 
 from app.rwa_aggregator.application.use_cases.create_alert import (
+    CreateAlertsBatchUseCase,
     CreateAlertUseCase,
     DeleteAlertUseCase,
     GetAlertsByEmailUseCase,
@@ -12,6 +13,7 @@ from app.rwa_aggregator.application.use_cases.get_aggregated_prices import (
 __all__ = [
     "GetAggregatedPricesUseCase",
     "CreateAlertUseCase",
+    "CreateAlertsBatchUseCase",
     "GetAlertsByEmailUseCase",
     "DeleteAlertUseCase",
 ]
@@ -6,21 +6,130 @@ Implements alert creation by orchestrating:
 - Alert persistence via AlertRepository
 """
 
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
 
+from email_validator import EmailNotValidError, validate_email
+
 from app.rwa_aggregator.application.dto.alert_dto import AlertDTO, CreateAlertRequest
 from app.rwa_aggregator.application.exceptions import (
     InvalidEmailError,
     TokenNotFoundError,
     TokenNotTradableError,
 )
-from app.rwa_aggregator.domain.entities.alert import Alert, AlertStatus, AlertType
-from app.rwa_aggregator.domain.entities.token import MarketType
+from app.rwa_aggregator.domain.entities.alert import Alert, AlertStatus
+from app.rwa_aggregator.domain.entities.token import Token
 from app.rwa_aggregator.domain.repositories.alert_repository import AlertRepository
 from app.rwa_aggregator.domain.repositories.token_repository import TokenRepository
 from app.rwa_aggregator.domain.value_objects.email_address import EmailAddress
 
 
+@lru_cache(maxsize=4096)
+def _deep_validate_email(email: str) -> str:
+    """Fully validate an email address, memoizing successful results.
+
+    Args:
+        email: Email address that already passed the DTO shape check.
+
+    Returns:
+        The normalized email address.
+
+    Raises:
+        EmailNotValidError: If the address is not valid.
+    """
+    return validate_email(email, check_deliverability=False).normalized
+
+
+def _validated_email(raw_email: str) -> EmailAddress:
+    """Fully validate a requested email address.
+
+    Args:
+        raw_email: Email address from the request DTO.
+
+    Returns:
+        The normalized EmailAddress.
+
+    Raises:
+        InvalidEmailError: If the address is not valid.
+    """
+    try:
+        return EmailAddress(_deep_validate_email(raw_email))
+    except (EmailNotValidError, ValueError) as e:
+        raise InvalidEmailError(raw_email) from e
+
+
+def _build_alert(
+    request: CreateAlertRequest,
+    email_address: EmailAddress,
+    token: Optional[Token],
+) -> tuple[Alert, Token]:
+    """Build a new active Alert for a request, checking its token.
+
+    Args:
+        request: The alert creation request.
+        email_address: The request's validated email address.
+        token: The token resolved for request.base_token_symbol, if any.
+
+    Returns:
+        The unsaved Alert entity and its (now known to exist) token.
+
+    Raises:
+        TokenNotFoundError: If the base token symbol is not recognized.
+        TokenNotTradableError: If the token is NAV-only (no active trading pairs).
+    """
+    if token is None or token.id is None:
+        raise TokenNotFoundError(request.base_token_symbol)
+
+    # NAV-only tokens don't have bid/ask spreads, so alerts don't make sense
+    if token.is_nav_only:
+        raise TokenNotTradableError(request.base_token_symbol)
+
+    alert = Alert(
+        id=None,  # Will be assigned by the database
+        email=email_address,
+        token_id=token.id,
+        threshold_pct=request.threshold_pct,
+        alert_type=request.alert_type,
+        status=AlertStatus.ACTIVE,
+        cooldown_hours=request.cooldown_hours,
+    )
+    return alert, token
+
+
+def _build_alert_dto(
+    alert: Alert,
+    token_symbol: str,
+    token_name: str,
+    quote_symbol: str,
+) -> AlertDTO:
+    """Build AlertDTO from Alert entity and token info.
+
+    Args:
+        alert: The saved Alert entity.
+        token_symbol: Base token symbol.
+        token_name: Human-readable token name.
+        quote_symbol: Quote token symbol.
+
+    Returns:
+        AlertDTO with all alert information.
+    """
+    return AlertDTO(
+        id=alert.id,  # type: ignore[arg-type]
+        email=alert.email.value,
+        base_token_symbol=token_symbol,
+        base_token_name=token_name,
+        quote_token_symbol=quote_symbol,
+        threshold_pct=alert.threshold_pct,
+        alert_type=alert.alert_type,
+        status=alert.status,
+        cooldown_hours=alert.cooldown_hours,
+        last_triggered_at=alert.last_triggered_at,
+        created_at=alert.created_at,
+        can_trigger=alert.can_trigger(),
+    )
+
+
 class CreateAlertUseCase:
     """Application service for creating price alert subscriptions.
 
@@ -57,77 +166,95 @@ class CreateAlertUseCase:
             TokenNotTradableError: If the token is NAV-only (no active trading pairs).
             InvalidEmailError: If the email address is invalid.
         """
-        # 1. Validate and fetch the token
-        token = await self._token_repository.get_by_symbol(request.base_token_symbol)
-        if token is None or token.id is None:
-            raise TokenNotFoundError(request.base_token_symbol)
-
-        # 2. Check that token is tradable (has active trading pairs)
-        # NAV-only tokens don't have bid/ask spreads, so alerts don't make sense
-        if token.market_type == MarketType.NAV_ONLY:
-            raise TokenNotTradableError(request.base_token_symbol)
-
-        # 3. Validate email using domain value object
-        try:
-            email_address = EmailAddress(request.email)
-        except ValueError as e:
-            raise InvalidEmailError(request.email) from e
-
-        # 4. Create the Alert domain entity
-        alert = Alert(
-            id=None,  # Will be assigned by the database
-            email=email_address,
-            token_id=token.id,
-            threshold_pct=request.threshold_pct,
-            alert_type=request.alert_type,
-            status=AlertStatus.ACTIVE,
-            cooldown_hours=request.cooldown_hours,
+        # 1. Validate email first: a bad address fails without a DB round-trip
+        email_address = _validated_email(request.email)
+
+        # 2. Fetch the token and build the Alert, checking it is tradable
+        alert, token = _build_alert(
+            request,
+            email_address,
+            await self._token_repository.get_by_symbol(request.base_token_symbol),
         )
 
-        # 5. Persist the alert
+        # 3. Persist the alert
         saved_alert = await self._alert_repository.save(alert)
 
-        # 6. Build and return the DTO
-        return self._build_alert_dto(
+        # 4. Build and return the DTO
+        return _build_alert_dto(
             alert=saved_alert,
             token_symbol=request.base_token_symbol,
             token_name=token.name,
             quote_symbol=request.quote_token_symbol,
         )
 
-    def _build_alert_dto(
+
+class CreateAlertsBatchUseCase:
+    """Application service for creating many alert subscriptions at once.
+
+    Applies the same rules as CreateAlertUseCase, but resolves every token
+    in one lookup and persists all alerts in one insert. The batch is
+    all-or-nothing: the first invalid request aborts it before anything
+    is saved.
+    """
+
+    def __init__(
         self,
-        alert: Alert,
-        token_symbol: str,
-        token_name: str,
-        quote_symbol: str,
-    ) -> AlertDTO:
-        """Build AlertDTO from Alert entity and token info.
+        token_repository: TokenRepository,
+        alert_repository: AlertRepository,
+    ) -> None:
+        """Initialize the use case with required dependencies.
+
+        Args:
+            token_repository: Repository for token data access.
+            alert_repository: Repository for alert persistence.
+        """
+        self._token_repository = token_repository
+        self._alert_repository = alert_repository
+
+    async def execute(self, requests: list[CreateAlertRequest]) -> list[AlertDTO]:
+        """Execute the batch alert creation.
 
         Args:
-            alert: The saved Alert entity.
-            token_symbol: Base token symbol.
-            token_name: Human-readable token name.
-            quote_symbol: Quote token symbol.
+            requests: CreateAlertRequest items to create.
 
         Returns:
-            AlertDTO with all alert information.
+            AlertDTOs for the created alerts, in request order.
+
+        Raises:
+            InvalidEmailError: If any email address is invalid.
+            TokenNotFoundError: If any base token symbol is not recognized.
+            TokenNotTradableError: If any token is NAV-only.
         """
-        return AlertDTO(
-            id=alert.id,  # type: ignore[arg-type]
-            email=alert.email.value,
-            base_token_symbol=token_symbol,
-            base_token_name=token_name,
-            quote_token_symbol=quote_symbol,
-            threshold_pct=alert.threshold_pct,
-            alert_type=alert.alert_type,
-            status=alert.status,
-            cooldown_hours=alert.cooldown_hours,
-            last_triggered_at=alert.last_triggered_at,
-            created_at=alert.created_at,
-            can_trigger=alert.can_trigger(),
+        if not requests:
+            return []
+
+        # 1. Validate every email before touching the database
+        emails = [_validated_email(request.email) for request in requests]
+
+        # 2. Resolve all referenced tokens in one lookup
+        tokens = await self._token_repository.get_by_symbols(
+            {r.base_token_symbol for r in requests}
         )
 
+        # 3. Build Alert entities, checking each token is tradable
+        built = [
+            _build_alert(request, email_address, tokens.get(request.base_token_symbol.upper()))
+            for request, email_address in zip(requests, emails, strict=True)
+        ]
+
+        # 4. Persist all alerts in a single insert
+        saved_alerts = await self._alert_repository.save_many([alert for alert, _ in built])
+
+        return [
+            _build_alert_dto(
+                alert=saved,
+                token_symbol=request.base_token_symbol,
+                token_name=token.name,
+                quote_symbol=request.quote_token_symbol,
+            )
+            for saved, request, (_, token) in zip(saved_alerts, requests, built, strict=True)
+        ]
+
 
 class GetAlertsByEmailUseCase:
     """Application service for retrieving alerts by email address.
@@ -164,20 +291,17 @@ class GetAlertsByEmailUseCase:
         if not alerts:
             return []
 
-        # Build a cache of token info for efficiency
-        token_cache: dict[int, tuple[str, str]] = {}
+        # Load every referenced token in one query
+        tokens = await self._token_repository.get_by_ids({a.token_id for a in alerts})
 
+        now = datetime.now(timezone.utc)
         alert_dtos: list[AlertDTO] = []
         for alert in alerts:
-            # Get token info (cached)
-            if alert.token_id not in token_cache:
-                token = await self._token_repository.get_by_id(alert.token_id)
-                if token:
-                    token_cache[alert.token_id] = (token.symbol, token.name)
-                else:
-                    token_cache[alert.token_id] = (f"Token {alert.token_id}", "Unknown Token")
-
-            token_symbol, token_name = token_cache[alert.token_id]
+            token = tokens.get(alert.token_id)
+            if token:
+                token_symbol, token_name = token.symbol, token.name
+            else:
+                token_symbol, token_name = f"Token {alert.token_id}", "Unknown Token"
 
             alert_dtos.append(
                 AlertDTO(
@@ -192,7 +316,7 @@ class GetAlertsByEmailUseCase:
                     cooldown_hours=alert.cooldown_hours,
                     last_triggered_at=alert.last_triggered_at,
                     created_at=alert.created_at,
-                    can_trigger=alert.can_trigger(),
+                    can_trigger=alert.can_trigger(now=now),
                 )
             )
 
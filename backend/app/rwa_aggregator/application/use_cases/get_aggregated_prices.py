@@ -7,8 +7,9 @@ Implements the main dashboard data retrieval by orchestrating:
 - Best price calculation via PriceCalculator domain service
 """
 
-from datetime import datetime, timezone
-from decimal import Decimal
+import heapq
+from datetime import datetime, timedelta, timezone
+from operator import attrgetter
 from typing import Optional
 
 from app.rwa_aggregator.application.dto.price_dto import (
@@ -27,6 +28,14 @@ from app.rwa_aggregator.domain.repositories.token_repository import TokenReposit
 from app.rwa_aggregator.domain.repositories.venue_repository import VenueRepository
 from app.rwa_aggregator.domain.services.price_calculator import BestPrices, PriceCalculator
 
+_BID = attrgetter("bid")
+
+
+def _venue_name(venue_id: int, venues_by_id: dict[int, Venue]) -> str:
+    """Resolve a venue's display name, falling back to its ID if unknown."""
+    venue = venues_by_id.get(venue_id)
+    return venue.name if venue is not None else f"Venue {venue_id}"
+
 
 class GetAggregatedPricesUseCase:
     """Application service for retrieving aggregated price data.
@@ -65,6 +74,7 @@ class GetAggregatedPricesUseCase:
         base_symbol: str,
         quote_symbol: str = "USD",
         include_stale: bool = True,
+        top_k: Optional[int] = None,
     ) -> AggregatedPricesDTO:
         """Execute the aggregated prices retrieval.
 
@@ -72,6 +82,8 @@ class GetAggregatedPricesUseCase:
             base_symbol: The base token symbol (e.g., "USDY").
             quote_symbol: The quote token symbol (default "USD").
             include_stale: Whether to include stale venues in the response.
+            top_k: If set, return only the top_k venues by bid. Venue counts
+                still cover every venue.
 
         Returns:
             AggregatedPricesDTO with best prices and per-venue breakdown.
@@ -91,25 +103,49 @@ class GetAggregatedPricesUseCase:
         if not snapshots:
             raise NoPriceDataError(base_symbol)
 
-        # 3. Load venue metadata for all venues with price data
-        venue_ids = {s.venue_id for s in snapshots}
-        venues_by_id: dict[int, Venue] = {}
-        for venue_id in venue_ids:
-            venue = await self._venue_repository.get_by_id(venue_id)
-            if venue:
-                venues_by_id[venue_id] = venue
+        # 3. Load venue metadata for all venues with price data (one query)
+        venues_by_id = await self._venue_repository.get_by_ids(
+            {s.venue_id for s in snapshots}
+        )
 
         # 4. Calculate best prices using the domain service
-        best_prices = self._price_calculator.calculate_best_prices(snapshots)
+        #    (one clock read shared by every staleness check below)
+        now = datetime.now(timezone.utc)
+        stale_before = now - timedelta(seconds=self._max_staleness_seconds)
+        best_prices = self._price_calculator.calculate_best_prices(snapshots, now=now)
 
-        # 5. Build venue price DTOs
-        venue_dtos = self._build_venue_dtos(
-            snapshots=snapshots,
-            venues_by_id=venues_by_id,
-            base_symbol=base_symbol,
-            quote_symbol=quote_symbol,
-            include_stale=include_stale,
-        )
+        # 5. Build venue DTOs, track the latest update and count fresh venues
+        #    in a single pass
+        venue_dtos: list[VenuePriceDTO] = []
+        last_updated = snapshots[0].fetched_at
+        num_fresh = 0
+
+        for snapshot in snapshots:
+            if snapshot.fetched_at > last_updated:
+                last_updated = snapshot.fetched_at
+
+            is_stale = snapshot.fetched_at < stale_before
+            if not is_stale:
+                num_fresh += 1
+            elif not include_stale:
+                continue
+
+            venue_dtos.append(
+                self._build_venue_dto(
+                    snapshot=snapshot,
+                    venue=venues_by_id.get(snapshot.venue_id),
+                    base_symbol=base_symbol,
+                    quote_symbol=quote_symbol,
+                    is_stale=is_stale,
+                )
+            )
+
+        # Sort by bid price (highest first) for best execution visibility
+        num_venues = len(venue_dtos)
+        if top_k is not None:
+            venue_dtos = heapq.nlargest(top_k, venue_dtos, key=_BID)
+        else:
+            venue_dtos.sort(key=_BID, reverse=True)
 
         # 6. Build best price DTO
         best_price_dto = self._build_best_price_dto(
@@ -119,85 +155,66 @@ class GetAggregatedPricesUseCase:
             quote_symbol=quote_symbol,
         )
 
-        # 7. Determine the most recent update timestamp
-        last_updated = max(s.fetched_at for s in snapshots)
-
-        # 8. Count fresh venues
-        num_fresh = sum(
-            1 for s in snapshots
-            if not s.is_stale(self._max_staleness_seconds)
-        )
-
         return AggregatedPricesDTO(
             base_token_symbol=base_symbol,
             base_token_name=token.name,
             quote_token_symbol=quote_symbol,
             best_prices=best_price_dto,
             venues=venue_dtos,
-            num_venues=len(venue_dtos),
+            num_venues=num_venues,
             num_fresh_venues=num_fresh,
             last_updated=last_updated,
         )
 
-    def _build_venue_dtos(
+    def _build_venue_dto(
         self,
-        snapshots: list[PriceSnapshot],
-        venues_by_id: dict[int, Venue],
+        snapshot: PriceSnapshot,
+        venue: Optional[Venue],
         base_symbol: str,
         quote_symbol: str,
-        include_stale: bool,
-    ) -> list[VenuePriceDTO]:
-        """Build VenuePriceDTO list from snapshots and venue metadata.
+        is_stale: bool,
+    ) -> VenuePriceDTO:
+        """Build a VenuePriceDTO from a snapshot and its venue metadata.
 
         Args:
-            snapshots: List of price snapshots.
-            venues_by_id: Mapping of venue ID to Venue entity.
+            snapshot: The venue's latest price snapshot.
+            venue: The venue entity, or None if it could not be loaded.
             base_symbol: Base token symbol.
             quote_symbol: Quote token symbol.
-            include_stale: Whether to include stale snapshots.
+            is_stale: Whether the snapshot is past the staleness threshold.
 
         Returns:
-            List of VenuePriceDTO objects sorted by bid (highest first).
+            VenuePriceDTO with spread metrics for the snapshot.
         """
-        venue_dtos: list[VenuePriceDTO] = []
-
-        for snapshot in snapshots:
-            is_stale = snapshot.is_stale(self._max_staleness_seconds)
-
-            # Skip stale if not requested
-            if is_stale and not include_stale:
-                continue
-
-            venue = venues_by_id.get(snapshot.venue_id)
-            venue_name = venue.name if venue else f"Venue {snapshot.venue_id}"
-            trade_url = venue.get_trade_url(base_symbol) if venue else None
-
-            # Calculate spread metrics
-            mid_price = snapshot.mid
-            spread = snapshot.ask - snapshot.bid
-            spread_bps = (spread / mid_price * Decimal("10000")) if mid_price > 0 else Decimal("0")
-
-            venue_dtos.append(
-                VenuePriceDTO(
-                    venue_name=venue_name,
-                    venue_id=snapshot.venue_id,
-                    base_token_symbol=base_symbol,
-                    quote_token_symbol=quote_symbol,
-                    bid=snapshot.bid,
-                    ask=snapshot.ask,
-                    mid_price=mid_price,
-                    spread=spread,
-                    spread_bps=spread_bps.quantize(Decimal("0.01")),
-                    volume_24h=snapshot.volume_24h,
-                    timestamp=snapshot.fetched_at,
-                    is_stale=is_stale,
-                    trade_url=trade_url,
-                )
-            )
-
-        # Sort by bid price (highest first) for best execution visibility
-        venue_dtos.sort(key=lambda v: v.bid, reverse=True)
-        return venue_dtos
+        if venue is not None:
+            venue_name = venue.name
+            trade_url = venue.get_trade_url(base_symbol)
+        else:
+            venue_name = f"Venue {snapshot.venue_id}"
+            trade_url = None
+
+        # Calculate spread metrics (floats from here on: API output only)
+        bid = float(snapshot.bid)
+        ask = float(snapshot.ask)
+        mid_price = (bid + ask) * 0.5
+        spread = ask - bid
+        spread_bps = (spread / mid_price * 10000.0) if mid_price > 0 else 0.0
+
+        return VenuePriceDTO(
+            venue_name=venue_name,
+            venue_id=snapshot.venue_id,
+            base_token_symbol=base_symbol,
+            quote_token_symbol=quote_symbol,
+            bid=bid,
+            ask=ask,
+            mid_price=mid_price,
+            spread=spread,
+            spread_bps=round(spread_bps, 2),
+            volume_24h=float(snapshot.volume_24h) if snapshot.volume_24h is not None else None,
+            timestamp=snapshot.fetched_at,
+            is_stale=is_stale,
+            trade_url=trade_url,
+        )
 
     def _build_best_price_dto(
         self,
@@ -217,46 +234,25 @@ class GetAggregatedPricesUseCase:
         Returns:
             BestPriceDTO with best bid/ask information.
         """
-        # Extract best bid venue info
-        best_bid_venue: Optional[str] = None
-        best_bid_venue_id: Optional[int] = None
-        best_bid_price: Optional[Decimal] = None
-
-        if best_prices.best_bid:
-            best_bid_price = best_prices.best_bid.bid
-            best_bid_venue_id = best_prices.best_bid.venue_id
-            venue = venues_by_id.get(best_prices.best_bid.venue_id)
-            best_bid_venue = venue.name if venue else f"Venue {best_bid_venue_id}"
-
-        # Extract best ask venue info
-        best_ask_venue: Optional[str] = None
-        best_ask_venue_id: Optional[int] = None
-        best_ask_price: Optional[Decimal] = None
-
-        if best_prices.best_ask:
-            best_ask_price = best_prices.best_ask.ask
-            best_ask_venue_id = best_prices.best_ask.venue_id
-            venue = venues_by_id.get(best_prices.best_ask.venue_id)
-            best_ask_venue = venue.name if venue else f"Venue {best_ask_venue_id}"
-
-        # Calculate effective spread in basis points
-        effective_spread_pct: Optional[Decimal] = None
-        effective_spread_bps: Optional[Decimal] = None
-
-        if best_prices.effective_spread:
-            effective_spread_pct = best_prices.effective_spread.percentage
-            # Convert percentage to basis points (1% = 100 bps)
-            effective_spread_bps = effective_spread_pct * Decimal("100")
+        best_bid = best_prices.best_bid
+        best_ask = best_prices.best_ask
+        spread = best_prices.effective_spread
 
+        # The calculator sets all three together, or none when no venue is fresh
+        if best_bid is None or best_ask is None or spread is None:
+            return BestPriceDTO(base_token_symbol=base_symbol, quote_token_symbol=quote_symbol)
+
+        effective_spread_pct = float(spread.percentage)
         return BestPriceDTO(
             base_token_symbol=base_symbol,
             quote_token_symbol=quote_symbol,
-            best_bid_venue=best_bid_venue,
-            best_bid_venue_id=best_bid_venue_id,
-            best_bid_price=best_bid_price,
-            best_ask_venue=best_ask_venue,
-            best_ask_venue_id=best_ask_venue_id,
-            best_ask_price=best_ask_price,
+            best_bid_venue=_venue_name(best_bid.venue_id, venues_by_id),
+            best_bid_venue_id=best_bid.venue_id,
+            best_bid_price=float(best_bid.bid),
+            best_ask_venue=_venue_name(best_ask.venue_id, venues_by_id),
+            best_ask_venue_id=best_ask.venue_id,
+            best_ask_price=float(best_ask.ask),
             effective_spread_pct=effective_spread_pct,
-            effective_spread_bps=effective_spread_bps,
+            # Convert percentage to basis points (1% = 100 bps)
+            effective_spread_bps=round(effective_spread_pct * 100.0, 2),
         )
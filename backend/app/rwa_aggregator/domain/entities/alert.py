@@ -3,20 +3,23 @@
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from enum import Enum
+from enum import StrEnum
 from typing import Optional
 
 from app.rwa_aggregator.domain.value_objects.email_address import EmailAddress
 
+# Cooldown lengths are a handful of whole hours; build each timedelta once
+_COOLDOWN_DELTAS: dict[int, timedelta] = {}
 
-class AlertType(Enum):
+
+class AlertType(StrEnum):
     """Types of price alerts."""
 
     SPREAD_BELOW = "spread_below"
     DAILY_SUMMARY = "daily_summary"
 
 
-class AlertStatus(Enum):
+class AlertStatus(StrEnum):
     """Status of an alert subscription."""
 
     ACTIVE = "active"
@@ -24,7 +27,7 @@ class AlertStatus(Enum):
     DELETED = "deleted"
 
 
-@dataclass
+@dataclass(slots=True)
 class Alert:
     """Domain entity representing a user's alert configuration.
 
@@ -50,11 +53,14 @@ class Alert:
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     cooldown_hours: int = 1
 
-    def can_trigger(self) -> bool:
+    def can_trigger(self, *, now: Optional[datetime] = None) -> bool:
         """Check if the alert is eligible to trigger.
 
         Must be active and past the cooldown period since last trigger.
 
+        Args:
+            now: Current UTC time. Defaults to the current time.
+
         Returns:
             True if the alert can trigger.
         """
@@ -64,8 +70,15 @@ class Alert:
         if self.last_triggered_at is None:
             return True
 
-        cooldown_end = self.last_triggered_at + timedelta(hours=self.cooldown_hours)
-        return datetime.now(timezone.utc) > cooldown_end
+        if now is None:
+            now = datetime.now(timezone.utc)
+        cooldown = _COOLDOWN_DELTAS.get(self.cooldown_hours)
+        if cooldown is None:
+            cooldown = _COOLDOWN_DELTAS.setdefault(
+                self.cooldown_hours, timedelta(hours=self.cooldown_hours)
+            )
+        cooldown_end = self.last_triggered_at + cooldown
+        return now > cooldown_end
 
     def mark_triggered(self) -> None:
         """Update the last triggered timestamp to now."""
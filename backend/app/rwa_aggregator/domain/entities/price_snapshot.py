@@ -7,8 +7,10 @@ from typing import Optional
 
 from app.rwa_aggregator.domain.value_objects.spread import Spread
 
+_TWO = Decimal(2)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class PriceSnapshot:
     """Domain entity representing a price observation from a specific venue.
 
@@ -20,6 +22,7 @@ class PriceSnapshot:
         ask: Best ask price.
         volume_24h: 24-hour trading volume (optional).
         fetched_at: UTC timestamp when the price was fetched.
+        mid: Mid price, computed once from bid and ask at construction.
     """
 
     id: Optional[int]
@@ -29,25 +32,32 @@ class PriceSnapshot:
     ask: Decimal
     volume_24h: Optional[Decimal] = None
     fetched_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    mid: Decimal = field(init=False, repr=False, compare=False)
 
-    @property
-    def mid(self) -> Decimal:
-        """Calculate mid price from bid and ask."""
-        return (self.bid + self.ask) / 2
+    def __post_init__(self) -> None:
+        """Precompute the mid price (the dataclass is frozen)."""
+        object.__setattr__(self, "mid", (self.bid + self.ask) / _TWO)
 
     @property
     def spread(self) -> Spread:
         """Calculate spread value object from bid and ask."""
         return Spread.calculate(self.bid, self.ask)
 
-    def is_stale(self, max_age_seconds: int = 60) -> bool:
+    def is_stale(
+        self, max_age_seconds: int = 60, *, now: Optional[datetime] = None
+    ) -> bool:
         """Check if the price snapshot is considered stale.
 
         Args:
             max_age_seconds: Maximum age in seconds before considered stale.
+            now: Current UTC time. Pass it when checking many snapshots so
+                the clock is read once; defaults to the current time. Bulk
+                callers can go further and compare fetched_at against a
+                precomputed cutoff, as PriceCalculator does.
 
         Returns:
             True if the snapshot is older than max_age_seconds.
         """
-        age = (datetime.now(timezone.utc) - self.fetched_at).total_seconds()
-        return age > max_age_seconds
+        if now is None:
+            now = datetime.now(timezone.utc)
+        return (now - self.fetched_at).total_seconds() > max_age_seconds
@@ -1,11 +1,11 @@
 """Token entity representing an RWA token being tracked."""
 
 from dataclasses import dataclass
-from enum import Enum
+from enum import StrEnum
 from typing import Optional
 
 
-class TokenCategory(Enum):
+class TokenCategory(StrEnum):
     """Categories for RWA tokens matching dashboard filters."""
 
     TBILL = "tbill"
@@ -14,7 +14,7 @@ class TokenCategory(Enum):
     EQUITY = "equity"
 
 
-class MarketType(Enum):
+class MarketType(StrEnum):
     """Market type indicating whether a token has active trading pairs.
 
     This enum drives several behavioral branches across the application:
@@ -43,7 +43,7 @@ class MarketType(Enum):
     NAV_ONLY = "nav_only"
 
 
-@dataclass
+@dataclass(slots=True)
 class Token:
     """Domain entity representing a tokenized Real-World Asset.
 
@@ -85,7 +85,7 @@ class Token:
             True if market_type is TRADABLE, meaning bid/ask/spread
             data can be fetched and alerts can be configured.
         """
-        return self.market_type == MarketType.TRADABLE
+        return self.market_type is MarketType.TRADABLE
 
     @property
     def is_nav_only(self) -> bool:
@@ -95,4 +95,4 @@ class Token:
             True if market_type is NAV_ONLY, meaning only metadata
             like issuer, category, chain should be displayed.
         """
-        return self.market_type == MarketType.NAV_ONLY
+        return self.market_type is MarketType.NAV_ONLY
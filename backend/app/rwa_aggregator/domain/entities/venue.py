@@ -1,11 +1,12 @@
 """Venue entity representing a trading platform or exchange."""
 
 from dataclasses import dataclass
-from enum import Enum
+from enum import StrEnum
+from functools import lru_cache
 from typing import Optional
 
 
-class VenueType(Enum):
+class VenueType(StrEnum):
     """Types of trading venues."""
 
     CEX = "cex"
@@ -13,7 +14,7 @@ class VenueType(Enum):
     ISSUER = "issuer"
 
 
-class ApiType(Enum):
+class ApiType(StrEnum):
     """Types of APIs used to fetch price data."""
 
     REST = "rest"
@@ -21,7 +22,24 @@ class ApiType(Enum):
     SUBGRAPH = "subgraph"
 
 
-@dataclass
+@lru_cache(maxsize=128)
+def _split_trade_url_template(template: str) -> Optional[tuple[str, str]]:
+    """Split a trade URL template around its placeholder.
+
+    Args:
+        template: Template containing a {symbol} placeholder.
+
+    Returns:
+        The (prefix, suffix) around a single bare placeholder, or None if
+        the template needs str.format() to render.
+    """
+    parts = template.split("{symbol}")
+    if len(parts) == 2 and not any("{" in p or "}" in p for p in parts):
+        return (parts[0], parts[1])
+    return None
+
+
+@dataclass(slots=True)
 class Venue:
     """Domain entity representing a price source venue.
 
@@ -52,9 +70,14 @@ class Venue:
         Returns:
             The formatted trade URL, or None if no template is configured.
         """
-        if self.trade_url_template:
-            return self.trade_url_template.format(symbol=token_symbol)
-        return None
+        if not self.trade_url_template:
+            return None
+        # Keyed on the current template, so reassigning it is picked up
+        url_parts = _split_trade_url_template(self.trade_url_template)
+        if url_parts is not None:
+            prefix, suffix = url_parts
+            return prefix + token_symbol + suffix
+        return self.trade_url_template.format(symbol=token_symbol)
 
     def deactivate(self) -> None:
         """Mark the venue as inactive (stop polling)."""
@@ -3,7 +3,7 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
-from ..entities.alert import Alert, AlertStatus
+from ..entities.alert import Alert
 
 
 class AlertRepository(ABC):
@@ -80,6 +80,18 @@ class AlertRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def save_many(self, alerts: List[Alert]) -> List[Alert]:
+        """Persist several new alert entities in one operation.
+
+        Args:
+            alerts: New Alert entities (id is None) to insert.
+
+        Returns:
+            The saved Alert entities with IDs populated, in input order.
+        """
+        pass
+
     @abstractmethod
     async def delete(self, alert_id: int) -> bool:
         """Delete an alert by its ID.
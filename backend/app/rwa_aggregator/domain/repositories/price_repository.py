@@ -72,6 +72,21 @@ class PriceRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def bulk_insert(self, snapshots: List[PriceSnapshot]) -> int:
+        """Insert many new price snapshots without reading them back.
+
+        Faster than save_batch for ingestion, where callers only need to
+        know how many rows were written.
+
+        Args:
+            snapshots: New PriceSnapshot entities (IDs are ignored).
+
+        Returns:
+            Number of snapshots inserted.
+        """
+        pass
+
     @abstractmethod
     async def get_history(
         self,
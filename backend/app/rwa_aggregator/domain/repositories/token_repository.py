@@ -1,7 +1,7 @@
 """Abstract repository interface for Token entities."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from ..entities.token import Token, TokenCategory
 
@@ -26,6 +26,19 @@ class TokenRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, token_ids: Iterable[int]) -> Dict[int, Token]:
+        """Retrieve several tokens by ID in a single lookup.
+
+        Args:
+            token_ids: The unique identifiers of the tokens.
+
+        Returns:
+            Mapping of token ID to Token entity. IDs that do not exist
+            are omitted.
+        """
+        pass
+
     @abstractmethod
     async def get_by_symbol(self, symbol: str) -> Optional[Token]:
         """Retrieve a token by its ticker symbol.
@@ -38,6 +51,19 @@ class TokenRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_by_symbols(self, symbols: Iterable[str]) -> Dict[str, Token]:
+        """Retrieve several tokens by ticker symbol in a single lookup.
+
+        Args:
+            symbols: The token symbols (case-insensitive).
+
+        Returns:
+            Mapping of upper-case symbol to Token entity. Symbols that do
+            not exist are omitted.
+        """
+        pass
+
     @abstractmethod
     async def get_all_active(self) -> List[Token]:
         """Retrieve all tokens that are currently active.
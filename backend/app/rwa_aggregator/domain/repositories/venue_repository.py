@@ -1,7 +1,7 @@
 """Abstract repository interface for Venue entities."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from ..entities.venue import Venue
 
@@ -26,6 +26,19 @@ class VenueRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, venue_ids: Iterable[int]) -> Dict[int, Venue]:
+        """Retrieve several venues by ID in a single lookup.
+
+        Args:
+            venue_ids: The unique identifiers of the venues.
+
+        Returns:
+            Mapping of venue ID to Venue entity. IDs that do not exist
+            are omitted.
+        """
+        pass
+
     @abstractmethod
     async def get_by_name(self, name: str) -> Optional[Venue]:
         """Retrieve a venue by its display name.
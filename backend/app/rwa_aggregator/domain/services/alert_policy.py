@@ -5,7 +5,8 @@ Implements F-003: Alert System rules from the MVP specification.
 - F-003.4: Enforce cooldown between alerts (delegated to Alert entity)
 """
 
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Iterable, Optional
 
 from app.rwa_aggregator.domain.entities.alert import Alert
 from app.rwa_aggregator.domain.value_objects.spread import Spread
@@ -28,6 +29,7 @@ class AlertPolicy:
         alert: Alert,
         current_spread: Spread,
         previous_spread: Optional[Spread],
+        now: Optional[datetime] = None,
     ) -> bool:
         """Determine if an alert should trigger based on spread conditions.
 
@@ -41,12 +43,14 @@ class AlertPolicy:
             alert: The alert configuration to evaluate.
             current_spread: The current effective spread.
             previous_spread: The previous effective spread, or None for first evaluation.
+            now: Current UTC time for the cooldown check. Defaults to the
+                current time.
 
         Returns:
             True if the alert should trigger, False otherwise.
         """
         # Check alert eligibility (enforces active status + cooldown per F-003.4)
-        if not alert.can_trigger():
+        if not alert.can_trigger(now=now):
             return False
 
         threshold = alert.threshold_pct
@@ -63,3 +67,46 @@ class AlertPolicy:
         was_at_or_above = not previous_spread.is_below_threshold(threshold)
 
         return is_below_now and was_at_or_above
+
+    def evaluate_batch(
+        self,
+        alerts: Iterable[Alert],
+        current_by_token: dict[int, Spread],
+        previous_by_token: Optional[dict[int, Spread]] = None,
+        now: Optional[datetime] = None,
+    ) -> list[Alert]:
+        """Select the alerts that should trigger from a batch.
+
+        Applies the same rules as should_trigger to every alert, sharing one
+        clock reading for the cooldown checks. Alerts whose token has no
+        current spread are skipped.
+
+        Args:
+            alerts: Alerts to evaluate.
+            current_by_token: Current effective spread keyed by token ID.
+            previous_by_token: Previous effective spread keyed by token ID.
+                Tokens without an entry are treated as first evaluations.
+            now: Current UTC time for the cooldown checks. Defaults to the
+                current time.
+
+        Returns:
+            Alerts that should trigger, in input order.
+        """
+        if now is None:
+            now = datetime.now(timezone.utc)
+        if previous_by_token is None:
+            previous_by_token = {}
+
+        triggered: list[Alert] = []
+        for alert in alerts:
+            current_spread = current_by_token.get(alert.token_id)
+            if current_spread is None:
+                continue
+            if self.should_trigger(
+                alert,
+                current_spread,
+                previous_by_token.get(alert.token_id),
+                now=now,
+            ):
+                triggered.append(alert)
+        return triggered
@@ -8,13 +8,14 @@ Implements F-002: Best Price Calculation from the MVP specification.
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from datetime import datetime, timedelta, timezone
+from typing import Final, Optional
 
 from app.rwa_aggregator.domain.entities.price_snapshot import PriceSnapshot
 from app.rwa_aggregator.domain.value_objects.spread import Spread
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BestPrices:
     """Result of best price calculation across venues.
 
@@ -31,6 +32,15 @@ class BestPrices:
     venues_count: int
 
 
+# Shared result for "no fresh data"; BestPrices is frozen so reuse is safe
+_EMPTY_BEST_PRICES: Final[BestPrices] = BestPrices(
+    best_bid=None,
+    best_ask=None,
+    effective_spread=None,
+    venues_count=0,
+)
+
+
 class PriceCalculator:
     """Domain service for calculating best prices across multiple venues.
 
@@ -49,7 +59,11 @@ class PriceCalculator:
         """
         self._max_staleness_seconds = max_staleness_seconds
 
-    def calculate_best_prices(self, snapshots: list[PriceSnapshot]) -> BestPrices:
+    def calculate_best_prices(
+        self,
+        snapshots: list[PriceSnapshot],
+        now: Optional[datetime] = None,
+    ) -> BestPrices:
         """Calculate best bid, best ask, and effective spread across venues.
 
         Filters out stale snapshots and computes:
@@ -59,28 +73,79 @@ class PriceCalculator:
 
         Args:
             snapshots: List of price snapshots from various venues.
+            now: Current UTC time for staleness checks. Defaults to the
+                current time.
 
         Returns:
             BestPrices containing best bid, best ask, effective spread, and venue count.
         """
-        # Filter out stale snapshots per F-002.1/F-002.2/F-002.4
-        fresh_snapshots = [
-            s for s in snapshots if not s.is_stale(self._max_staleness_seconds)
-        ]
+        if now is None:
+            now = datetime.now(timezone.utc)
+        return self._best_prices(snapshots, self._stale_cutoff(now))
+
+    def calculate_best_prices_batch(
+        self,
+        snapshots_by_token: dict[int, list[PriceSnapshot]],
+        now: Optional[datetime] = None,
+    ) -> dict[int, BestPrices]:
+        """Calculate best prices for several tokens against one clock reading.
+
+        Args:
+            snapshots_by_token: Price snapshots keyed by token ID.
+            now: Current UTC time for staleness checks. Defaults to the
+                current time.
 
-        if not fresh_snapshots:
+        Returns:
+            BestPrices keyed by the same token IDs.
+        """
+        if now is None:
+            now = datetime.now(timezone.utc)
+        cutoff = self._stale_cutoff(now)
+        return {
+            token_id: self._best_prices(snapshots, cutoff)
+            for token_id, snapshots in snapshots_by_token.items()
+        }
+
+    def _stale_cutoff(self, now: datetime) -> datetime:
+        """Return the oldest fetched_at that still counts as fresh."""
+        return now - timedelta(seconds=self._max_staleness_seconds)
+
+    @staticmethod
+    def _best_prices(snapshots: list[PriceSnapshot], cutoff: datetime) -> BestPrices:
+        """Find best bid and ask among snapshots fetched at or after cutoff."""
+        if not snapshots:
+            return _EMPTY_BEST_PRICES
+        if len(snapshots) == 1:
+            # A single venue is its own best bid and ask
+            snapshot = snapshots[0]
+            if snapshot.fetched_at < cutoff:
+                return _EMPTY_BEST_PRICES
             return BestPrices(
-                best_bid=None,
-                best_ask=None,
-                effective_spread=None,
-                venues_count=0,
+                best_bid=snapshot,
+                best_ask=snapshot,
+                effective_spread=Spread.calculate(snapshot.bid, snapshot.ask),
+                venues_count=1,
             )
 
-        # Best bid = highest bid price (F-002.1)
-        best_bid = max(fresh_snapshots, key=lambda s: s.bid)
-
-        # Best ask = lowest ask price (F-002.2)
-        best_ask = min(fresh_snapshots, key=lambda s: s.ask)
+        # One pass: skip stale snapshots (F-002.4), track the highest bid
+        # (F-002.1) and lowest ask (F-002.2), and count fresh venues.
+        # Comparing fetched_at to a precomputed cutoff avoids a timedelta
+        # per snapshot. Strict comparisons keep the first venue on ties.
+        best_bid: Optional[PriceSnapshot] = None
+        best_ask: Optional[PriceSnapshot] = None
+        venues_count = 0
+
+        for snapshot in snapshots:
+            if snapshot.fetched_at < cutoff:
+                continue
+            venues_count += 1
+            if best_bid is None or snapshot.bid > best_bid.bid:
+                best_bid = snapshot
+            if best_ask is None or snapshot.ask < best_ask.ask:
+                best_ask = snapshot
+
+        if best_bid is None or best_ask is None:
+            return _EMPTY_BEST_PRICES
 
         # Effective spread calculated from best bid and best ask (F-002.3)
         effective_spread = Spread.calculate(best_bid.bid, best_ask.ask)
@@ -89,5 +154,5 @@ class PriceCalculator:
             best_bid=best_bid,
             best_ask=best_ask,
             effective_spread=effective_spread,
-            venues_count=len(fresh_snapshots),
+            venues_count=venues_count,
         )
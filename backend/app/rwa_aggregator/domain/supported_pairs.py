@@ -16,11 +16,11 @@ in domain/entities/token.py.
 """
 
 from dataclasses import dataclass
-from enum import Enum
+from enum import StrEnum
 from typing import Optional
 
 
-class QuoteCurrency(Enum):
+class QuoteCurrency(StrEnum):
     """Quote currencies used for pricing RWA tokens."""
 
     USD = "USD"    # Direct USD pairs (e.g., PAXG/USD on Kraken)
@@ -28,7 +28,7 @@ class QuoteCurrency(Enum):
     USDC = "USDC"  # Circle USD pairs (e.g., USDY/USDC on DEXs)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TradablePair:
     """Configuration for a tradable RWA token pair.
 
@@ -133,33 +133,56 @@ NAV_ONLY_ASSETS = {
 }
 
 
+# ==============================================================================
+# LOOKUP INDEXES
+# ==============================================================================
+# Built once at import so the helpers below are dict/set lookups rather than
+# scans over SUPPORTED_TRADABLE_PAIRS.
+
+# Lookup tables built in one pass at import so every helper is a dict/set hit
+_pair_lists: dict[str, list[TradablePair]] = {}
+_PRIMARY_PAIR_BY_BASE: dict[str, TradablePair] = {}
+for _pair in SUPPORTED_TRADABLE_PAIRS.values():
+    _pair_lists.setdefault(_pair.base_symbol, []).append(_pair)
+    if _pair.is_primary:
+        _PRIMARY_PAIR_BY_BASE.setdefault(_pair.base_symbol, _pair)
+
+_PAIRS_BY_BASE: dict[str, tuple[TradablePair, ...]] = {
+    base: tuple(pairs) for base, pairs in _pair_lists.items()
+}
+_TRADABLE_BASES: frozenset[str] = frozenset(_PAIRS_BY_BASE)
+_VENUES_BY_BASE: dict[str, frozenset[str]] = {
+    base: frozenset(venue for pair in pairs for venue in pair.venues)
+    for base, pairs in _PAIRS_BY_BASE.items()
+}
+
+del _pair, _pair_lists
+
+
 # ==============================================================================
 # HELPER FUNCTIONS
 # ==============================================================================
 
-def get_tradable_base_symbols() -> set[str]:
+def get_tradable_base_symbols() -> frozenset[str]:
     """Get all unique base symbols that are tradable.
 
     Returns:
-        Set of base token symbols with active trading pairs.
+        Precomputed frozenset of base token symbols with active trading
+        pairs; the same object is returned on every call.
     """
-    return {pair.base_symbol for pair in SUPPORTED_TRADABLE_PAIRS.values()}
+    return _TRADABLE_BASES
 
 
-def get_pairs_for_base(base_symbol: str) -> list[TradablePair]:
+def get_pairs_for_base(base_symbol: str) -> tuple[TradablePair, ...]:
     """Get all tradable pairs for a given base token.
 
     Args:
         base_symbol: The base token symbol (e.g., "USDY").
 
     Returns:
-        List of TradablePair configs for this base token.
+        Tuple of TradablePair configs for this base token.
     """
-    return [
-        pair
-        for pair in SUPPORTED_TRADABLE_PAIRS.values()
-        if pair.base_symbol == base_symbol.upper()
-    ]
+    return _PAIRS_BY_BASE.get(base_symbol.upper(), ())
 
 
 def get_primary_pair_for_base(base_symbol: str) -> Optional[TradablePair]:
@@ -171,13 +194,10 @@ def get_primary_pair_for_base(base_symbol: str) -> Optional[TradablePair]:
     Returns:
         The primary TradablePair, or None if not found.
     """
-    for pair in SUPPORTED_TRADABLE_PAIRS.values():
-        if pair.base_symbol == base_symbol.upper() and pair.is_primary:
-            return pair
-    return None
+    return _PRIMARY_PAIR_BY_BASE.get(base_symbol.upper())
 
 
-def get_venues_for_base(base_symbol: str) -> set[str]:
+def get_venues_for_base(base_symbol: str) -> frozenset[str]:
     """Get all venues that support a given base token.
 
     Args:
@@ -186,10 +206,7 @@ def get_venues_for_base(base_symbol: str) -> set[str]:
     Returns:
         Set of venue names that support trading this token.
     """
-    venues = set()
-    for pair in get_pairs_for_base(base_symbol):
-        venues.update(pair.venues)
-    return venues
+    return _VENUES_BY_BASE.get(base_symbol.upper(), frozenset())
 
 
 def is_tradable_symbol(base_symbol: str) -> bool:
@@ -201,4 +218,4 @@ def is_tradable_symbol(base_symbol: str) -> bool:
     Returns:
         True if the symbol has at least one tradable pair.
     """
-    return base_symbol.upper() in get_tradable_base_symbols()
+    return base_symbol.upper() in _TRADABLE_BASES
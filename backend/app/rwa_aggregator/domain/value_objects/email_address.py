@@ -1,16 +1,39 @@
 """EmailAddress value object for validated email storage."""
 
-import re
+import string
 from dataclasses import dataclass
+from typing import Self
 
+# Accepted characters, equivalent to the former pattern
+# ^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$
+_LOCAL_ALLOWED = frozenset(string.ascii_letters + string.digits + "._%+-")
+_DOMAIN_ALLOWED = frozenset(string.ascii_letters + string.digits + ".-")
+_TLD_ALLOWED = frozenset(string.ascii_letters)
 
-# Simple but effective email regex pattern
-_EMAIL_PATTERN = re.compile(
-    r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-)
 
+def _is_valid_email(value: str) -> bool:
+    """Check an email address without a regex.
 
-@dataclass(frozen=True)
+    Args:
+        value: Candidate email address.
+
+    Returns:
+        True if value has a non-empty local part, a single @, and a domain
+        ending in a dot followed by at least two ASCII letters.
+    """
+    local, at, domain = value.partition("@")
+    if not at or not local or not _LOCAL_ALLOWED.issuperset(local):
+        return False
+    host, dot, tld = domain.rpartition(".")
+    return (
+        bool(dot and host)
+        and len(tld) >= 2
+        and _DOMAIN_ALLOWED.issuperset(host)
+        and _TLD_ALLOWED.issuperset(tld)
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class EmailAddress:
     """Immutable value object representing a validated email address.
 
@@ -22,5 +45,22 @@ class EmailAddress:
 
     def __post_init__(self) -> None:
         """Validate email format after initialization."""
-        if not _EMAIL_PATTERN.match(self.value):
+        if not _is_valid_email(self.value):
             raise ValueError(f"Invalid email address: {self.value}")
+
+    @classmethod
+    def from_trusted(cls, value: str) -> Self:
+        """Wrap an address that was validated before it was stored.
+
+        Skips validation, so only use it for values read back from the
+        database, never for user input.
+
+        Args:
+            value: Previously validated email address string.
+
+        Returns:
+            An EmailAddress wrapping value.
+        """
+        obj = cls.__new__(cls)
+        object.__setattr__(obj, "value", value)
+        return obj
@@ -1,11 +1,12 @@
 """Price value object for representing monetary values."""
 
+import sys
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import Self
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Price:
     """Immutable value object representing a price with currency.
 
@@ -21,6 +22,8 @@ class Price:
         """Validate price constraints after initialization."""
         if self.value < 0:
             raise ValueError("Price cannot be negative")
+        # Codes parsed from DB rows or payloads are fresh strings; share one copy
+        object.__setattr__(self, "currency", sys.intern(self.currency))
 
     @classmethod
     def from_string(cls, value: str, currency: str = "USD") -> Self:
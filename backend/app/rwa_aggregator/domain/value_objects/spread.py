@@ -4,8 +4,14 @@ from dataclasses import dataclass
 from decimal import Decimal
 from typing import Self
 
+# Matches spread_pct DECIMAL(10, 4)
+_PCT_QUANTUM = Decimal("0.0001")
 
-@dataclass(frozen=True)
+# (ask - bid) / ((bid + ask) / 2) * 100 == (ask - bid) * 200 / (bid + ask)
+_TWO_HUNDRED = Decimal(200)
+
+
+@dataclass(frozen=True, slots=True)
 class Spread:
     """Immutable value object representing a bid-ask spread percentage.
 
@@ -38,9 +44,9 @@ class Spread:
         if bid <= 0 or ask <= 0:
             raise ValueError("Bid and ask must be positive")
 
-        mid = (bid + ask) / 2
-        spread_pct = ((ask - bid) / mid) * 100
-        return cls(spread_pct.quantize(Decimal("0.0001")))
+        # Single Decimal division instead of computing mid separately
+        spread_pct = (ask - bid) * _TWO_HUNDRED / (bid + ask)
+        return cls(spread_pct.quantize(_PCT_QUANTUM))
 
     def is_below_threshold(self, threshold_pct: Decimal) -> bool:
         """Check if the spread is below a given threshold.
@@ -55,3 +61,4 @@ class Spread:
             True if the spread percentage is below the threshold.
         """
         return self.percentage < threshold_pct
+
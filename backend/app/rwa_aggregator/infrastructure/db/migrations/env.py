@@ -14,7 +14,7 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 from alembic import context
 
 # Import settings for database URL - do this BEFORE importing models
-from app.core.config import get_settings
+from app.core.config import get_settings, to_asyncpg_url
 
 # Import the Base and all models to ensure they're registered with metadata
 # Import models directly to avoid triggering session.py initialization
@@ -24,8 +24,9 @@ from app.rwa_aggregator.infrastructure.db.models import Base
 # Alembic Config object - provides access to .ini file values
 config = context.config
 
-# Interpret the config file for Python logging
-if config.config_file_name is not None:
+# Interpret the config file for Python logging (skipped when the app runs
+# migrations in-process and has already configured logging)
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
     fileConfig(config.config_file_name)
 
 # Target metadata for 'autogenerate' support
@@ -35,13 +36,7 @@ target_metadata = Base.metadata
 def get_database_url() -> str:
     """Get database URL from settings, converted to async driver."""
     settings = get_settings()
-    url = str(settings.database_url)
-    # Convert to async driver URL
-    if url.startswith("postgresql+psycopg://"):
-        return url.replace("postgresql+psycopg://", "postgresql+asyncpg://")
-    elif url.startswith("postgresql://"):
-        return url.replace("postgresql://", "postgresql+asyncpg://")
-    return url
+    return to_asyncpg_url(str(settings.database_url))
 
 
 def run_migrations_offline() -> None:
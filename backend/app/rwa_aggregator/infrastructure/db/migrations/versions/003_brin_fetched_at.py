@@ -0,0 +1,38 @@
+"""Replace the price_snapshots.fetched_at btree with a BRIN index.
+
+Revision ID: 003_brin_fetched_at
+Revises: 002_add_market_type
+Create Date: 2026-10-15
+
+Snapshots are appended in fetched_at order, so a BRIN index answers
+time-range scans with a fraction of the size and write cost of a btree.
+Per-venue latest-price lookups keep using ix_price_snapshots_token_venue_time.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "003_brin_fetched_at"
+down_revision: Union[str, None] = "002_add_market_type"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Swap the fetched_at btree for a BRIN index."""
+    op.drop_index("ix_price_snapshots_fetched_at", table_name="price_snapshots")
+    op.create_index(
+        "ix_price_snapshots_fetched_at",
+        "price_snapshots",
+        ["fetched_at"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+
+
+def downgrade() -> None:
+    """Restore the fetched_at btree index."""
+    op.drop_index("ix_price_snapshots_fetched_at", table_name="price_snapshots")
+    op.create_index("ix_price_snapshots_fetched_at", "price_snapshots", ["fetched_at"])
@@ -0,0 +1,195 @@
+"""Partition price_snapshots by month on fetched_at.
+
+Revision ID: 004_partition_snapshots
+Revises: 003_brin_fetched_at
+Create Date: 2026-10-15
+
+Recreates price_snapshots as a RANGE-partitioned table with one partition
+per calendar month (UTC) plus a DEFAULT partition, and copies existing rows
+across. Inserts land in the small current partition, time-window queries
+prune old months, and expired months can be dropped instead of deleted.
+
+Also installs ensure_price_snapshot_partition(date), which the web
+leader (at startup and daily) and the ensure_snapshot_partitions Celery
+task call to create upcoming months ahead of time. It moves any rows that
+already fell into the DEFAULT partition into the new month.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "004_partition_snapshots"
+down_revision: Union[str, None] = "003_brin_fetched_at"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_INDEXES = (
+    "ix_price_snapshots_token_id",
+    "ix_price_snapshots_venue_id",
+    "ix_price_snapshots_fetched_at",
+    "ix_price_snapshots_token_venue_time",
+)
+
+_COLUMNS = "id, token_id, venue_id, bid, ask, mid, spread_pct, volume_24h, fetched_at"
+
+
+def _create_indexes() -> None:
+    """Create the price_snapshots indexes on the current table."""
+    op.create_index("ix_price_snapshots_token_id", "price_snapshots", ["token_id"])
+    op.create_index("ix_price_snapshots_venue_id", "price_snapshots", ["venue_id"])
+    op.create_index(
+        "ix_price_snapshots_fetched_at",
+        "price_snapshots",
+        ["fetched_at"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+    op.create_index(
+        "ix_price_snapshots_token_venue_time",
+        "price_snapshots",
+        ["token_id", "venue_id", "fetched_at"],
+    )
+
+
+def _detach_old_table() -> None:
+    """Rename price_snapshots out of the way, freeing its index names."""
+    op.execute("ALTER TABLE price_snapshots RENAME TO price_snapshots_old")
+    op.execute(
+        "ALTER TABLE price_snapshots_old "
+        "RENAME CONSTRAINT price_snapshots_pkey TO price_snapshots_old_pkey"
+    )
+    for name in _INDEXES:
+        op.drop_index(name, table_name="price_snapshots_old")
+
+
+def _copy_and_drop_old_table() -> None:
+    """Move rows into the new table and hand it the id sequence."""
+    op.execute(
+        f"INSERT INTO price_snapshots ({_COLUMNS}) "
+        f"SELECT {_COLUMNS} FROM price_snapshots_old"
+    )
+    # The sequence is owned by the old id column; re-own it before the drop
+    op.execute("ALTER SEQUENCE price_snapshots_id_seq OWNED BY price_snapshots.id")
+    op.execute("DROP TABLE price_snapshots_old")
+
+
+def upgrade() -> None:
+    """Recreate price_snapshots as a monthly range-partitioned table."""
+    _detach_old_table()
+
+    # Partitioned tables need the partition key in the primary key
+    op.execute(
+        """
+        CREATE TABLE price_snapshots (
+            id INTEGER NOT NULL DEFAULT nextval('price_snapshots_id_seq'),
+            token_id INTEGER NOT NULL REFERENCES tokens (id) ON DELETE CASCADE,
+            venue_id INTEGER NOT NULL REFERENCES venues (id) ON DELETE CASCADE,
+            bid NUMERIC(20, 8) NOT NULL,
+            ask NUMERIC(20, 8) NOT NULL,
+            mid NUMERIC(20, 8) NOT NULL,
+            spread_pct NUMERIC(10, 4) NOT NULL,
+            volume_24h NUMERIC(20, 2),
+            fetched_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            CONSTRAINT price_snapshots_pkey PRIMARY KEY (id, fetched_at)
+        ) PARTITION BY RANGE (fetched_at)
+        """
+    )
+    op.execute(
+        "CREATE TABLE price_snapshots_default PARTITION OF price_snapshots DEFAULT"
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION ensure_price_snapshot_partition(month_start date)
+        RETURNS void AS $$
+        DECLARE
+            -- Bounds are UTC month edges regardless of the session TimeZone
+            month_ts timestamp := date_trunc('month', month_start::timestamp);
+            start_ts timestamptz := month_ts AT TIME ZONE 'UTC';
+            end_ts timestamptz := (month_ts + interval '1 month') AT TIME ZONE 'UTC';
+            partition_name text := 'price_snapshots_' || to_char(month_ts, 'YYYY_MM');
+        BEGIN
+            -- Several replicas may run maintenance at once
+            PERFORM pg_advisory_xact_lock(hashtext('ensure_price_snapshot_partition'));
+            IF to_regclass(partition_name) IS NOT NULL THEN
+                RETURN;
+            END IF;
+
+            -- Build the partition standalone and move in any rows that already
+            -- landed in the DEFAULT partition; attaching would fail otherwise
+            EXECUTE format(
+                'CREATE TABLE %I (LIKE price_snapshots INCLUDING DEFAULTS)',
+                partition_name
+            );
+            EXECUTE format(
+                'WITH moved AS ('
+                '    DELETE FROM price_snapshots_default'
+                '    WHERE fetched_at >= %L AND fetched_at < %L RETURNING *'
+                ') INSERT INTO %I SELECT * FROM moved',
+                start_ts,
+                end_ts,
+                partition_name
+            );
+            EXECUTE format(
+                'ALTER TABLE price_snapshots ATTACH PARTITION %I '
+                'FOR VALUES FROM (%L) TO (%L)',
+                partition_name,
+                start_ts,
+                end_ts
+            );
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+
+    # One partition per month from the oldest snapshot through next month
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            month_start date;
+            last_month date := (date_trunc('month', now() AT TIME ZONE 'UTC') + interval '1 month')::date;
+        BEGIN
+            SELECT date_trunc('month', COALESCE(min(fetched_at), now()) AT TIME ZONE 'UTC')::date
+            INTO month_start
+            FROM price_snapshots_old;
+            WHILE month_start <= last_month LOOP
+                PERFORM ensure_price_snapshot_partition(month_start);
+                month_start := (month_start + interval '1 month')::date;
+            END LOOP;
+        END
+        $$
+        """
+    )
+
+    _copy_and_drop_old_table()
+    _create_indexes()
+
+
+def downgrade() -> None:
+    """Collapse the partitions back into a single price_snapshots table."""
+    _detach_old_table()
+
+    op.execute(
+        """
+        CREATE TABLE price_snapshots (
+            id INTEGER NOT NULL DEFAULT nextval('price_snapshots_id_seq'),
+            token_id INTEGER NOT NULL REFERENCES tokens (id) ON DELETE CASCADE,
+            venue_id INTEGER NOT NULL REFERENCES venues (id) ON DELETE CASCADE,
+            bid NUMERIC(20, 8) NOT NULL,
+            ask NUMERIC(20, 8) NOT NULL,
+            mid NUMERIC(20, 8) NOT NULL,
+            spread_pct NUMERIC(10, 4) NOT NULL,
+            volume_24h NUMERIC(20, 2),
+            fetched_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            CONSTRAINT price_snapshots_pkey PRIMARY KEY (id)
+        )
+        """
+    )
+
+    # Dropping the partitioned parent drops every partition with it
+    _copy_and_drop_old_table()
+    op.execute("DROP FUNCTION IF EXISTS ensure_price_snapshot_partition(date)")
+    _create_indexes()
@@ -0,0 +1,31 @@
+"""Drop the redundant price_snapshots.token_id index.
+
+Revision ID: 005_drop_snapshot_token_index
+Revises: 004_partition_snapshots
+Create Date: 2026-10-15
+
+ix_price_snapshots_token_venue_time leads with token_id, so it already
+serves every token_id lookup (including ON DELETE CASCADE from tokens).
+The venue_id index stays: it is the only index usable for cascades from
+venues, which are not a left prefix of the composite.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "005_drop_snapshot_token_index"
+down_revision: Union[str, None] = "004_partition_snapshots"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Drop the single-column token_id index."""
+    op.drop_index("ix_price_snapshots_token_id", table_name="price_snapshots")
+
+
+def downgrade() -> None:
+    """Recreate the single-column token_id index."""
+    op.create_index("ix_price_snapshots_token_id", "price_snapshots", ["token_id"])
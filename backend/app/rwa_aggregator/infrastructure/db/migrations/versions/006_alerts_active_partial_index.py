@@ -0,0 +1,36 @@
+"""Add a partial index over active alerts.
+
+Revision ID: 006_alerts_active_partial_index
+Revises: 005_drop_snapshot_token_index
+Create Date: 2026-10-15
+
+Alert evaluation only reads ACTIVE alerts (get_all_active and
+get_active_for_token). Paused and deleted alerts accumulate over time, so
+an index restricted to active rows stays small enough to remain cached.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "006_alerts_active_partial_index"
+down_revision: Union[str, None] = "005_drop_snapshot_token_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create ix_alerts_active on token_id for ACTIVE alerts only."""
+    op.create_index(
+        "ix_alerts_active",
+        "alerts",
+        ["token_id"],
+        postgresql_where=sa.text("status = 'ACTIVE'"),
+    )
+
+
+def downgrade() -> None:
+    """Drop ix_alerts_active."""
+    op.drop_index("ix_alerts_active", table_name="alerts")
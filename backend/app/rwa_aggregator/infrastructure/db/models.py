@@ -4,7 +4,6 @@ These models represent the database schema and handle persistence concerns.
 They should be converted to/from domain entities via repository mappers.
 """
 
-from datetime import datetime
 
 from sqlalchemy import (
     Boolean,
@@ -15,6 +14,7 @@ from sqlalchemy import (
     Integer,
     Numeric,
     String,
+    text,
 )
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.orm import DeclarativeBase, relationship
@@ -84,25 +84,30 @@ class VenueModel(Base):
 
 
 class PriceSnapshotModel(Base):
-    """ORM model for price_snapshots table."""
+    """ORM model for price_snapshots table.
+
+    The table is range-partitioned by month on fetched_at, so fetched_at is
+    part of the primary key.
+    """
 
     __tablename__ = "price_snapshots"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    token_id = Column(Integer, ForeignKey("tokens.id"), nullable=False, index=True)
+    # Indexed through the leading column of ix_price_snapshots_token_venue_time
+    token_id = Column(Integer, ForeignKey("tokens.id"), nullable=False)
     venue_id = Column(Integer, ForeignKey("venues.id"), nullable=False, index=True)
     bid = Column(Numeric(20, 8), nullable=False)
     ask = Column(Numeric(20, 8), nullable=False)
     mid = Column(Numeric(20, 8), nullable=False)
     spread_pct = Column(Numeric(10, 4), nullable=False)
     volume_24h = Column(Numeric(20, 2), nullable=True)
-    fetched_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    fetched_at = Column(DateTime(timezone=True), primary_key=True, nullable=False)
 
     # Relationships
     token = relationship("TokenModel", back_populates="price_snapshots")
     venue = relationship("VenueModel", back_populates="price_snapshots")
 
-    # Composite index for efficient queries
+    # Composite index for efficient queries; BRIN for append-ordered time scans
     __table_args__ = (
         Index(
             "ix_price_snapshots_token_venue_time",
@@ -110,6 +115,13 @@ class PriceSnapshotModel(Base):
             "venue_id",
             "fetched_at",
         ),
+        Index(
+            "ix_price_snapshots_fetched_at",
+            "fetched_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        {"postgresql_partition_by": "RANGE (fetched_at)"},
     )
 
     def __repr__(self) -> str:
@@ -136,8 +148,16 @@ class AlertModel(Base):
     # Relationships
     token = relationship("TokenModel", back_populates="alerts")
 
-    # Index for efficient alert checking
-    __table_args__ = (Index("ix_alerts_token_status", "token_id", "status"),)
+    # Indexes for efficient alert checking; the partial one covers only
+    # the ACTIVE rows that evaluation reads
+    __table_args__ = (
+        Index("ix_alerts_token_status", "token_id", "status"),
+        Index(
+            "ix_alerts_active",
+            "token_id",
+            postgresql_where=text("status = 'ACTIVE'"),
+        ),
+    )
 
     def __repr__(self) -> str:
         return f"<AlertModel(id={self.id}, email='{self.email}', token_id={self.token_id})>"
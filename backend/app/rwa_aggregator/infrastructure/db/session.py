@@ -4,6 +4,8 @@ Provides async SQLAlchemy engine and session factory for PostgreSQL
 using asyncpg driver.
 """
 
+import logging
+import os
 from collections.abc import AsyncGenerator
 from typing import Optional
 
@@ -14,7 +16,9 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
-from app.core.config import get_settings
+from app.core.config import get_settings, to_asyncpg_url
+
+logger = logging.getLogger(__name__)
 
 
 def _get_async_database_url() -> str:
@@ -23,10 +27,6 @@ def _get_async_database_url() -> str:
     Railway provides both DATABASE_URL (internal) and DATABASE_PUBLIC_URL (external).
     We prefer internal for better performance, but fall back to public if needed.
     """
-    import os
-    import logging
-    
-    logger = logging.getLogger(__name__)
     settings = get_settings()
     
     # Check environment variables first (Railway sets these)
@@ -43,17 +43,12 @@ def _get_async_database_url() -> str:
         url = str(settings.database_url)
         logger.info("Using DATABASE_URL from settings")
     
-    # Replace postgresql:// or postgresql+psycopg:// with postgresql+asyncpg://
-    if url.startswith("postgresql+psycopg://"):
-        async_url = url.replace("postgresql+psycopg://", "postgresql+asyncpg://")
-    elif url.startswith("postgresql://"):
-        async_url = url.replace("postgresql://", "postgresql+asyncpg://")
-    else:
-        async_url = url
+    async_url = to_asyncpg_url(url)
     
-    # Log first 50 chars (without password)
-    safe_url = async_url.split("@")[-1] if "@" in async_url else async_url[:50]
-    logger.debug(f"Database URL host: {safe_url}")
+    if logger.isEnabledFor(logging.DEBUG):
+        # Log first 50 chars (without password)
+        safe_url = async_url.split("@")[-1] if "@" in async_url else async_url[:50]
+        logger.debug("Database URL host: %s", safe_url)
     return async_url
 
 
@@ -70,13 +65,37 @@ def get_engine() -> AsyncEngine:
         _engine = create_async_engine(
             _get_async_database_url(),
             echo=settings.debug,
-            pool_size=5,
-            max_overflow=10,
+            # Per worker process: Gunicorn runs several, so workers *
+            # (pool_size + max_overflow) must stay under max_connections
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=5,  # Fail fast instead of queueing requests for 30s
+            pool_use_lifo=True,  # Reuse warm connections; idle extras age out
             pool_pre_ping=True,
+            pool_recycle=1800,
+            connect_args={
+                # asyncpg's per-connection prepared statement cache
+                "statement_cache_size": 1024,
+                # SQLAlchemy's asyncpg dialect cache of prepared statements
+                "prepared_statement_cache_size": 512,
+            },
         )
     return _engine
 
 
+async def dispose_engine() -> None:
+    """Close the engine's pooled connections and forget the engine.
+
+    The next get_engine() call builds a fresh engine, so this is safe to
+    call before forking worker processes.
+    """
+    global _engine, _async_session_local
+    if _engine is not None:
+        await _engine.dispose()
+    _engine = None
+    _async_session_local = None
+
+
 def get_async_session_local() -> async_sessionmaker[AsyncSession]:
     """Get or create the async session factory."""
     global _async_session_local
@@ -101,12 +120,14 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
         async def get_items(session: AsyncSession = Depends(get_db_session)):
             ...
 
+    The session checks a connection out of the pool on its first query and
+    holds it until the request ends, so every repository built on it shares
+    one connection and one transaction per request.
+
     Yields:
         AsyncSession: An async SQLAlchemy session.
     """
     session_factory = get_async_session_local()
+    # The context manager closes the session and returns its connection
     async with session_factory() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
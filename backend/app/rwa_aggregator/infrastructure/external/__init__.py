@@ -1,6 +1,11 @@
 # External clients - Kraken, Coinbase, Uniswap, Postmark
 
 from .coinbase_client import CoinbaseClient
+from .http_client import (
+    close_shared_http_client,
+    create_http_client,
+    get_shared_http_client,
+)
 from .kraken_client import KrakenClient
 from .price_feed_registry import PriceFeedRegistry, create_default_registry
 from .uniswap_client import UniswapClient
@@ -10,5 +15,8 @@ __all__ = [
     "KrakenClient",
     "PriceFeedRegistry",
     "UniswapClient",
+    "close_shared_http_client",
     "create_default_registry",
+    "create_http_client",
+    "get_shared_http_client",
 ]
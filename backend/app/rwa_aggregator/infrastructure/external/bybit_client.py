@@ -6,15 +6,20 @@ Public endpoint rate limit: 10 requests/second per IP.
 
 import logging
 from datetime import datetime, timezone
-from decimal import Decimal
 from typing import Optional
 
 import httpx
+import orjson
 
 from app.rwa_aggregator.application.interfaces.price_feed import (
     NormalizedQuote,
     PriceFeed,
 )
+from app.rwa_aggregator.infrastructure.external.quote_cache import (
+    RedisQuoteCache,
+    TTLQuoteCacheMixin,
+)
+from app.rwa_aggregator.infrastructure.external.rate_limiter import AsyncRateLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -40,18 +45,31 @@ BYBIT_SYMBOL_MAP: dict[str, str] = {
     "PAXG": "PAXGUSDT",
 }
 
+# Normalized symbols with a Bybit mapping, for supports_token checks
+BYBIT_SUPPORTED_SYMBOLS: frozenset[str] = frozenset(BYBIT_SYMBOL_MAP)
+
 # Default timeout for HTTP requests
 DEFAULT_TIMEOUT_SECONDS = 10.0
 
+# Bybit allows 10 public requests/second per IP.
+# One bucket per process throttles requests before the venue sends 429s
+_RATE_LIMITER = AsyncRateLimiter(max_rate=10)
+
+# Seconds a quote is reused; Bybit tickers update about once a second
+BYBIT_QUOTE_TTL_SECONDS = 1.0
 
-class BybitClient(PriceFeed):
+# Below this many symbols, per-symbol requests beat downloading every ticker
+BYBIT_BATCH_MIN_SYMBOLS = 3
+
+
+class BybitClient(TTLQuoteCacheMixin, PriceFeed):
     """Bybit V5 API client implementing the PriceFeed interface.
 
     This client fetches real-time ticker data from Bybit's public V5 API.
     No authentication required for public market data endpoints.
 
     Attributes:
-        _client: httpx AsyncClient for making HTTP requests.
+        _client: httpx AsyncClient for making HTTP requests (may be shared).
         _base_url: Bybit API base URL.
     """
 
@@ -59,22 +77,31 @@ class BybitClient(PriceFeed):
         self,
         base_url: str = "https://api.bybit.com",
         timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        client: Optional[httpx.AsyncClient] = None,
+        quote_ttl_seconds: float = BYBIT_QUOTE_TTL_SECONDS,
+        shared_cache: Optional[RedisQuoteCache] = None,
     ) -> None:
         """Initialize the Bybit client.
 
         Args:
             base_url: Bybit API base URL.
             timeout: HTTP request timeout in seconds.
+            client: Shared HTTP client. If omitted, a private client is
+                created and closed by close().
+            quote_ttl_seconds: Seconds a fetched quote is reused for repeat
+                requests of the same token. 0 disables caching.
+            shared_cache: Optional Redis tier shared with other processes.
         """
         self._base_url = base_url.rstrip("/")
-        self._client = httpx.AsyncClient(
-            base_url=self._base_url,
-            timeout=timeout,
-            headers={
-                "Accept": "application/json",
-                "User-Agent": "RWA-Aggregator/1.0",
-            },
-        )
+        self._timeout = timeout
+        self._headers = {
+            "Accept": "application/json",
+            "User-Agent": "RWA-Aggregator/1.0",
+        }
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient()
+        self._quote_ttl = quote_ttl_seconds
+        self._shared_cache = shared_cache
 
     @property
     def venue_name(self) -> str:
@@ -90,9 +117,27 @@ class BybitClient(PriceFeed):
         Returns:
             True if the token has a Bybit pair mapping.
         """
-        return token_symbol.upper() in BYBIT_SYMBOL_MAP
+        return token_symbol.upper() in BYBIT_SUPPORTED_SYMBOLS
 
-    async def fetch_quote(self, token_symbol: str) -> Optional[NormalizedQuote]:
+    async def _get(self, path: str, params: Optional[dict] = None) -> httpx.Response:
+        """Issue a GET request against the Bybit API.
+
+        Args:
+            path: Endpoint path relative to the base URL.
+            params: Optional query parameters.
+
+        Returns:
+            The raw HTTP response.
+        """
+        async with _RATE_LIMITER:
+            return await self._client.get(
+                f"{self._base_url}{path}",
+                params=params,
+                headers=self._headers,
+                timeout=self._timeout,
+            )
+
+    async def _fetch_quote_uncached(self, token_symbol: str) -> Optional[NormalizedQuote]:
         """Fetch a price quote from Bybit for the given token.
 
         Uses the V5 public market/tickers endpoint (no auth required).
@@ -107,12 +152,12 @@ class BybitClient(PriceFeed):
         bybit_symbol = BYBIT_SYMBOL_MAP.get(symbol_upper)
 
         if not bybit_symbol:
-            logger.debug(f"Bybit does not support token: {token_symbol}")
+            logger.debug("Bybit does not support token: %s", token_symbol)
             return None
 
         try:
             # Use V5 public market tickers endpoint
-            response = await self._client.get(
+            response = await self._get(
                 "/v5/market/tickers",
                 params={
                     "category": "spot",
@@ -120,7 +165,7 @@ class BybitClient(PriceFeed):
                 },
             )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             # Check for API errors
             if data.get("retCode") != 0:
@@ -132,38 +177,8 @@ class BybitClient(PriceFeed):
                 logger.warning(f"No ticker data in Bybit response for {bybit_symbol}")
                 return None
 
-            ticker = result_list[0]
-
-            # V5 response format:
-            # {
-            #   "symbol": "USDYUSDT",
-            #   "bid1Price": "1.0265",
-            #   "bid1Size": "17913.46",
-            #   "ask1Price": "1.0266",
-            #   "ask1Size": "2149.5",
-            #   "volume24h": "67823.74",
-            #   "turnover24h": "69634.12",
-            #   ...
-            # }
-            bid = ticker.get("bid1Price")
-            ask = ticker.get("ask1Price")
-            volume = ticker.get("volume24h")
-
-            if not bid or not ask:
-                logger.warning(f"Missing bid/ask in Bybit response for {bybit_symbol}")
-                return None
-
-            bid_price = Decimal(str(bid))
-            ask_price = Decimal(str(ask))
-            volume_24h = Decimal(str(volume)) if volume else None
-
-            return NormalizedQuote(
-                venue_name=self.venue_name,
-                token_symbol=symbol_upper,
-                bid=bid_price,
-                ask=ask_price,
-                volume_24h=volume_24h,
-                timestamp=datetime.now(timezone.utc),
+            return self._parse_ticker(
+                symbol_upper, result_list[0], datetime.now(timezone.utc)
             )
 
         except httpx.TimeoutException:
@@ -179,6 +194,111 @@ class BybitClient(PriceFeed):
             logger.exception(f"Unexpected error fetching Bybit quote for {token_symbol}: {e}")
             return None
 
+    async def _fetch_quotes_uncached(
+        self, token_symbols: list[str]
+    ) -> dict[str, NormalizedQuote]:
+        """Fetch quotes for several tokens with one all-tickers request.
+
+        Bybit returns every spot ticker when no symbol is given, so for
+        BYBIT_BATCH_MIN_SYMBOLS or more tokens a single response replaces
+        one request per token. Smaller batches use per-symbol requests.
+
+        Args:
+            token_symbols: Upper-cased normalized token symbols.
+
+        Returns:
+            Mapping of token symbol to quote for tokens with data.
+        """
+        bybit_symbols = {
+            BYBIT_SYMBOL_MAP[symbol]: symbol
+            for symbol in token_symbols
+            if symbol in BYBIT_SYMBOL_MAP
+        }
+        if len(bybit_symbols) < BYBIT_BATCH_MIN_SYMBOLS:
+            return await super()._fetch_quotes_uncached(list(bybit_symbols.values()))
+
+        try:
+            response = await self._get(
+                "/v5/market/tickers",
+                params={"category": "spot"},
+            )
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+
+            if data.get("retCode") != 0:
+                logger.error(f"Bybit API error: {data.get('retMsg')}")
+                return {}
+
+            # Every quote in one response shares its receive time
+            fetched_at = datetime.now(timezone.utc)
+            quotes: dict[str, NormalizedQuote] = {}
+            for ticker in data.get("result", {}).get("list", []):
+                symbol = bybit_symbols.get(ticker.get("symbol"))
+                if symbol is None:
+                    continue
+                quote = self._parse_ticker(symbol, ticker, fetched_at)
+                if quote is not None:
+                    quotes[symbol] = quote
+            return quotes
+
+        except httpx.TimeoutException:
+            logger.error("Timeout fetching Bybit tickers")
+            return {}
+        except httpx.HTTPStatusError as e:
+            logger.error(f"HTTP error fetching Bybit tickers: {e.response.status_code}")
+            return {}
+        except (KeyError, ValueError) as e:
+            logger.error(f"Error parsing Bybit tickers response: {e}")
+            return {}
+        except Exception as e:
+            logger.exception(f"Unexpected error fetching Bybit tickers: {e}")
+            return {}
+
+    def _parse_ticker(
+        self, symbol: str, ticker: dict, fetched_at: datetime
+    ) -> Optional[NormalizedQuote]:
+        """Build a quote from one V5 ticker entry.
+
+        V5 response format:
+        {
+          "symbol": "USDYUSDT",
+          "bid1Price": "1.0265",
+          "bid1Size": "17913.46",
+          "ask1Price": "1.0266",
+          "ask1Size": "2149.5",
+          "volume24h": "67823.74",
+          "turnover24h": "69634.12",
+          ...
+        }
+
+        Args:
+            symbol: Upper-cased normalized token symbol.
+            ticker: Ticker entry from the result list.
+            fetched_at: When the response carrying the entry was received.
+
+        Returns:
+            NormalizedQuote, or None if bid or ask is missing.
+
+        Raises:
+            ValueError: If a price field is not numeric.
+        """
+        bid = ticker.get("bid1Price")
+        ask = ticker.get("ask1Price")
+        volume = ticker.get("volume24h")
+
+        if not bid or not ask:
+            logger.warning(f"Missing bid/ask in Bybit response for {ticker.get('symbol')}")
+            return None
+
+        return NormalizedQuote(
+            venue_name=self.venue_name,
+            token_symbol=symbol,
+            bid=float(bid),
+            ask=float(ask),
+            volume_24h=float(volume) if volume else None,
+            timestamp=fetched_at,
+        )
+
     async def fetch_order_book(
         self, token_symbol: str, limit: int = 50
     ) -> Optional[dict]:
@@ -198,7 +318,7 @@ class BybitClient(PriceFeed):
             return None
 
         try:
-            response = await self._client.get(
+            response = await self._get(
                 "/v5/market/orderbook",
                 params={
                     "category": "spot",
@@ -207,7 +327,7 @@ class BybitClient(PriceFeed):
                 },
             )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             if data.get("retCode") != 0:
                 logger.error(f"Bybit API error: {data.get('retMsg')}")
@@ -225,8 +345,9 @@ class BybitClient(PriceFeed):
             return None
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Close the HTTP client if this instance created it."""
+        if self._owns_client:
+            await self._client.aclose()
 
     async def __aenter__(self) -> "BybitClient":
         """Async context manager entry."""
@@ -9,15 +9,20 @@ Rate limit: 3-10 requests/second per IP.
 
 import logging
 from datetime import datetime, timezone
-from decimal import Decimal
 from typing import Optional
 
 import httpx
+import orjson
 
 from app.rwa_aggregator.application.interfaces.price_feed import (
     NormalizedQuote,
     PriceFeed,
 )
+from app.rwa_aggregator.infrastructure.external.quote_cache import (
+    RedisQuoteCache,
+    TTLQuoteCacheMixin,
+)
+from app.rwa_aggregator.infrastructure.external.rate_limiter import AsyncRateLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -44,18 +49,28 @@ COINBASE_SYMBOL_MAP: dict[str, str] = {
     # Add more as needed
 }
 
+# Normalized symbols with a Coinbase mapping, for supports_token checks
+COINBASE_SUPPORTED_SYMBOLS: frozenset[str] = frozenset(COINBASE_SYMBOL_MAP)
+
 # Default timeout for HTTP requests
 DEFAULT_TIMEOUT_SECONDS = 10.0
 
+# Coinbase allows 3-10 public requests/second per IP.
+# One bucket per process throttles requests before the venue sends 429s
+_RATE_LIMITER = AsyncRateLimiter(max_rate=5)
+
+# Seconds a quote is reused; Coinbase allows only 3-10 requests/second
+COINBASE_QUOTE_TTL_SECONDS = 2.0
 
-class CoinbaseClient(PriceFeed):
+
+class CoinbaseClient(TTLQuoteCacheMixin, PriceFeed):
     """Coinbase Exchange API client implementing the PriceFeed interface.
 
     This client fetches real-time ticker data from Coinbase's public Exchange API.
     No authentication required for public market data endpoints.
 
     Attributes:
-        _client: httpx AsyncClient for making HTTP requests.
+        _client: httpx AsyncClient for making HTTP requests (may be shared).
         _base_url: Coinbase Exchange API base URL.
     """
 
@@ -65,6 +80,9 @@ class CoinbaseClient(PriceFeed):
         api_secret: Optional[str] = None,
         base_url: str = "https://api.exchange.coinbase.com",
         timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        client: Optional[httpx.AsyncClient] = None,
+        quote_ttl_seconds: float = COINBASE_QUOTE_TTL_SECONDS,
+        shared_cache: Optional[RedisQuoteCache] = None,
     ) -> None:
         """Initialize the Coinbase client.
 
@@ -73,18 +91,24 @@ class CoinbaseClient(PriceFeed):
             api_secret: Optional API secret (stored for future authenticated requests).
             base_url: Coinbase Exchange API base URL.
             timeout: HTTP request timeout in seconds.
+            client: Shared HTTP client. If omitted, a private client is
+                created and closed by close().
+            quote_ttl_seconds: Seconds a fetched quote is reused for repeat
+                requests of the same token. 0 disables caching.
+            shared_cache: Optional Redis tier shared with other processes.
         """
         self._base_url = base_url.rstrip("/")
         self._api_key = api_key
         self._api_secret = api_secret
-        self._client = httpx.AsyncClient(
-            base_url=self._base_url,
-            timeout=timeout,
-            headers={
-                "Accept": "application/json",
-                "User-Agent": "RWA-Aggregator/1.0",
-            },
-        )
+        self._timeout = timeout
+        self._headers = {
+            "Accept": "application/json",
+            "User-Agent": "RWA-Aggregator/1.0",
+        }
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient()
+        self._quote_ttl = quote_ttl_seconds
+        self._shared_cache = shared_cache
 
     @property
     def venue_name(self) -> str:
@@ -100,9 +124,27 @@ class CoinbaseClient(PriceFeed):
         Returns:
             True if the token has a Coinbase product mapping.
         """
-        return token_symbol.upper() in COINBASE_SYMBOL_MAP
+        return token_symbol.upper() in COINBASE_SUPPORTED_SYMBOLS
+
+    async def _get(self, path: str, params: Optional[dict] = None) -> httpx.Response:
+        """Issue a GET request against the Coinbase API.
+
+        Args:
+            path: Endpoint path relative to the base URL.
+            params: Optional query parameters.
+
+        Returns:
+            The raw HTTP response.
+        """
+        async with _RATE_LIMITER:
+            return await self._client.get(
+                f"{self._base_url}{path}",
+                params=params,
+                headers=self._headers,
+                timeout=self._timeout,
+            )
 
-    async def fetch_quote(self, token_symbol: str) -> Optional[NormalizedQuote]:
+    async def _fetch_quote_uncached(self, token_symbol: str) -> Optional[NormalizedQuote]:
         """Fetch a price quote from Coinbase for the given token.
 
         Uses the public Exchange API ticker endpoint (no auth required).
@@ -117,14 +159,14 @@ class CoinbaseClient(PriceFeed):
         product_id = COINBASE_SYMBOL_MAP.get(symbol_upper)
 
         if not product_id:
-            logger.debug(f"Coinbase does not support token: {token_symbol}")
+            logger.debug("Coinbase does not support token: %s", token_symbol)
             return None
 
         try:
             # Use the public Exchange API ticker endpoint
-            response = await self._client.get(f"/products/{product_id}/ticker")
+            response = await self._get(f"/products/{product_id}/ticker")
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             # Response format from /products/{id}/ticker:
             # {"trade_id": 123, "price": "50000.00", "size": "0.001",
@@ -137,9 +179,9 @@ class CoinbaseClient(PriceFeed):
                 logger.warning(f"Missing bid/ask in Coinbase response for {product_id}")
                 return None
 
-            bid_price = Decimal(str(bid))
-            ask_price = Decimal(str(ask))
-            volume_24h = Decimal(str(volume)) if volume else None
+            bid_price = float(bid)
+            ask_price = float(ask)
+            volume_24h = float(volume) if volume else None
 
             return NormalizedQuote(
                 venue_name=self.venue_name,
@@ -183,12 +225,12 @@ class CoinbaseClient(PriceFeed):
 
         try:
             # Level 2 order book (aggregated)
-            response = await self._client.get(
+            response = await self._get(
                 f"/products/{product_id}/book",
                 params={"level": 2},
             )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             return {
                 "bids": data.get("bids", [])[:limit],
@@ -216,16 +258,17 @@ class CoinbaseClient(PriceFeed):
             return None
 
         try:
-            response = await self._client.get(f"/products/{product_id}/stats")
+            response = await self._get(f"/products/{product_id}/stats")
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except Exception as e:
             logger.error(f"Error fetching Coinbase 24h stats for {token_symbol}: {e}")
             return None
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Close the HTTP client if this instance created it."""
+        if self._owns_client:
+            await self._client.aclose()
 
     async def __aenter__(self) -> "CoinbaseClient":
         """Async context manager entry."""
@@ -0,0 +1,69 @@
+"""Shared HTTP client factory for external price feed adapters."""
+
+from typing import Optional
+
+import httpx
+
+# Connection pool sizing for all venue adapters sharing one client
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+# Idle connections stay open across polling cycles (main loop runs every 10s)
+DEFAULT_KEEPALIVE_EXPIRY_SECONDS = 30.0
+
+# Process-wide client handed out by get_shared_http_client()
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def create_http_client(
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY_SECONDS,
+) -> httpx.AsyncClient:
+    """Create an HTTP/2 client with a pooled, keep-alive transport.
+
+    A single instance is meant to be shared by every price feed adapter so
+    TCP/TLS sessions survive across polling cycles. The caller owns the
+    client and must close it with ``aclose()``.
+
+    Args:
+        max_connections: Maximum number of concurrent connections.
+        max_keepalive_connections: Maximum idle connections kept open.
+        keepalive_expiry: Seconds an idle connection is kept open.
+
+    Returns:
+        Configured httpx AsyncClient.
+    """
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=1,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+    )
+    return httpx.AsyncClient(transport=transport)
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client, creating it on first use.
+
+    Both the in-process price fetcher and Celery workers (which keep one
+    event loop per process) reuse this client, so venue connections and
+    TLS sessions outlive individual fetch cycles.
+
+    Returns:
+        The shared httpx AsyncClient.
+    """
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = create_http_client()
+    return _shared_client
+
+
+async def close_shared_http_client() -> None:
+    """Close the process-wide HTTP client if one was created."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
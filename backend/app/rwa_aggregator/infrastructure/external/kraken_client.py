@@ -6,15 +6,20 @@ Public endpoint rate limit: ~1 request per second.
 
 import logging
 from datetime import datetime, timezone
-from decimal import Decimal
 from typing import Optional
 
 import httpx
+import orjson
 
 from app.rwa_aggregator.application.interfaces.price_feed import (
     NormalizedQuote,
     PriceFeed,
 )
+from app.rwa_aggregator.infrastructure.external.quote_cache import (
+    RedisQuoteCache,
+    TTLQuoteCacheMixin,
+)
+from app.rwa_aggregator.infrastructure.external.rate_limiter import AsyncRateLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -43,18 +48,31 @@ KRAKEN_SYMBOL_MAP: dict[str, str] = {
     "EURZ": "EURZEUR",
 }
 
+# Normalized symbols with a Kraken mapping, for supports_token checks
+KRAKEN_SUPPORTED_SYMBOLS: frozenset[str] = frozenset(KRAKEN_SYMBOL_MAP)
+
 # Default timeout for HTTP requests
 DEFAULT_TIMEOUT_SECONDS = 10.0
 
+# Kraken allows ~1 public request/second sustained but tolerates short
+# bursts. The burst covers one batch request plus a per-pair fallback for
+# every supported pair, so a fallback round fits within the registry's
+# per-venue timeout; the 1/s refill then spaces out later cycles.
+# One bucket per process throttles requests before the venue sends 429s
+_RATE_LIMITER = AsyncRateLimiter(max_rate=1, burst=1 + len(KRAKEN_SYMBOL_MAP))
+
+# Seconds a quote is reused; Kraken's public limit is ~1 request/second
+KRAKEN_QUOTE_TTL_SECONDS = 3.0
 
-class KrakenClient(PriceFeed):
+
+class KrakenClient(TTLQuoteCacheMixin, PriceFeed):
     """Kraken REST API client implementing the PriceFeed interface.
 
     This client fetches real-time ticker data from Kraken's public API.
     No authentication is required for public market data endpoints.
 
     Attributes:
-        _client: httpx AsyncClient for making HTTP requests.
+        _client: httpx AsyncClient for making HTTP requests (may be shared).
         _base_url: Kraken API base URL.
     """
 
@@ -62,19 +80,28 @@ class KrakenClient(PriceFeed):
         self,
         base_url: str = "https://api.kraken.com",
         timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        client: Optional[httpx.AsyncClient] = None,
+        quote_ttl_seconds: float = KRAKEN_QUOTE_TTL_SECONDS,
+        shared_cache: Optional[RedisQuoteCache] = None,
     ) -> None:
         """Initialize the Kraken client.
 
         Args:
             base_url: Kraken API base URL.
             timeout: HTTP request timeout in seconds.
+            client: Shared HTTP client. If omitted, a private client is
+                created and closed by close().
+            quote_ttl_seconds: Seconds a fetched quote is reused for repeat
+                requests of the same token. 0 disables caching.
+            shared_cache: Optional Redis tier shared with other processes.
         """
         self._base_url = base_url.rstrip("/")
-        self._client = httpx.AsyncClient(
-            base_url=self._base_url,
-            timeout=timeout,
-            headers={"Accept": "application/json"},
-        )
+        self._timeout = timeout
+        self._headers = {"Accept": "application/json"}
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient()
+        self._quote_ttl = quote_ttl_seconds
+        self._shared_cache = shared_cache
 
     @property
     def venue_name(self) -> str:
@@ -90,9 +117,27 @@ class KrakenClient(PriceFeed):
         Returns:
             True if the token has a Kraken pair mapping.
         """
-        return token_symbol.upper() in KRAKEN_SYMBOL_MAP
+        return token_symbol.upper() in KRAKEN_SUPPORTED_SYMBOLS
+
+    async def _get(self, path: str, params: Optional[dict] = None) -> httpx.Response:
+        """Issue a GET request against the Kraken API.
+
+        Args:
+            path: Endpoint path relative to the base URL.
+            params: Optional query parameters.
+
+        Returns:
+            The raw HTTP response.
+        """
+        async with _RATE_LIMITER:
+            return await self._client.get(
+                f"{self._base_url}{path}",
+                params=params,
+                headers=self._headers,
+                timeout=self._timeout,
+            )
 
-    async def fetch_quote(self, token_symbol: str) -> Optional[NormalizedQuote]:
+    async def _fetch_quote_uncached(self, token_symbol: str) -> Optional[NormalizedQuote]:
         """Fetch a price quote from Kraken for the given token.
 
         Args:
@@ -105,16 +150,16 @@ class KrakenClient(PriceFeed):
         kraken_pair = KRAKEN_SYMBOL_MAP.get(symbol_upper)
 
         if not kraken_pair:
-            logger.debug(f"Kraken does not support token: {token_symbol}")
+            logger.debug("Kraken does not support token: %s", token_symbol)
             return None
 
         try:
-            response = await self._client.get(
+            response = await self._get(
                 "/0/public/Ticker",
                 params={"pair": kraken_pair},
             )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             # Check for API errors
             if data.get("error") and len(data["error"]) > 0:
@@ -137,21 +182,8 @@ class KrakenClient(PriceFeed):
                 logger.warning(f"No ticker data in Kraken response for {kraken_pair}")
                 return None
 
-            # Extract bid, ask, and volume from Kraken response format:
-            # a: [ask_price, whole_lot_volume, lot_volume]
-            # b: [bid_price, whole_lot_volume, lot_volume]
-            # v: [today_volume, 24h_volume]
-            ask_price = Decimal(ticker_data["a"][0])
-            bid_price = Decimal(ticker_data["b"][0])
-            volume_24h = Decimal(ticker_data["v"][1])  # 24h volume
-
-            return NormalizedQuote(
-                venue_name=self.venue_name,
-                token_symbol=symbol_upper,
-                bid=bid_price,
-                ask=ask_price,
-                volume_24h=volume_24h,
-                timestamp=datetime.now(timezone.utc),
+            return self._parse_ticker(
+                symbol_upper, ticker_data, datetime.now(timezone.utc)
             )
 
         except httpx.TimeoutException:
@@ -167,9 +199,97 @@ class KrakenClient(PriceFeed):
             logger.exception(f"Unexpected error fetching Kraken quote for {token_symbol}: {e}")
             return None
 
+    async def _fetch_quotes_uncached(
+        self, token_symbols: list[str]
+    ) -> dict[str, NormalizedQuote]:
+        """Fetch quotes for several tokens with one Ticker request.
+
+        Kraken accepts a comma-separated pair list. Pairs missing from the
+        batched response, or every pair if the batch fails (one unknown
+        pair rejects the whole request), fall back to per-symbol requests.
+
+        Args:
+            token_symbols: Upper-cased normalized token symbols.
+
+        Returns:
+            Mapping of token symbol to quote for tokens with data.
+        """
+        kraken_pairs = {
+            KRAKEN_SYMBOL_MAP[symbol]: symbol
+            for symbol in token_symbols
+            if symbol in KRAKEN_SYMBOL_MAP
+        }
+        if len(kraken_pairs) < 2:
+            return await super()._fetch_quotes_uncached(list(kraken_pairs.values()))
+
+        quotes: dict[str, NormalizedQuote] = {}
+        try:
+            response = await self._get(
+                "/0/public/Ticker",
+                params={"pair": ",".join(kraken_pairs)},
+            )
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+
+            if data.get("error"):
+                logger.error(f"Kraken API error: {data['error']}")
+            else:
+                # Every quote in one response shares its receive time
+                fetched_at = datetime.now(timezone.utc)
+                for pair, ticker_data in data.get("result", {}).items():
+                    symbol = kraken_pairs.get(pair)
+                    if symbol is not None:
+                        quotes[symbol] = self._parse_ticker(symbol, ticker_data, fetched_at)
+
+        except httpx.TimeoutException:
+            logger.error("Timeout fetching Kraken tickers")
+        except httpx.HTTPStatusError as e:
+            logger.error(f"HTTP error fetching Kraken tickers: {e.response.status_code}")
+        except (KeyError, IndexError, ValueError) as e:
+            logger.error(f"Error parsing Kraken tickers response: {e}")
+            quotes.clear()
+        except Exception as e:
+            logger.exception(f"Unexpected error fetching Kraken tickers: {e}")
+
+        missing = [symbol for symbol in kraken_pairs.values() if symbol not in quotes]
+        if missing:
+            quotes.update(await super()._fetch_quotes_uncached(missing))
+        return quotes
+
+    def _parse_ticker(
+        self, symbol: str, ticker_data: dict, fetched_at: datetime
+    ) -> NormalizedQuote:
+        """Build a quote from one Kraken ticker entry.
+
+        Kraken response format:
+        a: [ask_price, whole_lot_volume, lot_volume]
+        b: [bid_price, whole_lot_volume, lot_volume]
+        v: [today_volume, 24h_volume]
+
+        Args:
+            symbol: Upper-cased normalized token symbol.
+            ticker_data: Ticker entry from the result mapping.
+            fetched_at: When the response carrying the entry was received.
+
+        Returns:
+            NormalizedQuote built from the entry.
+
+        Raises:
+            KeyError, IndexError, ValueError: If the entry is malformed.
+        """
+        return NormalizedQuote(
+            venue_name=self.venue_name,
+            token_symbol=symbol,
+            bid=float(ticker_data["b"][0]),
+            ask=float(ticker_data["a"][0]),
+            volume_24h=float(ticker_data["v"][1]),  # 24h volume
+            timestamp=fetched_at,
+        )
+
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Close the HTTP client if this instance created it."""
+        if self._owns_client:
+            await self._client.aclose()
 
     async def __aenter__(self) -> "KrakenClient":
         """Async context manager entry."""
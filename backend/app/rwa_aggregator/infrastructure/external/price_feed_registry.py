@@ -8,10 +8,13 @@ import asyncio
 import logging
 from typing import Optional
 
+import httpx
+
 from app.rwa_aggregator.application.interfaces.price_feed import (
     NormalizedQuote,
     PriceFeed,
 )
+from app.rwa_aggregator.infrastructure.external.quote_cache import RedisQuoteCache
 
 logger = logging.getLogger(__name__)
 
@@ -97,9 +100,12 @@ class PriceFeedRegistry:
     ) -> list[NormalizedQuote]:
         """Fetch quotes from all venues that support the token concurrently.
 
+        Each venue gets its own timeout, so one slow venue only loses its
+        own quote instead of the whole batch.
+
         Args:
             token_symbol: Normalized token symbol.
-            timeout_seconds: Maximum time to wait for all responses.
+            timeout_seconds: Maximum time to wait for each venue.
 
         Returns:
             List of NormalizedQuote from all responding venues.
@@ -112,24 +118,20 @@ class PriceFeedRegistry:
             return []
 
         async def fetch_with_error_handling(feed: PriceFeed) -> Optional[NormalizedQuote]:
-            """Fetch quote with error isolation."""
+            """Fetch quote with error and timeout isolation."""
             try:
-                return await feed.fetch_quote(token_symbol)
+                return await asyncio.wait_for(
+                    feed.fetch_quote(token_symbol), timeout=timeout_seconds
+                )
+            except asyncio.TimeoutError:
+                logger.error(f"Timeout fetching {token_symbol} from {feed.venue_name}")
+                return None
             except Exception as e:
                 logger.error(f"Error fetching from {feed.venue_name}: {e}")
                 return None
 
-        # Fetch from all feeds concurrently with timeout
-        tasks = [fetch_with_error_handling(feed) for feed in feeds]
-
-        try:
-            results = await asyncio.wait_for(
-                asyncio.gather(*tasks, return_exceptions=False),
-                timeout=timeout_seconds,
-            )
-        except asyncio.TimeoutError:
-            logger.error(f"Timeout fetching quotes for {token_symbol}")
-            results = []
+        # Fetch from all feeds concurrently
+        results = await asyncio.gather(*(fetch_with_error_handling(feed) for feed in feeds))
 
         # Filter out None results
         quotes = [r for r in results if r is not None]
@@ -144,28 +146,46 @@ class PriceFeedRegistry:
     ) -> dict[str, list[NormalizedQuote]]:
         """Fetch quotes for multiple tokens from all venues.
 
+        Each venue receives one fetch_quotes call covering every token it
+        supports, so venues with a multi-symbol endpoint answer the whole
+        batch in a single request. Venues are queried concurrently, each
+        with its own timeout.
+
         Args:
             token_symbols: List of token symbols to fetch.
-            timeout_seconds: Maximum time to wait for all responses.
+            timeout_seconds: Maximum time to wait for each venue.
 
         Returns:
-            Dictionary mapping token symbols to lists of quotes.
+            Dictionary mapping each requested token symbol to its quotes.
         """
-        async def fetch_token_quotes(symbol: str) -> tuple[str, list[NormalizedQuote]]:
-            quotes = await self.fetch_all_quotes(symbol, timeout_seconds / 2)
-            return symbol, quotes
+        by_upper = {symbol.upper(): symbol for symbol in token_symbols}
+        results: dict[str, list[NormalizedQuote]] = {s: [] for s in token_symbols}
+
+        async def fetch_feed_quotes(feed: PriceFeed) -> dict[str, NormalizedQuote]:
+            """Fetch one venue's quotes with error and timeout isolation."""
+            symbols = [s for s in by_upper if feed.supports_token(s)]
+            if not symbols:
+                return {}
+            try:
+                return await asyncio.wait_for(
+                    feed.fetch_quotes(symbols), timeout=timeout_seconds
+                )
+            except asyncio.TimeoutError:
+                logger.error(f"Timeout fetching multi-token quotes from {feed.venue_name}")
+                return {}
+            except Exception as e:
+                logger.error(f"Error fetching from {feed.venue_name}: {e}")
+                return {}
 
-        tasks = [fetch_token_quotes(symbol) for symbol in token_symbols]
+        per_feed = await asyncio.gather(*(fetch_feed_quotes(feed) for feed in self._feeds))
 
-        try:
-            results = await asyncio.wait_for(
-                asyncio.gather(*tasks),
-                timeout=timeout_seconds,
-            )
-            return dict(results)
-        except asyncio.TimeoutError:
-            logger.error("Timeout fetching multi-token quotes")
-            return {}
+        for quotes in per_feed:
+            for symbol, quote in quotes.items():
+                original = by_upper.get(symbol)
+                if original is not None:
+                    results[original].append(quote)
+
+        return results
 
     def get_best_quote(self, quotes: list[NormalizedQuote]) -> Optional[NormalizedQuote]:
         """Find the quote with the best (tightest) spread.
@@ -211,7 +231,7 @@ class PriceFeedRegistry:
         for feed in self._feeds:
             try:
                 await feed.close()
-                logger.debug(f"Closed feed: {feed.venue_name}")
+                logger.debug("Closed feed: %s", feed.venue_name)
             except Exception as e:
                 logger.error(f"Error closing feed {feed.venue_name}: {e}")
         self._feeds.clear()
@@ -234,6 +254,8 @@ def create_default_registry(
     uniswap_enabled: bool = True,
     uniswap_network: str = "mainnet",
     thegraph_api_key: Optional[str] = None,
+    http_client: Optional[httpx.AsyncClient] = None,
+    quote_cache: Optional[RedisQuoteCache] = None,
 ) -> PriceFeedRegistry:
     """Create a registry with default price feed clients.
 
@@ -249,6 +271,10 @@ def create_default_registry(
         uniswap_enabled: Whether to include Uniswap client.
         uniswap_network: Uniswap network (mainnet, arbitrum, etc.).
         thegraph_api_key: The Graph API key for Uniswap subgraph access.
+        http_client: Shared HTTP client passed to every feed. When omitted,
+            each feed creates (and closes) its own client.
+        quote_cache: Optional Redis quote cache shared across processes,
+            used by the Kraken, Coinbase and Bybit clients.
 
     Returns:
         Configured PriceFeedRegistry instance.
@@ -261,24 +287,27 @@ def create_default_registry(
     registry = PriceFeedRegistry()
 
     if kraken_enabled:
-        registry.register(KrakenClient())
+        registry.register(KrakenClient(client=http_client, shared_cache=quote_cache))
 
     if coinbase_enabled:
         registry.register(
             CoinbaseClient(
                 api_key=coinbase_api_key,
                 api_secret=coinbase_api_secret,
+                client=http_client,
+                shared_cache=quote_cache,
             )
         )
 
     if bybit_enabled:
-        registry.register(BybitClient())
+        registry.register(BybitClient(client=http_client, shared_cache=quote_cache))
 
     if uniswap_enabled:
         registry.register(
             UniswapClient(
                 network=uniswap_network,
                 api_key=thegraph_api_key,
+                client=http_client,
             )
         )
 
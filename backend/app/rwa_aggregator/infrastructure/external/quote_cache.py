@@ -0,0 +1,334 @@
+"""Short-lived quote cache shared by the CEX price feed clients.
+
+Venues refresh their tickers roughly once a second, yet the aggregator can
+ask the same venue for the same symbol several times within one burst.
+TTLQuoteCacheMixin keeps the last quote per (venue, symbol) in a
+process-wide cache so those bursts collapse to a single HTTP call.
+
+With several web or worker processes, an optional RedisQuoteCache adds a
+second tier so one process's fetch also serves the others.
+"""
+
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import orjson
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.core.config import get_settings
+from app.rwa_aggregator.application.interfaces.price_feed import NormalizedQuote
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUOTE_TTL_SECONDS = 1.0
+
+# Shared across client instances: {(venue, symbol): (quote, expires_at)}
+_QUOTE_CACHE: Dict[Tuple[str, str], Tuple[NormalizedQuote, float]] = {}
+
+# In-flight fetches per (venue, symbol), so concurrent misses share one call
+# even when caching is disabled
+_INFLIGHT: Dict[Tuple[str, str], "asyncio.Future[Optional[NormalizedQuote]]"] = {}
+
+# Process-wide Redis tier handed out by get_shared_quote_cache()
+_shared_quote_cache: Optional["RedisQuoteCache"] = None
+
+
+class _FetchAbandoned(Exception):
+    """Set on an in-flight fetch whose leading caller was cancelled."""
+
+
+def invalidate_quote_cache() -> None:
+    """Drop every quote cached in this process."""
+    _QUOTE_CACHE.clear()
+
+
+class RedisQuoteCache:
+    """Cross-process quote cache backed by Redis.
+
+    Quotes are stored as JSON under ``quote:{venue}:{symbol}`` with a
+    millisecond expiry. Redis failures and undecodable entries are logged
+    and treated as misses so the cache never blocks price fetching.
+    """
+
+    def __init__(self, client: aioredis.Redis) -> None:
+        """Initialize the cache.
+
+        Args:
+            client: Async Redis client, closed by close().
+        """
+        self._client = client
+
+    @staticmethod
+    def _key(venue_name: str, token_symbol: str) -> str:
+        """Build the Redis key for a venue and symbol."""
+        return f"quote:{venue_name}:{token_symbol}"
+
+    async def get_many(
+        self, venue_name: str, token_symbols: List[str]
+    ) -> Dict[str, NormalizedQuote]:
+        """Retrieve cached quotes for several symbols of one venue.
+
+        Args:
+            venue_name: Venue the quotes belong to.
+            token_symbols: Upper-cased token symbols.
+
+        Returns:
+            Mapping of token symbol to quote for the symbols found.
+        """
+        if not token_symbols:
+            return {}
+        try:
+            values = await self._client.mget(
+                [self._key(venue_name, s) for s in token_symbols]
+            )
+        except RedisError as e:
+            logger.warning(f"Redis quote cache read failed: {e}")
+            return {}
+        quotes: Dict[str, NormalizedQuote] = {}
+        for symbol, value in zip(token_symbols, values, strict=True):
+            if value is None:
+                continue
+            try:
+                quotes[symbol] = self._decode(value)
+            except (ValueError, KeyError, TypeError) as e:
+                # Malformed or old-schema entry: treat as a miss
+                logger.warning(f"Undecodable cached quote for {venue_name}/{symbol}: {e}")
+        return quotes
+
+    async def set_many(
+        self, quotes: Iterable[NormalizedQuote], ttl_seconds: float
+    ) -> None:
+        """Store quotes with a shared expiry.
+
+        Args:
+            quotes: Quotes to cache, keyed by their venue and symbol.
+            ttl_seconds: Seconds until the entries expire.
+        """
+        ttl_ms = int(ttl_seconds * 1000)
+        if ttl_ms <= 0:
+            return
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                for quote in quotes:
+                    pipe.set(
+                        self._key(quote.venue_name, quote.token_symbol),
+                        self._encode(quote),
+                        px=ttl_ms,
+                    )
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Redis quote cache write failed: {e}")
+
+    async def close(self) -> None:
+        """Close the Redis client."""
+        await self._client.aclose()
+
+    @staticmethod
+    def _encode(quote: NormalizedQuote) -> bytes:
+        """Serialize a quote; orjson writes datetimes as ISO 8601."""
+        return orjson.dumps({
+            "venue_name": quote.venue_name,
+            "token_symbol": quote.token_symbol,
+            "bid": quote.bid,
+            "ask": quote.ask,
+            "volume_24h": quote.volume_24h,
+            "timestamp": quote.timestamp,
+        })
+
+    @staticmethod
+    def _decode(value: bytes) -> NormalizedQuote:
+        """Deserialize a quote written by _encode."""
+        data = orjson.loads(value)
+        data["timestamp"] = datetime.fromisoformat(data["timestamp"])
+        return NormalizedQuote(**data)
+
+
+def get_shared_quote_cache() -> Optional[RedisQuoteCache]:
+    """Return the process-wide Redis quote cache, if enabled in settings.
+
+    Returns:
+        The shared RedisQuoteCache, or None when shared_quote_cache_enabled
+        is off.
+    """
+    global _shared_quote_cache
+    settings = get_settings()
+    if not settings.shared_quote_cache_enabled:
+        return None
+    if _shared_quote_cache is None:
+        _shared_quote_cache = RedisQuoteCache(
+            aioredis.from_url(str(settings.redis_url))
+        )
+    return _shared_quote_cache
+
+
+async def close_shared_quote_cache() -> None:
+    """Close the process-wide Redis quote cache if one was created."""
+    global _shared_quote_cache
+    if _shared_quote_cache is not None:
+        await _shared_quote_cache.close()
+        _shared_quote_cache = None
+
+
+class TTLQuoteCacheMixin(ABC):
+    """Serve fetch_quote from a per-(venue, symbol) TTL cache.
+
+    Clients list the mixin before PriceFeed (which provides venue_name),
+    implement _fetch_quote_uncached, and set _quote_ttl (and optionally
+    _shared_cache) in their constructor. Venues with a multi-symbol
+    endpoint also override _fetch_quotes_uncached. Failed fetches (None)
+    are not cached so the next call retries.
+    """
+
+    _quote_ttl: float = DEFAULT_QUOTE_TTL_SECONDS
+    _shared_cache: Optional[RedisQuoteCache] = None
+
+    @property
+    @abstractmethod
+    def venue_name(self) -> str:
+        """Venue name used in cache keys (provided by the PriceFeed)."""
+        ...
+
+    async def fetch_quote(self, token_symbol: str) -> Optional[NormalizedQuote]:
+        """Fetch a quote, reusing one fetched within the last TTL seconds.
+
+        Args:
+            token_symbol: Normalized token symbol (e.g., "BTC", "USDY").
+
+        Returns:
+            NormalizedQuote with bid, ask, and volume data, or None if unavailable.
+        """
+        symbol = token_symbol.upper()
+        return (await self.fetch_quotes([symbol])).get(symbol)
+
+    async def fetch_quotes(
+        self, token_symbols: Iterable[str]
+    ) -> Dict[str, NormalizedQuote]:
+        """Fetch quotes for several tokens, requesting only cache misses.
+
+        Symbols already being fetched by another caller (single or batch)
+        await that fetch instead of requesting them again.
+
+        Args:
+            token_symbols: Normalized token symbols.
+
+        Returns:
+            Mapping of upper-cased token symbol to quote. Tokens without a
+            quote are omitted.
+        """
+        found: Dict[str, NormalizedQuote] = {}
+        misses: List[str] = []
+        waiting: Dict[str, "asyncio.Future[Optional[NormalizedQuote]]"] = {}
+        for symbol in {s.upper() for s in token_symbols}:
+            key = (self.venue_name, symbol)
+            quote = self._get_fresh(key)
+            if quote is not None:
+                found[symbol] = quote
+            elif (inflight := _INFLIGHT.get(key)) is not None:
+                waiting[symbol] = inflight
+            else:
+                misses.append(symbol)
+
+        if misses:
+            found.update(await self._fetch_misses(misses))
+
+        for symbol, inflight in waiting.items():
+            try:
+                # Shielded so a cancelled waiter does not cancel the shared fetch
+                quote = await asyncio.shield(inflight)
+            except _FetchAbandoned:
+                # The fetching caller was cancelled; retry, possibly as leader
+                quote = await self.fetch_quote(symbol)
+            if quote is not None:
+                found[symbol] = quote
+
+        return found
+
+    async def _fetch_misses(self, token_symbols: List[str]) -> Dict[str, NormalizedQuote]:
+        """Fetch symbols nobody else is fetching, publishing them as in flight."""
+        loop = asyncio.get_running_loop()
+        futures = {symbol: loop.create_future() for symbol in token_symbols}
+        for symbol, future in futures.items():
+            _INFLIGHT[(self.venue_name, symbol)] = future
+        try:
+            fetched = await self._fetch_quotes_cached(token_symbols)
+            for symbol, future in futures.items():
+                future.set_result(fetched.get(symbol))
+            return fetched
+        except asyncio.CancelledError:
+            # Waiters retry instead of inheriting this caller's cancellation
+            self._fail_futures(futures.values(), _FetchAbandoned())
+            raise
+        except Exception as e:
+            self._fail_futures(futures.values(), e)
+            raise
+        finally:
+            for symbol in token_symbols:
+                del _INFLIGHT[(self.venue_name, symbol)]
+
+    @staticmethod
+    def _fail_futures(
+        futures: Iterable["asyncio.Future[Optional[NormalizedQuote]]"],
+        error: BaseException,
+    ) -> None:
+        """Fail in-flight futures, marked retrieved so unawaited ones do not warn."""
+        for future in futures:
+            future.set_exception(error)
+            future.exception()
+
+    async def _fetch_quotes_cached(
+        self, token_symbols: List[str]
+    ) -> Dict[str, NormalizedQuote]:
+        """Resolve local-cache misses from Redis, then from the venue."""
+        found: Dict[str, NormalizedQuote] = {}
+        if self._shared_cache is not None:
+            found = await self._shared_cache.get_many(self.venue_name, token_symbols)
+            for quote in found.values():
+                self._store_quote(quote)
+
+        misses = [s for s in token_symbols if s not in found]
+        if misses:
+            fetched = await self._fetch_quotes_uncached(misses)
+            for quote in fetched.values():
+                self._store_quote(quote)
+            if fetched and self._shared_cache is not None:
+                await self._shared_cache.set_many(fetched.values(), self._quote_ttl)
+            found.update(fetched)
+
+        return found
+
+    @abstractmethod
+    async def _fetch_quote_uncached(self, token_symbol: str) -> Optional[NormalizedQuote]:
+        """Fetch a quote from the venue, bypassing the cache."""
+        ...
+
+    async def _fetch_quotes_uncached(
+        self, token_symbols: List[str]
+    ) -> Dict[str, NormalizedQuote]:
+        """Fetch quotes for several upper-cased symbols, bypassing the cache.
+
+        The default issues one request per symbol concurrently.
+        """
+        quotes = await asyncio.gather(
+            *(self._fetch_quote_uncached(symbol) for symbol in token_symbols)
+        )
+        return {s: q for s, q in zip(token_symbols, quotes, strict=True) if q is not None}
+
+    def _store_quote(self, quote: NormalizedQuote) -> None:
+        """Cache a quote under its venue and symbol."""
+        if self._quote_ttl > 0:
+            key = (quote.venue_name, quote.token_symbol)
+            _QUOTE_CACHE[key] = (quote, time.monotonic() + self._quote_ttl)
+
+    @staticmethod
+    def _get_fresh(key: Tuple[str, str]) -> Optional[NormalizedQuote]:
+        """Return the cached quote for a key if it has not expired."""
+        entry = _QUOTE_CACHE.get(key)
+        if entry is not None and entry[1] > time.monotonic():
+            return entry[0]
+        return None
@@ -0,0 +1,82 @@
+"""Client-side token-bucket rate limiting for venue APIs.
+
+Venues answer bursts above their public limits with 429s, each one a
+wasted round trip. AsyncRateLimiter spaces requests out before they are
+sent so gathered fetches stay within the documented budget.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Optional
+
+
+class AsyncRateLimiter:
+    """Token bucket allowing max_rate acquisitions per time_period.
+
+    The bucket starts full, so a burst of up to ``burst`` requests goes out
+    immediately; later requests wait for tokens to refill. Waiters are
+    served in arrival order. Use as ``async with limiter:``.
+
+    Instances are safe to hold at module level: the internal lock is
+    created per running event loop, so a limiter shared by Celery's
+    per-process loop and a test's fresh loop never awaits a lock bound to
+    another loop.
+    """
+
+    def __init__(
+        self,
+        max_rate: float,
+        time_period: float = 1.0,
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            max_rate: Requests allowed per time_period.
+            time_period: Window length in seconds.
+            burst: Bucket size, i.e. requests allowed back to back.
+                Defaults to max_rate.
+            clock: Monotonic time source in seconds; injectable for tests.
+            sleep: Coroutine used to wait for refills; injectable for tests.
+        """
+        self._capacity = max_rate if burst is None else burst
+        self._refill_per_second = max_rate / time_period
+        self._tokens = self._capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated_at = clock()
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Return the lock for the running event loop, creating it lazily."""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent and consume one token."""
+        async with self._get_lock():
+            while True:
+                now = self._clock()
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._updated_at) * self._refill_per_second,
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await self._sleep((1 - self._tokens) / self._refill_per_second)
+
+    async def __aenter__(self) -> None:
+        """Acquire a token on entry."""
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Nothing to release; tokens refill over time."""
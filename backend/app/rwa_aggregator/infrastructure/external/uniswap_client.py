@@ -7,10 +7,10 @@ Rate limit: ~1000 queries/minute.
 
 import logging
 from datetime import datetime, timezone
-from decimal import Decimal
 from typing import Optional
 
 import httpx
+import orjson
 
 from app.rwa_aggregator.application.interfaces.price_feed import (
     NormalizedQuote,
@@ -81,7 +81,7 @@ class UniswapClient(PriceFeed):
     Free tier provides 100,000 queries/month.
 
     Attributes:
-        _client: httpx AsyncClient for GraphQL requests.
+        _client: httpx AsyncClient for GraphQL requests (may be shared).
         _subgraph_url: The Graph endpoint URL.
         _network: Network name (mainnet, arbitrum, etc.).
         _api_key: The Graph API key (required for gateway access).
@@ -92,6 +92,7 @@ class UniswapClient(PriceFeed):
         network: str = "mainnet",
         api_key: Optional[str] = None,
         timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        client: Optional[httpx.AsyncClient] = None,
     ) -> None:
         """Initialize the Uniswap client.
 
@@ -99,6 +100,8 @@ class UniswapClient(PriceFeed):
             network: Network to query (mainnet, arbitrum, polygon, optimism).
             api_key: The Graph API key (get from https://thegraph.com/studio/).
             timeout: HTTP request timeout in seconds.
+            client: Shared HTTP client. If omitted, a private client is
+                created and closed by close().
         """
         self._network = network.lower()
         self._api_key = api_key
@@ -116,11 +119,10 @@ class UniswapClient(PriceFeed):
         if api_key:
             headers["Authorization"] = f"Bearer {api_key}"
         
-        self._client = httpx.AsyncClient(
-            timeout=timeout,
-            headers=headers,
-            follow_redirects=True,
-        )
+        self._headers = headers
+        self._timeout = timeout
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient()
 
     @property
     def venue_name(self) -> str:
@@ -138,6 +140,23 @@ class UniswapClient(PriceFeed):
         """
         return token_symbol.upper() in TOKEN_ADDRESSES
 
+    async def _post(self, payload: dict) -> httpx.Response:
+        """POST a GraphQL payload to the subgraph endpoint.
+
+        Args:
+            payload: GraphQL query and variables.
+
+        Returns:
+            The raw HTTP response.
+        """
+        return await self._client.post(
+            self._subgraph_url,
+            json=payload,
+            headers=self._headers,
+            timeout=self._timeout,
+            follow_redirects=True,
+        )
+
     async def fetch_quote(self, token_symbol: str) -> Optional[NormalizedQuote]:
         """Fetch a price quote from Uniswap for the given token.
 
@@ -154,7 +173,7 @@ class UniswapClient(PriceFeed):
         token_address = TOKEN_ADDRESSES.get(symbol_upper)
 
         if not token_address:
-            logger.debug(f"Uniswap: No known address for token: {token_symbol}")
+            logger.debug("Uniswap: No known address for token: %s", token_symbol)
             return None
 
         try:
@@ -179,7 +198,7 @@ class UniswapClient(PriceFeed):
 
             # Estimate bid/ask spread based on fee tier
             spread_bps = FEE_TIER_SPREAD_BPS.get(fee_tier, 60)
-            half_spread = mid_price * Decimal(spread_bps) / Decimal("20000")
+            half_spread = mid_price * spread_bps / 20000.0
 
             bid_price = mid_price - half_spread
             ask_price = mid_price + half_spread
@@ -189,7 +208,7 @@ class UniswapClient(PriceFeed):
                 token_symbol=symbol_upper,
                 bid=bid_price,
                 ask=ask_price,
-                volume_24h=Decimal(str(volume_24h)) if volume_24h else None,
+                volume_24h=volume_24h if volume_24h else None,
                 timestamp=datetime.now(timezone.utc),
             )
 
@@ -270,9 +289,9 @@ class UniswapClient(PriceFeed):
             },
         }
 
-        response = await self._client.post(self._subgraph_url, json=payload)
+        response = await self._post(payload)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
 
         if "errors" in data:
             logger.error(f"GraphQL errors: {data['errors']}")
@@ -326,12 +345,12 @@ class UniswapClient(PriceFeed):
                 "variables": {"token": token_address.lower()},
             }
 
-            response = await self._client.post(self._subgraph_url, json=payload)
+            response = await self._post(payload)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             if "errors" in data:
-                logger.debug(f"GraphQL fallback errors: {data['errors']}")
+                logger.debug("GraphQL fallback errors: %s", data["errors"])
                 return None
 
             result = data.get("data", {})
@@ -339,7 +358,7 @@ class UniswapClient(PriceFeed):
             return pools if pools else None
 
         except Exception as e:
-            logger.debug(f"Fallback query failed: {e}")
+            logger.debug("Fallback query failed: %s", e)
             return None
 
     def _calculate_price_from_pools(
@@ -368,7 +387,6 @@ class UniswapClient(PriceFeed):
 
         best_pool = pools_sorted[0]
         token0_id = best_pool["token0"]["id"].lower()
-        token1_id = best_pool["token1"]["id"].lower()
 
         # Determine if our token is token0 or token1
         if token0_id == token_address.lower():
@@ -379,7 +397,7 @@ class UniswapClient(PriceFeed):
             price_str = best_pool["token0Price"]
 
         try:
-            price = Decimal(price_str)
+            price = float(price_str)
             volume_usd = float(best_pool.get("volumeUSD", "0"))
             fee_tier = int(best_pool.get("feeTier", "3000"))
 
@@ -427,9 +445,9 @@ class UniswapClient(PriceFeed):
                 "variables": {"pool": pool_address.lower()},
             }
 
-            response = await self._client.post(self._subgraph_url, json=payload)
+            response = await self._post(payload)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             return data.get("data", {}).get("pool")
 
@@ -438,8 +456,9 @@ class UniswapClient(PriceFeed):
             return None
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Close the HTTP client if this instance created it."""
+        if self._owns_client:
+            await self._client.aclose()
 
     async def __aenter__(self) -> "UniswapClient":
         """Async context manager entry."""
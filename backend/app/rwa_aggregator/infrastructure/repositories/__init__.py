@@ -4,6 +4,12 @@ This module exports concrete repository implementations that fulfill
 the abstract interfaces defined in the domain layer.
 """
 
+from app.rwa_aggregator.infrastructure.repositories.cached_token_repository import (
+    CachedTokenRepository,
+)
+from app.rwa_aggregator.infrastructure.repositories.cached_venue_repository import (
+    CachedVenueRepository,
+)
 from app.rwa_aggregator.infrastructure.repositories.sql_alert_repository import (
     SqlAlertRepository,
 )
@@ -22,4 +28,6 @@ __all__ = [
     "SqlVenueRepository",
     "SqlPriceRepository",
     "SqlAlertRepository",
+    "CachedTokenRepository",
+    "CachedVenueRepository",
 ]
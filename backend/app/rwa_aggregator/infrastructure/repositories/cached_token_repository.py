@@ -0,0 +1,185 @@
+"""TTL-cached decorator for TokenRepository.
+
+The token set is small and rarely changes, yet price and alert requests
+resolve tokens by symbol or ID on every call. CachedTokenRepository
+memoizes those lookups process-wide so the hot path skips SQL after warm-up.
+"""
+
+import asyncio
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.rwa_aggregator.domain.entities.token import Token, TokenCategory
+from app.rwa_aggregator.domain.repositories.token_repository import TokenRepository
+
+DEFAULT_TOKEN_CACHE_TTL_SECONDS = 300.0
+
+# Shared across requests: {symbol: (token, expires_at)} and {id: (token, expires_at)}
+_TOKEN_CACHE: Dict[str, Tuple[Token, float]] = {}
+_TOKEN_CACHE_BY_ID: Dict[int, Tuple[Token, float]] = {}
+
+# In-flight lookups per symbol, so concurrent misses share one query
+_INFLIGHT: Dict[str, "asyncio.Future[Optional[Token]]"] = {}
+
+
+class _FillAbandoned(Exception):
+    """Set on an in-flight lookup whose leading caller was cancelled."""
+
+
+def invalidate_token_cache(symbol: Optional[str] = None) -> None:
+    """Drop cached tokens.
+
+    Args:
+        symbol: Token symbol to evict. Evicts every token when None.
+    """
+    if symbol is None:
+        _TOKEN_CACHE.clear()
+        _TOKEN_CACHE_BY_ID.clear()
+        return
+    entry = _TOKEN_CACHE.pop(symbol.upper(), None)
+    if entry is not None and entry[0].id is not None:
+        _TOKEN_CACHE_BY_ID.pop(entry[0].id, None)
+
+
+class CachedTokenRepository(TokenRepository):
+    """TokenRepository decorator that memoizes lookups by symbol and ID.
+
+    Single and batch lookups by symbol or ID are served from the cache;
+    list queries pass through. Unknown tokens are not cached so newly
+    added ones appear immediately. Saving a token evicts its entries.
+    """
+
+    def __init__(
+        self,
+        inner: TokenRepository,
+        ttl: float = DEFAULT_TOKEN_CACHE_TTL_SECONDS,
+    ) -> None:
+        """Initialize the decorator.
+
+        Args:
+            inner: Repository used for cache misses and writes.
+            ttl: Seconds a cached token stays fresh.
+        """
+        self._inner = inner
+        self._ttl = ttl
+
+    async def get_by_id(self, token_id: int) -> Optional[Token]:
+        """Retrieve a token by its database ID, using the cache when fresh."""
+        return (await self.get_by_ids([token_id])).get(token_id)
+
+    async def get_by_ids(self, token_ids: Iterable[int]) -> Dict[int, Token]:
+        """Retrieve several tokens by ID, fetching only cache misses."""
+        now = time.monotonic()
+        found: Dict[int, Token] = {}
+        misses: List[int] = []
+        for token_id in set(token_ids):
+            entry = _TOKEN_CACHE_BY_ID.get(token_id)
+            if entry is not None and entry[1] > now:
+                found[token_id] = entry[0]
+            else:
+                misses.append(token_id)
+
+        if misses:
+            fetched = await self._inner.get_by_ids(misses)
+            for token in fetched.values():
+                self._store(token)
+            found.update(fetched)
+
+        return found
+
+    async def get_by_symbol(self, symbol: str) -> Optional[Token]:
+        """Retrieve a token by its symbol, using the cache when fresh."""
+        symbol = symbol.upper()
+        token = self._get_fresh(symbol)
+        if token is not None:
+            return token
+
+        while (inflight := _INFLIGHT.get(symbol)) is not None:
+            try:
+                # Shielded so a cancelled waiter does not cancel the shared lookup
+                return await asyncio.shield(inflight)
+            except _FillAbandoned:
+                # The querying caller was cancelled; retry, possibly as leader
+                continue
+
+        inflight = asyncio.get_running_loop().create_future()
+        _INFLIGHT[symbol] = inflight
+        try:
+            token = await self._inner.get_by_symbol(symbol)
+            if token is not None:
+                self._store(token)
+            inflight.set_result(token)
+            return token
+        except asyncio.CancelledError:
+            # Waiters retry instead of inheriting this caller's cancellation
+            inflight.set_exception(_FillAbandoned())
+            inflight.exception()
+            raise
+        except Exception as e:
+            inflight.set_exception(e)
+            # Mark retrieved so a lookup nobody else awaited does not warn
+            inflight.exception()
+            raise
+        finally:
+            if _INFLIGHT.get(symbol) is inflight:
+                del _INFLIGHT[symbol]
+
+    async def get_by_symbols(self, symbols: Iterable[str]) -> Dict[str, Token]:
+        """Retrieve several tokens by symbol, fetching only cache misses."""
+        found: Dict[str, Token] = {}
+        misses: List[str] = []
+        for symbol in {s.upper() for s in symbols}:
+            token = self._get_fresh(symbol)
+            if token is not None:
+                found[symbol] = token
+            else:
+                misses.append(symbol)
+
+        if misses:
+            fetched = await self._inner.get_by_symbols(misses)
+            for token in fetched.values():
+                self._store(token)
+            found.update(fetched)
+
+        return found
+
+    async def get_all_active(self) -> List[Token]:
+        """Retrieve all tokens that are currently active."""
+        return await self._inner.get_all_active()
+
+    async def get_by_category(self, category: TokenCategory) -> List[Token]:
+        """Retrieve all active tokens in a specific category."""
+        return await self._inner.get_by_category(category)
+
+    async def get_all_active_tradable(self) -> List[Token]:
+        """Retrieve all active tokens that have tradable pairs."""
+        return await self._inner.get_all_active_tradable()
+
+    async def get_all_active_nav_only(self) -> List[Token]:
+        """Retrieve all active tokens that are NAV-only (informational)."""
+        return await self._inner.get_all_active_nav_only()
+
+    async def save(self, token: Token) -> Token:
+        """Persist a token entity and evict its cache entry."""
+        saved = await self._inner.save(token)
+        # Evict by ID as well, in case the symbol itself changed
+        previous = _TOKEN_CACHE_BY_ID.pop(saved.id, None) if saved.id is not None else None
+        if previous is not None:
+            invalidate_token_cache(previous[0].symbol)
+        invalidate_token_cache(saved.symbol)
+        return saved
+
+    def _store(self, token: Token) -> None:
+        """Cache a token under both its symbol and its ID."""
+        entry = (token, time.monotonic() + self._ttl)
+        _TOKEN_CACHE[token.symbol.upper()] = entry
+        if token.id is not None:
+            _TOKEN_CACHE_BY_ID[token.id] = entry
+
+    @staticmethod
+    def _get_fresh(symbol: str) -> Optional[Token]:
+        """Return the cached token for a symbol if it has not expired."""
+        entry = _TOKEN_CACHE.get(symbol)
+        if entry is not None and entry[1] > time.monotonic():
+            return entry[0]
+        return None
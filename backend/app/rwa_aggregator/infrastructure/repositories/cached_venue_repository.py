@@ -0,0 +1,95 @@
+"""TTL-cached decorator for VenueRepository.
+
+Venues change rarely, but every dashboard and price request resolves them.
+CachedVenueRepository keeps ID lookups in a process-wide cache so steady-state
+requests skip venue queries entirely.
+"""
+
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.rwa_aggregator.domain.entities.venue import Venue
+from app.rwa_aggregator.domain.repositories.venue_repository import VenueRepository
+
+DEFAULT_VENUE_CACHE_TTL_SECONDS = 300.0
+
+# Shared across requests: {venue_id: (venue, expires_at)}
+_VENUE_CACHE: Dict[int, Tuple[Venue, float]] = {}
+
+
+def invalidate_venue_cache(venue_id: Optional[int] = None) -> None:
+    """Drop cached venues.
+
+    Args:
+        venue_id: Venue to evict. Evicts every venue when None.
+    """
+    if venue_id is None:
+        _VENUE_CACHE.clear()
+    else:
+        _VENUE_CACHE.pop(venue_id, None)
+
+
+class CachedVenueRepository(VenueRepository):
+    """VenueRepository decorator that memoizes lookups by venue ID.
+
+    Only get_by_id and get_by_ids are served from the cache; other queries
+    pass straight through to the wrapped repository. Saving a venue evicts
+    its cache entry.
+    """
+
+    def __init__(
+        self,
+        inner: VenueRepository,
+        ttl: float = DEFAULT_VENUE_CACHE_TTL_SECONDS,
+    ) -> None:
+        """Initialize the decorator.
+
+        Args:
+            inner: Repository used for cache misses and writes.
+            ttl: Seconds a cached venue stays fresh.
+        """
+        self._inner = inner
+        self._ttl = ttl
+
+    async def get_by_id(self, venue_id: int) -> Optional[Venue]:
+        """Retrieve a venue by its database ID, using the cache when fresh."""
+        return (await self.get_by_ids([venue_id])).get(venue_id)
+
+    async def get_by_ids(self, venue_ids: Iterable[int]) -> Dict[int, Venue]:
+        """Retrieve several venues by ID, fetching only cache misses."""
+        now = time.monotonic()
+        found: Dict[int, Venue] = {}
+        misses: List[int] = []
+        for venue_id in set(venue_ids):
+            entry = _VENUE_CACHE.get(venue_id)
+            if entry is not None and entry[1] > now:
+                found[venue_id] = entry[0]
+            else:
+                misses.append(venue_id)
+
+        if misses:
+            fetched = await self._inner.get_by_ids(misses)
+            expires_at = now + self._ttl
+            for venue_id, venue in fetched.items():
+                _VENUE_CACHE[venue_id] = (venue, expires_at)
+            found.update(fetched)
+
+        return found
+
+    async def get_by_name(self, name: str) -> Optional[Venue]:
+        """Retrieve a venue by its display name."""
+        return await self._inner.get_by_name(name)
+
+    async def get_all_active(self) -> List[Venue]:
+        """Retrieve all venues that are currently active."""
+        return await self._inner.get_all_active()
+
+    async def get_venues_for_token(self, token_id: int) -> List[Venue]:
+        """Retrieve all active venues that provide prices for a token."""
+        return await self._inner.get_venues_for_token(token_id)
+
+    async def save(self, venue: Venue) -> Venue:
+        """Persist a venue entity and evict its cache entry."""
+        saved = await self._inner.save(venue)
+        invalidate_venue_cache(saved.id)
+        return saved
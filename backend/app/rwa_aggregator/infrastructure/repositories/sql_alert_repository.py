@@ -4,17 +4,21 @@ Provides async database operations for Alert entities using
 SQLAlchemy 2.0 async patterns with asyncpg driver.
 """
 
+import re
 from decimal import Decimal
 from typing import List, Optional
 
-from sqlalchemy import delete, select, distinct
+from sqlalchemy import distinct, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.rwa_aggregator.domain.entities.alert import Alert, AlertStatus, AlertType
+from app.rwa_aggregator.domain.entities.alert import Alert, AlertStatus
 from app.rwa_aggregator.domain.repositories.alert_repository import AlertRepository
 from app.rwa_aggregator.domain.value_objects.email_address import EmailAddress
 from app.rwa_aggregator.infrastructure.db.models import AlertModel
 
+# Legacy rows stored the dataclass repr, e.g. "EmailAddress(value='a@b.co')"
+_LEGACY_EMAIL_REPR = re.compile(r"value='([^']+)'")
+
 
 class SqlAlertRepository(AlertRepository):
     """SQLAlchemy-based implementation of the AlertRepository interface."""
@@ -99,6 +103,30 @@ class SqlAlertRepository(AlertRepository):
             await self._session.flush()
             return self._to_entity(model)
 
+    async def save_many(self, alerts: List[Alert]) -> List[Alert]:
+        """Insert several new alerts with a single INSERT ... RETURNING."""
+        if not alerts:
+            return []
+        if any(a.id is not None for a in alerts):
+            raise ValueError("save_many only inserts new alerts (id must be None)")
+
+        rows = [
+            {
+                "email": a.email.value.lower(),
+                "token_id": a.token_id,
+                "threshold_pct": a.threshold_pct,
+                "alert_type": a.alert_type,
+                "status": a.status,
+                "last_triggered_at": a.last_triggered_at,
+                "created_at": a.created_at,
+                "cooldown_hours": a.cooldown_hours,
+            }
+            for a in alerts
+        ]
+        stmt = insert(AlertModel).returning(AlertModel, sort_by_parameter_order=True)
+        result = await self._session.scalars(stmt, rows)
+        return [self._to_entity(m) for m in result.all()]
+
     async def delete(self, alert_id: int) -> bool:
         """Delete an alert by its ID.
 
@@ -121,14 +149,13 @@ class SqlAlertRepository(AlertRepository):
         email_str = str(model.email)
         # If somehow stored as dataclass representation, extract the actual email
         if email_str.startswith("emailaddress(value="):
-            import re
-            match = re.search(r"value='([^']+)'", email_str)
+            match = _LEGACY_EMAIL_REPR.search(email_str)
             if match:
                 email_str = match.group(1)
         
         return Alert(
             id=model.id,
-            email=EmailAddress(email_str),
+            email=EmailAddress.from_trusted(email_str),
             token_id=model.token_id,
             threshold_pct=Decimal(str(model.threshold_pct)),
             alert_type=model.alert_type,
@@ -5,10 +5,9 @@ SQLAlchemy 2.0 async patterns with asyncpg driver.
 """
 
 from datetime import datetime
-from decimal import Decimal
 from typing import List, Optional
 
-from sqlalchemy import and_, desc, distinct, select
+from sqlalchemy import desc, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.rwa_aggregator.domain.entities.price_snapshot import PriceSnapshot
@@ -30,39 +29,22 @@ class SqlPriceRepository(PriceRepository):
     async def get_latest_for_token(self, token_id: int) -> List[PriceSnapshot]:
         """Get the latest price snapshot from each venue for a token.
 
-        Uses a correlated subquery to efficiently find the most recent
-        snapshot per venue.
+        DISTINCT ON (venue_id) walks ix_price_snapshots_token_venue_time and
+        keeps the newest row per venue, however old, so callers can still
+        flag stale venues.
         """
-        # Subquery to get max fetched_at per venue for this token
-        latest_subq = (
-            select(
+        stmt = (
+            select(PriceSnapshotModel)
+            .where(PriceSnapshotModel.token_id == token_id)
+            .distinct(PriceSnapshotModel.venue_id)
+            .order_by(
                 PriceSnapshotModel.venue_id,
-                PriceSnapshotModel.token_id,
-                # Use func.max for aggregate
-                PriceSnapshotModel.fetched_at,
+                desc(PriceSnapshotModel.fetched_at),
             )
-            .where(PriceSnapshotModel.token_id == token_id)
-            .group_by(PriceSnapshotModel.venue_id, PriceSnapshotModel.token_id)
-        ).subquery()
-
-        # Alternative approach: use DISTINCT ON equivalent via window functions
-        # For better cross-database compatibility, use row_number approach
-        from sqlalchemy import func
-
-        # Get distinct venue_ids for this token
-        venue_ids_stmt = select(distinct(PriceSnapshotModel.venue_id)).where(
-            PriceSnapshotModel.token_id == token_id
         )
-        venue_result = await self._session.execute(venue_ids_stmt)
-        venue_ids = [row[0] for row in venue_result.fetchall()]
-
-        snapshots = []
-        for venue_id in venue_ids:
-            snapshot = await self.get_latest_for_token_venue(token_id, venue_id)
-            if snapshot:
-                snapshots.append(snapshot)
 
-        return snapshots
+        result = await self._session.execute(stmt)
+        return [self._to_entity(m) for m in result.scalars().all()]
 
     async def get_latest_for_token_venue(
         self, token_id: int, venue_id: int
@@ -90,19 +72,36 @@ class SqlPriceRepository(PriceRepository):
         return self._to_entity(model)
 
     async def save_batch(self, snapshots: List[PriceSnapshot]) -> List[PriceSnapshot]:
-        """Persist multiple price snapshots in a single operation."""
+        """Persist multiple price snapshots with a single INSERT ... RETURNING.
+
+        Spreads for the whole batch are computed while building the rows,
+        and generated IDs come back from the insert itself instead of one
+        refresh round trip per snapshot.
+        """
         if not snapshots:
             return []
 
-        models = [self._to_model(s) for s in snapshots]
-        self._session.add_all(models)
-        await self._session.flush()
+        rows = [self._to_row(s) for s in snapshots]
+        stmt = insert(PriceSnapshotModel).returning(
+            PriceSnapshotModel, sort_by_parameter_order=True
+        )
+        result = await self._session.scalars(stmt, rows)
+        return [self._to_entity(m) for m in result.all()]
 
-        # Refresh all models to get generated IDs
-        for model in models:
-            await self._session.refresh(model)
+    async def bulk_insert(self, snapshots: List[PriceSnapshot]) -> int:
+        """Insert many price snapshots with one executemany INSERT.
 
-        return [self._to_entity(m) for m in models]
+        Without RETURNING, asyncpg pipelines the rows through a single
+        prepared statement inside the session's transaction.
+        """
+        if not snapshots:
+            return 0
+
+        await self._session.execute(
+            insert(PriceSnapshotModel),
+            [self._to_row(s) for s in snapshots],
+        )
+        return len(snapshots)
 
     async def get_history(
         self,
@@ -130,17 +129,35 @@ class SqlPriceRepository(PriceRepository):
         return [self._to_entity(m) for m in models]
 
     def _to_entity(self, model: PriceSnapshotModel) -> PriceSnapshot:
-        """Convert a PriceSnapshotModel to a PriceSnapshot domain entity."""
+        """Convert a PriceSnapshotModel to a PriceSnapshot domain entity.
+
+        Numeric columns already load as Decimal, so values are passed
+        through without a string round-trip.
+        """
         return PriceSnapshot(
             id=model.id,
             token_id=model.token_id,
             venue_id=model.venue_id,
-            bid=Decimal(str(model.bid)),
-            ask=Decimal(str(model.ask)),
-            volume_24h=Decimal(str(model.volume_24h)) if model.volume_24h else None,
+            bid=model.bid,
+            ask=model.ask,
+            volume_24h=model.volume_24h if model.volume_24h else None,
             fetched_at=model.fetched_at,
         )
 
+    @staticmethod
+    def _to_row(entity: PriceSnapshot) -> dict:
+        """Convert a new PriceSnapshot to an insert parameter row."""
+        return {
+            "token_id": entity.token_id,
+            "venue_id": entity.venue_id,
+            "bid": entity.bid,
+            "ask": entity.ask,
+            "mid": entity.mid,
+            "spread_pct": entity.spread.percentage,
+            "volume_24h": entity.volume_24h,
+            "fetched_at": entity.fetched_at,
+        }
+
     def _to_model(self, entity: PriceSnapshot) -> PriceSnapshotModel:
         """Convert a PriceSnapshot domain entity to a PriceSnapshotModel."""
         return PriceSnapshotModel(
@@ -149,7 +166,7 @@ class SqlPriceRepository(PriceRepository):
             venue_id=entity.venue_id,
             bid=entity.bid,
             ask=entity.ask,
-            mid=entity.mid,  # Calculated property
+            mid=entity.mid,  # Precomputed at construction
             spread_pct=entity.spread.percentage,  # From Spread value object
             volume_24h=entity.volume_24h,
             fetched_at=entity.fetched_at,
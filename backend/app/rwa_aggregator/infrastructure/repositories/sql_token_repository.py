@@ -4,7 +4,7 @@ Provides async database operations for Token entities using
 SQLAlchemy 2.0 async patterns with asyncpg driver.
 """
 
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -32,6 +32,15 @@ class SqlTokenRepository(TokenRepository):
         model = result.scalar_one_or_none()
         return self._to_entity(model) if model else None
 
+    async def get_by_ids(self, token_ids: Iterable[int]) -> Dict[int, Token]:
+        """Retrieve several tokens by ID in a single query."""
+        ids = list(token_ids)
+        if not ids:
+            return {}
+        stmt = select(TokenModel).where(TokenModel.id.in_(ids))
+        result = await self._session.execute(stmt)
+        return {m.id: self._to_entity(m) for m in result.scalars().all()}
+
     async def get_by_symbol(self, symbol: str) -> Optional[Token]:
         """Retrieve a token by its ticker symbol."""
         stmt = select(TokenModel).where(TokenModel.symbol == symbol.upper())
@@ -39,6 +48,15 @@ class SqlTokenRepository(TokenRepository):
         model = result.scalar_one_or_none()
         return self._to_entity(model) if model else None
 
+    async def get_by_symbols(self, symbols: Iterable[str]) -> Dict[str, Token]:
+        """Retrieve several tokens by ticker symbol in a single query."""
+        upper = {s.upper() for s in symbols}
+        if not upper:
+            return {}
+        stmt = select(TokenModel).where(TokenModel.symbol.in_(upper))
+        result = await self._session.execute(stmt)
+        return {m.symbol: self._to_entity(m) for m in result.scalars().all()}
+
     async def get_all_active(self) -> List[Token]:
         """Retrieve all tokens that are currently active."""
         stmt = select(TokenModel).where(TokenModel.is_active == True)  # noqa: E712
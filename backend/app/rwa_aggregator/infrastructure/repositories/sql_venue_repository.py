@@ -4,12 +4,12 @@ Provides async database operations for Venue entities using
 SQLAlchemy 2.0 async patterns with asyncpg driver.
 """
 
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from sqlalchemy import distinct, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.rwa_aggregator.domain.entities.venue import ApiType, Venue, VenueType
+from app.rwa_aggregator.domain.entities.venue import Venue
 from app.rwa_aggregator.domain.repositories.venue_repository import VenueRepository
 from app.rwa_aggregator.infrastructure.db.models import PriceSnapshotModel, VenueModel
 
@@ -32,6 +32,15 @@ class SqlVenueRepository(VenueRepository):
         model = result.scalar_one_or_none()
         return self._to_entity(model) if model else None
 
+    async def get_by_ids(self, venue_ids: Iterable[int]) -> Dict[int, Venue]:
+        """Retrieve several venues by ID in a single query."""
+        ids = list(venue_ids)
+        if not ids:
+            return {}
+        stmt = select(VenueModel).where(VenueModel.id.in_(ids))
+        result = await self._session.execute(stmt)
+        return {m.id: self._to_entity(m) for m in result.scalars().all()}
+
     async def get_by_name(self, name: str) -> Optional[Venue]:
         """Retrieve a venue by its display name."""
         stmt = select(VenueModel).where(VenueModel.name == name)
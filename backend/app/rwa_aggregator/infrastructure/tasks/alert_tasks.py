@@ -1,10 +1,9 @@
 """Celery tasks for alert checking and notification."""
 
-import asyncio
 import logging
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Any, Optional
+from typing import Any
 
 from app.core.config import get_settings
 from app.rwa_aggregator.domain.services.alert_policy import AlertPolicy
@@ -22,7 +21,7 @@ from app.rwa_aggregator.infrastructure.repositories.sql_token_repository import
 from app.rwa_aggregator.infrastructure.repositories.sql_venue_repository import (
     SqlVenueRepository,
 )
-from app.rwa_aggregator.infrastructure.tasks.celery_app import celery_app
+from app.rwa_aggregator.infrastructure.tasks.celery_app import celery_app, run_async
 
 logger = logging.getLogger(__name__)
 
@@ -150,47 +149,80 @@ async def _check_alerts_async() -> dict[str, Any]:
         venues = await venue_repo.get_all_active()
         venue_names = {v.id: v.name for v in venues}
 
+        # One clock read for every staleness and cooldown check in this run
+        now = datetime.now(timezone.utc)
+
+        # Resolve tokens and best prices once per token, not once per alert
+        tokens = await token_repo.get_by_ids({a.token_id for a in alerts})
+        snapshots_by_token = {}
+        for token_id, token in tokens.items():
+            if token.is_nav_only:
+                continue
+            try:
+                # Savepoint so a failed query leaves the transaction usable
+                async with session.begin_nested():
+                    snapshots_by_token[token_id] = (
+                        await price_repo.get_latest_for_token(token_id)
+                    )
+            except Exception as e:
+                # Only this token's alerts are skipped (see the loop below)
+                error_msg = f"Error loading prices for {token.symbol}: {str(e)}"
+                logger.error(error_msg)
+                results["errors"].append(error_msg)
+        best_by_token = calculator.calculate_best_prices_batch(
+            snapshots_by_token, now=now
+        )
+
+        # Evaluate every alert against its token's current spread in one pass.
+        # Previous spreads are not tracked, so any spread below threshold fires.
+        current_by_token = {
+            token_id: best.effective_spread
+            for token_id, best in best_by_token.items()
+            if best.effective_spread is not None
+        }
+        triggered_ids = {
+            a.id for a in policy.evaluate_batch(alerts, current_by_token, now=now)
+        }
+
         for alert in alerts:
             results["alerts_checked"] += 1
 
             try:
                 # Get token info to check if tradable
-                token = await token_repo.get_by_id(alert.token_id)
-                if not token:
-                    logger.debug(f"Token not found for alert token_id={alert.token_id}")
+                alert_token = tokens.get(alert.token_id)
+                if not alert_token:
+                    logger.debug("Token not found for alert token_id=%s", alert.token_id)
                     continue
 
                 # Skip NAV-only tokens - they don't have price data
-                if token.is_nav_only:
+                if alert_token.is_nav_only:
                     logger.debug(
-                        f"Skipping alert for NAV-only token {token.symbol} "
-                        f"(token_id={alert.token_id})"
+                        "Skipping alert for NAV-only token %s (token_id=%s)",
+                        alert_token.symbol,
+                        alert.token_id,
                     )
                     continue
 
-                # Get current prices for the token
-                snapshots = await price_repo.get_latest_for_token(alert.token_id)
+                if alert.token_id not in snapshots_by_token:
+                    # Price load failed; already recorded in results["errors"]
+                    continue
 
-                if not snapshots:
-                    logger.debug(f"No price data for token_id={alert.token_id}")
+                if not snapshots_by_token[alert.token_id]:
+                    logger.debug("No price data for token_id=%s", alert.token_id)
                     continue
 
-                # Calculate best prices
-                best_prices = calculator.calculate_best_prices(snapshots)
+                best_prices = best_by_token[alert.token_id]
 
                 if not best_prices.effective_spread:
                     logger.debug(
-                        f"No fresh spread data for token_id={alert.token_id}"
+                        "No fresh spread data for token_id=%s", alert.token_id
                     )
                     continue
 
-                # For simplicity, we don't track previous spread in this implementation
-                # Just check if current spread is below threshold
                 current_spread = best_prices.effective_spread
 
-                # Check if alert should trigger
-                # Note: We pass None for previous_spread, so it will trigger if below threshold
-                if policy.should_trigger(alert, current_spread, None):
+                # Trigger decision was made by the batch evaluation above
+                if alert.id in triggered_ids:
                     # Token info already fetched above for NAV-only check
                     # Get venue names
                     best_bid_venue = venue_names.get(
@@ -203,7 +235,7 @@ async def _check_alerts_async() -> dict[str, Any]:
                     # Send notification
                     email_sent = await _send_alert_email(
                         to_email=str(alert.email),
-                        token_symbol=token.symbol,
+                        token_symbol=alert_token.symbol,
                         current_spread=current_spread.percentage,
                         best_bid_venue=best_bid_venue,
                         best_bid_price=best_prices.best_bid.bid,
@@ -220,7 +252,7 @@ async def _check_alerts_async() -> dict[str, Any]:
                     results["alerts_triggered"] += 1
 
                     logger.info(
-                        f"Alert triggered for {token.symbol}: "
+                        f"Alert triggered for {alert_token.symbol}: "
                         f"spread {current_spread.percentage:.2f}% < threshold {alert.threshold_pct}%"
                     )
 
@@ -257,7 +289,7 @@ def check_alerts(self) -> dict:
     """
     logger.info("Starting check_alerts task")
     try:
-        result = asyncio.run(_check_alerts_async())
+        result = run_async(_check_alerts_async())
         return result
     except Exception as e:
         logger.exception(f"check_alerts failed: {e}")
@@ -306,7 +338,7 @@ def send_alert_notification(
             }
 
     try:
-        return asyncio.run(_send())
+        return run_async(_send())
     except Exception as e:
         logger.exception(f"send_alert_notification failed: {e}")
         raise
@@ -1,11 +1,20 @@
 """Celery application configuration."""
 
+import asyncio
+from collections.abc import Coroutine
+from typing import Any, Optional, TypeVar
+
 from celery import Celery
 
 from app.core.config import get_settings
 
 settings = get_settings()
 
+T = TypeVar("T")
+
+# Reused across tasks so pooled database connections stay bound to a live loop
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
 celery_app = Celery(
     "rwa_aggregator",
     broker=str(settings.celery_broker_url),
@@ -32,6 +41,10 @@ celery_app.conf.update(
             "task": "app.rwa_aggregator.infrastructure.tasks.alert_tasks.check_alerts",
             "schedule": settings.alert_check_interval_seconds,
         },
+        "ensure-snapshot-partitions-daily": {
+            "task": "app.rwa_aggregator.infrastructure.tasks.maintenance_tasks.ensure_snapshot_partitions",
+            "schedule": 24 * 60 * 60,
+        },
     },
 )
 
@@ -43,3 +56,21 @@ celery_app.autodiscover_tasks(
 )
 
 
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on this worker process's persistent event loop.
+
+    asyncio.run() would create and close a loop per task, orphaning the
+    connections held by the engine's pool. Keeping one loop per process
+    lets every task reuse the pool.
+
+    Args:
+        coro: The coroutine to run to completion.
+
+    Returns:
+        The coroutine's result.
+    """
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        _worker_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_worker_loop)
+    return _worker_loop.run_until_complete(coro)
@@ -0,0 +1,76 @@
+"""Celery tasks for database housekeeping."""
+
+import logging
+from datetime import date, datetime, timezone
+from typing import Any
+
+from sqlalchemy import text
+
+from app.rwa_aggregator.infrastructure.db.session import get_async_session_local
+from app.rwa_aggregator.infrastructure.tasks.celery_app import celery_app, run_async
+
+logger = logging.getLogger(__name__)
+
+# How many months ahead of the current one to keep partitions ready
+PARTITION_MONTHS_AHEAD = 2
+
+
+def _upcoming_months(today: date, months_ahead: int) -> list[date]:
+    """List the first day of this month and the next months_ahead months.
+
+    Args:
+        today: Reference date (UTC).
+        months_ahead: Number of months after the current one to include.
+
+    Returns:
+        First-of-month dates in ascending order.
+    """
+    months = []
+    year, month = today.year, today.month
+    for _ in range(months_ahead + 1):
+        months.append(date(year, month, 1))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+async def _ensure_snapshot_partitions_async() -> dict[str, Any]:
+    """Create any missing monthly price_snapshots partitions.
+
+    Returns:
+        The months that were ensured.
+    """
+    months = _upcoming_months(datetime.now(timezone.utc).date(), PARTITION_MONTHS_AHEAD)
+    session_factory = get_async_session_local()
+    async with session_factory() as session:
+        for month_start in months:
+            await session.execute(
+                text("SELECT ensure_price_snapshot_partition(:month_start)"),
+                {"month_start": month_start},
+            )
+        await session.commit()
+    return {"months": [m.isoformat() for m in months]}
+
+
+@celery_app.task(
+    bind=True,
+    name="app.rwa_aggregator.infrastructure.tasks.maintenance_tasks.ensure_snapshot_partitions",
+)
+def ensure_snapshot_partitions(self) -> dict:
+    """Pre-create price_snapshots partitions for upcoming months.
+
+    Runs daily so a partition exists before the first snapshot of each
+    month arrives. The web leader runs the same job in-process, so
+    deployments without beat are covered too; rows that did fall back to
+    the DEFAULT partition are moved when their month is created.
+
+    Returns:
+        The months that were ensured.
+    """
+    logger.info("Starting ensure_snapshot_partitions task")
+    try:
+        result = run_async(_ensure_snapshot_partitions_async())
+        logger.info(f"Snapshot partitions ensured for {result['months']}")
+        return result
+    except Exception as e:
+        logger.exception(f"ensure_snapshot_partitions failed: {e}")
+        raise
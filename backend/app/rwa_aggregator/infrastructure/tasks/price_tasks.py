@@ -1,17 +1,25 @@
 """Celery tasks for price fetching and aggregation."""
 
-import asyncio
 import logging
 from datetime import datetime, timezone
-from typing import Any
+from decimal import Decimal
+from typing import Any, Optional
+
+import httpx
 
 from app.core.config import get_settings
+from app.rwa_aggregator.application.interfaces.price_feed import NormalizedQuote
 from app.rwa_aggregator.domain.entities.price_snapshot import PriceSnapshot
-from app.rwa_aggregator.domain.entities.token import MarketType
 from app.rwa_aggregator.infrastructure.db.session import get_async_session_local
+from app.rwa_aggregator.infrastructure.external.http_client import (
+    get_shared_http_client,
+)
 from app.rwa_aggregator.infrastructure.external.price_feed_registry import (
     create_default_registry,
 )
+from app.rwa_aggregator.infrastructure.external.quote_cache import (
+    get_shared_quote_cache,
+)
 from app.rwa_aggregator.infrastructure.repositories.sql_price_repository import (
     SqlPriceRepository,
 )
@@ -21,14 +29,51 @@ from app.rwa_aggregator.infrastructure.repositories.sql_token_repository import
 from app.rwa_aggregator.infrastructure.repositories.sql_venue_repository import (
     SqlVenueRepository,
 )
-from app.rwa_aggregator.infrastructure.tasks.celery_app import celery_app
+from app.rwa_aggregator.infrastructure.tasks.celery_app import celery_app, run_async
 
 logger = logging.getLogger(__name__)
 
 
-async def _fetch_all_prices_async() -> dict[str, Any]:
+def _to_snapshot(token_id: int, venue_id: int, quote: NormalizedQuote) -> PriceSnapshot:
+    """Build a snapshot from a venue quote, validating it for storage.
+
+    Args:
+        token_id: ID of the quoted token.
+        venue_id: ID of the quoting venue.
+        quote: Normalized quote from the venue feed.
+
+    Returns:
+        The snapshot, ready for bulk_insert.
+
+    Raises:
+        ValueError: If bid or ask is not positive (no spread can be stored).
+    """
+    snapshot = PriceSnapshot(
+        id=None,
+        token_id=token_id,
+        venue_id=venue_id,
+        # Quotes are floats; str() gives the shortest exact decimal form
+        bid=Decimal(str(quote.bid)),
+        ask=Decimal(str(quote.ask)),
+        volume_24h=Decimal(str(quote.volume_24h)) if quote.volume_24h else None,
+        fetched_at=quote.timestamp,
+    )
+    # Checked here rather than inside bulk_insert (which stores the spread),
+    # where one bad quote would fail the whole cycle's insert
+    if snapshot.bid <= 0 or snapshot.ask <= 0:
+        raise ValueError(f"bid and ask must be positive, got {quote.bid}/{quote.ask}")
+    return snapshot
+
+
+async def _fetch_all_prices_async(
+    http_client: Optional[httpx.AsyncClient] = None,
+) -> dict[str, Any]:
     """Async implementation of price fetching.
 
+    Args:
+        http_client: HTTP client for the venue feeds. Defaults to the
+            process-wide shared client.
+
     Returns:
         Summary of fetched prices.
     """
@@ -49,6 +94,8 @@ async def _fetch_all_prices_async() -> dict[str, Any]:
         bybit_enabled=True,
         uniswap_enabled=True,
         thegraph_api_key=settings.thegraph_api_key or None,
+        http_client=http_client or get_shared_http_client(),
+        quote_cache=get_shared_quote_cache(),
     )
 
     session_factory = get_async_session_local()
@@ -65,19 +112,25 @@ async def _fetch_all_prices_async() -> dict[str, Any]:
         # Build venue name -> id map
         venues = await venue_repo.get_all_active()
         venue_map = {v.name: v.id for v in venues}
-        logger.debug(f"Venue map: {venue_map}")
+        logger.debug("Venue map: %s", venue_map)
 
+        # Skip NAV-only tokens - they don't have active trading pairs
         for token in tokens:
-            # Skip NAV-only tokens - they don't have active trading pairs
-            if token.market_type == MarketType.NAV_ONLY:
+            if token.is_nav_only:
                 logger.info(
                     f"Skipping {token.symbol} - NAV-only token (no active trading pairs)"
                 )
-                continue
+        tradable = [token for token in tokens if not token.is_nav_only]
+
+        # One batched request per venue instead of one per (token, venue)
+        quotes_by_symbol = await registry.fetch_quotes_for_tokens(
+            [token.symbol for token in tradable]
+        )
 
+        pending_snapshots: list[PriceSnapshot] = []
+        for token in tradable:
             try:
-                # Fetch quotes from all venues for this token
-                quotes = await registry.fetch_all_quotes(token.symbol)
+                quotes = quotes_by_symbol.get(token.symbol, [])
                 logger.info(
                     f"Received {len(quotes)} quotes for {token.symbol}"
                 )
@@ -92,25 +145,19 @@ async def _fetch_all_prices_async() -> dict[str, Any]:
                         )
                         continue
 
-                    # Create PriceSnapshot entity
-                    snapshot = PriceSnapshot(
-                        id=None,
-                        token_id=token.id,
-                        venue_id=venue_id,
-                        bid=quote.bid,
-                        ask=quote.ask,
-                        volume_24h=quote.volume_24h,
-                        fetched_at=quote.timestamp,
-                    )
+                    try:
+                        snapshot = _to_snapshot(token.id, venue_id, quote)
+                    except ValueError as e:
+                        error_msg = (
+                            f"Invalid {quote.venue_name} quote for {token.symbol}: {e}"
+                        )
+                        logger.warning(error_msg)
+                        results["errors"].append(error_msg)
+                        continue
                     snapshots_to_save.append(snapshot)
 
-                # Batch save all snapshots for this token
-                if snapshots_to_save:
-                    saved = await price_repo.save_batch(snapshots_to_save)
-                    results["snapshots_created"] += len(saved)
-                    logger.info(
-                        f"Saved {len(saved)} snapshots for {token.symbol}"
-                    )
+                # Queued for one bulk insert covering every token
+                pending_snapshots.extend(snapshots_to_save)
 
                 results["tokens_processed"] += 1
 
@@ -119,7 +166,8 @@ async def _fetch_all_prices_async() -> dict[str, Any]:
                 logger.error(error_msg)
                 results["errors"].append(error_msg)
 
-        # Commit all changes
+        # Insert the whole cycle's snapshots in one statement, then commit
+        results["snapshots_created"] = await price_repo.bulk_insert(pending_snapshots)
         await session.commit()
 
     # Clean up registry
@@ -148,7 +196,7 @@ def fetch_all_prices(self) -> dict:
     """
     logger.info("Starting fetch_all_prices task")
     try:
-        result = asyncio.run(_fetch_all_prices_async())
+        result = run_async(_fetch_all_prices_async())
         return result
     except Exception as e:
         logger.exception(f"fetch_all_prices failed: {e}")
@@ -181,6 +229,8 @@ async def _fetch_price_for_token_async(token_symbol: str) -> dict[str, Any]:
         bybit_enabled=True,
         uniswap_enabled=True,
         thegraph_api_key=settings.thegraph_api_key or None,
+        http_client=get_shared_http_client(),
+        quote_cache=get_shared_quote_cache(),
     )
 
     session_factory = get_async_session_local()
@@ -197,7 +247,7 @@ async def _fetch_price_for_token_async(token_symbol: str) -> dict[str, Any]:
             return results
 
         # Check if token is NAV-only
-        if token.market_type == MarketType.NAV_ONLY:
+        if token.is_nav_only:
             results["errors"].append(
                 f"Token {token_symbol} is NAV-only (no active trading pairs)"
             )
@@ -217,15 +267,13 @@ async def _fetch_price_for_token_async(token_symbol: str) -> dict[str, Any]:
             if venue_id is None:
                 continue
 
-            snapshot = PriceSnapshot(
-                id=None,
-                token_id=token.id,
-                venue_id=venue_id,
-                bid=quote.bid,
-                ask=quote.ask,
-                volume_24h=quote.volume_24h,
-                fetched_at=quote.timestamp,
-            )
+            try:
+                snapshot = _to_snapshot(token.id, venue_id, quote)
+            except ValueError as e:
+                error_msg = f"Invalid {quote.venue_name} quote for {token.symbol}: {e}"
+                logger.warning(error_msg)
+                results["errors"].append(error_msg)
+                continue
             snapshots_to_save.append(snapshot)
 
             results["quotes"].append({
@@ -235,9 +283,7 @@ async def _fetch_price_for_token_async(token_symbol: str) -> dict[str, Any]:
                 "spread_bps": str(quote.spread_bps),
             })
 
-        if snapshots_to_save:
-            saved = await price_repo.save_batch(snapshots_to_save)
-            results["snapshots_created"] = len(saved)
+        results["snapshots_created"] = await price_repo.bulk_insert(snapshots_to_save)
 
         await session.commit()
 
@@ -260,7 +306,7 @@ def fetch_price_for_token(self, token_symbol: str) -> dict:
     """
     logger.info(f"Starting fetch_price_for_token task for {token_symbol}")
     try:
-        result = asyncio.run(_fetch_price_for_token_async(token_symbol))
+        result = run_async(_fetch_price_for_token_async(token_symbol))
         return result
     except Exception as e:
         logger.exception(f"fetch_price_for_token failed: {e}")
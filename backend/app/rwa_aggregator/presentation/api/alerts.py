@@ -2,6 +2,7 @@
 
 Implements CRUD operations for price alerts:
 - POST /api/alerts - Create new alert
+- POST /api/alerts/batch - Create several alerts at once
 - GET /api/alerts - List alerts (optionally by email)
 - GET /api/alerts/{alert_id} - Get single alert
 - DELETE /api/alerts/{alert_id} - Delete an alert
@@ -10,24 +11,35 @@ Implements CRUD operations for price alerts:
 import logging
 from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
-from app.rwa_aggregator.application.dto.alert_dto import AlertDTO, AlertListDTO, CreateAlertRequest
+from app.rwa_aggregator.application.dto.alert_dto import (
+    AlertAdapter,
+    AlertBatchAdapter,
+    AlertDTO,
+    AlertListAdapter,
+    AlertListDTO,
+    CreateAlertRequest,
+    CreateAlertsBatchRequest,
+)
 from app.rwa_aggregator.application.exceptions import (
-    AlertNotFoundError,
     InvalidEmailError,
     TokenNotFoundError,
     TokenNotTradableError,
 )
 from app.rwa_aggregator.application.use_cases.create_alert import (
+    CreateAlertsBatchUseCase,
     CreateAlertUseCase,
     DeleteAlertUseCase,
     GetAlertsByEmailUseCase,
 )
 from app.rwa_aggregator.infrastructure.db.session import get_db_session
+from app.rwa_aggregator.infrastructure.repositories.cached_token_repository import (
+    CachedTokenRepository,
+)
 from app.rwa_aggregator.infrastructure.repositories.sql_alert_repository import SqlAlertRepository
 from app.rwa_aggregator.infrastructure.repositories.sql_token_repository import SqlTokenRepository
 
@@ -38,7 +50,7 @@ router = APIRouter()
 async def create_alert(
     request: CreateAlertRequest,
     session: AsyncSession = Depends(get_db_session),
-) -> AlertDTO:
+) -> Response:
     """Create a new price alert subscription.
 
     Creates an alert that will notify the user via email when the spread
@@ -52,21 +64,25 @@ async def create_alert(
         session: Database session (injected).
 
     Returns:
-        AlertDTO representing the newly created alert.
+        JSON-encoded AlertDTO representing the newly created alert.
 
     Raises:
         HTTPException: 400 if email is invalid or token is not tradable.
         HTTPException: 404 if token not found.
     """
     use_case = CreateAlertUseCase(
-        token_repository=SqlTokenRepository(session),
+        token_repository=CachedTokenRepository(SqlTokenRepository(session)),
         alert_repository=SqlAlertRepository(session),
     )
 
     try:
         result = await use_case.execute(request)
         await session.commit()
-        return result
+        return Response(
+            AlertAdapter.dump_json(result),
+            status_code=status.HTTP_201_CREATED,
+            media_type="application/json",
+        )
     except TokenNotFoundError as e:
         await session.rollback()
         raise HTTPException(
@@ -94,13 +110,73 @@ async def create_alert(
         ) from e
 
 
+@router.post(
+    "/alerts/batch",
+    response_model=list[AlertDTO],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_alerts_batch(
+    request: CreateAlertsBatchRequest,
+    session: AsyncSession = Depends(get_db_session),
+) -> Response:
+    """Create several price alert subscriptions in one request.
+
+    Applies the same validation as POST /alerts to every item, then
+    inserts all alerts in a single statement. If any item is invalid,
+    no alerts are created.
+
+    Args:
+        request: Batch of alert creation requests.
+        session: Database session (injected).
+
+    Returns:
+        JSON-encoded AlertDTOs for the created alerts, in request order.
+
+    Raises:
+        HTTPException: 400 if any email is invalid or any token is not tradable.
+        HTTPException: 404 if any token is not found.
+    """
+    use_case = CreateAlertsBatchUseCase(
+        token_repository=CachedTokenRepository(SqlTokenRepository(session)),
+        alert_repository=SqlAlertRepository(session),
+    )
+
+    try:
+        result = await use_case.execute(request.alerts)
+        await session.commit()
+        return Response(
+            AlertBatchAdapter.dump_json(result),
+            status_code=status.HTTP_201_CREATED,
+            media_type="application/json",
+        )
+    except TokenNotFoundError as e:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=e.message,
+        ) from e
+    except (TokenNotTradableError, InvalidEmailError) as e:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        ) from e
+    except Exception as e:
+        await session.rollback()
+        logger.exception(f"Unexpected error creating alert batch: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create alerts: {str(e)}",
+        ) from e
+
+
 @router.get("/alerts", response_model=AlertListDTO)
 async def list_alerts(
     email: Annotated[Optional[str], Query(description="Filter alerts by email address")] = None,
     page: Annotated[int, Query(ge=1, description="Page number")] = 1,
     page_size: Annotated[int, Query(ge=1, le=100, description="Items per page")] = 20,
     session: AsyncSession = Depends(get_db_session),
-) -> AlertListDTO:
+) -> Response:
     """List alerts, optionally filtered by email.
 
     Returns a paginated list of alerts. If email is provided, only alerts
@@ -113,7 +189,7 @@ async def list_alerts(
         session: Database session (injected).
 
     Returns:
-        AlertListDTO with paginated alerts.
+        JSON-encoded AlertListDTO with paginated alerts.
 
     Raises:
         HTTPException: 400 if email is required but not provided.
@@ -128,7 +204,7 @@ async def list_alerts(
         )
 
     use_case = GetAlertsByEmailUseCase(
-        token_repository=SqlTokenRepository(session),
+        token_repository=CachedTokenRepository(SqlTokenRepository(session)),
         alert_repository=SqlAlertRepository(session),
     )
 
@@ -140,19 +216,20 @@ async def list_alerts(
     end_idx = start_idx + page_size
     paginated_alerts = alerts[start_idx:end_idx]
 
-    return AlertListDTO(
+    result = AlertListDTO(
         alerts=paginated_alerts,
         total=total,
         page=page,
         page_size=page_size,
     )
+    return Response(AlertListAdapter.dump_json(result), media_type="application/json")
 
 
 @router.get("/alerts/{alert_id}", response_model=AlertDTO)
 async def get_alert(
     alert_id: Annotated[int, Path(description="Alert ID")],
     session: AsyncSession = Depends(get_db_session),
-) -> AlertDTO:
+) -> Response:
     """Get a single alert by ID.
 
     Args:
@@ -160,7 +237,7 @@ async def get_alert(
         session: Database session (injected).
 
     Returns:
-        AlertDTO for the requested alert.
+        JSON-encoded AlertDTO for the requested alert.
 
     Raises:
         HTTPException: 404 if alert not found.
@@ -180,7 +257,7 @@ async def get_alert(
     token_symbol = token.symbol if token else f"Token {alert.token_id}"
     token_name = token.name if token else "Unknown Token"
 
-    return AlertDTO(
+    result = AlertDTO(
         id=alert.id,  # type: ignore[arg-type]
         email=alert.email.value,
         base_token_symbol=token_symbol,
@@ -194,6 +271,7 @@ async def get_alert(
         created_at=alert.created_at,
         can_trigger=alert.can_trigger(),
     )
+    return Response(AlertAdapter.dump_json(result), media_type="application/json")
 
 
 @router.delete("/alerts/{alert_id}", status_code=status.HTTP_204_NO_CONTENT)
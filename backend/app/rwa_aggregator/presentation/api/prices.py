@@ -6,14 +6,20 @@ the application-layer GetAggregatedPricesUseCase.
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.rwa_aggregator.application.dto.price_dto import AggregatedPricesDTO
+from app.rwa_aggregator.application.dto.price_dto import (
+    AggregatedPricesAdapter,
+    AggregatedPricesDTO,
+    AggregatedPricesListAdapter,
+)
 from app.rwa_aggregator.application.exceptions import NoPriceDataError, TokenNotFoundError
 from app.rwa_aggregator.application.use_cases.get_aggregated_prices import GetAggregatedPricesUseCase
 from app.rwa_aggregator.domain.services.price_calculator import PriceCalculator
 from app.rwa_aggregator.infrastructure.db.session import get_db_session
+from app.rwa_aggregator.infrastructure.repositories.cached_token_repository import CachedTokenRepository
+from app.rwa_aggregator.infrastructure.repositories.cached_venue_repository import CachedVenueRepository
 from app.rwa_aggregator.infrastructure.repositories.sql_price_repository import SqlPriceRepository
 from app.rwa_aggregator.infrastructure.repositories.sql_token_repository import SqlTokenRepository
 from app.rwa_aggregator.infrastructure.repositories.sql_venue_repository import SqlVenueRepository
@@ -31,9 +37,9 @@ def _create_use_case(session: AsyncSession) -> GetAggregatedPricesUseCase:
         Configured GetAggregatedPricesUseCase instance.
     """
     return GetAggregatedPricesUseCase(
-        token_repository=SqlTokenRepository(session),
+        token_repository=CachedTokenRepository(SqlTokenRepository(session)),
         price_repository=SqlPriceRepository(session),
-        venue_repository=SqlVenueRepository(session),
+        venue_repository=CachedVenueRepository(SqlVenueRepository(session)),
         price_calculator=PriceCalculator(),
     )
 
@@ -43,7 +49,7 @@ async def get_aggregated_prices(
     token_symbol: Annotated[str, Path(description="Token symbol (e.g., USDY, OUSG)")],
     include_stale: Annotated[bool, Query(description="Include stale prices (>60s old)")] = True,
     session: AsyncSession = Depends(get_db_session),
-) -> AggregatedPricesDTO:
+) -> Response:
     """Get aggregated prices for a token across all venues.
 
     Retrieves the latest price data from all configured venues for the
@@ -56,7 +62,7 @@ async def get_aggregated_prices(
         session: Database session (injected).
 
     Returns:
-        AggregatedPricesDTO with best prices and per-venue breakdown.
+        JSON-encoded AggregatedPricesDTO with best prices and per-venue breakdown.
 
     Raises:
         HTTPException: 404 if token not found or no price data available.
@@ -68,7 +74,6 @@ async def get_aggregated_prices(
             base_symbol=token_symbol.upper(),
             include_stale=include_stale,
         )
-        return result
     except TokenNotFoundError as e:
         raise HTTPException(
             status_code=404,
@@ -80,12 +85,14 @@ async def get_aggregated_prices(
             detail=e.message,
         ) from e
 
+    return Response(AggregatedPricesAdapter.dump_json(result), media_type="application/json")
+
 
 @router.get("/prices", response_model=list[AggregatedPricesDTO])
 async def list_all_prices(
     include_stale: Annotated[bool, Query(description="Include stale prices (>60s old)")] = True,
     session: AsyncSession = Depends(get_db_session),
-) -> list[AggregatedPricesDTO]:
+) -> Response:
     """Get aggregated prices for all active tokens.
 
     Retrieves price data for all tokens that are currently active in the
@@ -96,7 +103,7 @@ async def list_all_prices(
         session: Database session (injected).
 
     Returns:
-        List of AggregatedPricesDTO for each active token with price data.
+        JSON-encoded list of AggregatedPricesDTO for each active token with price data.
         Tokens without any price data are skipped.
     """
     token_repo = SqlTokenRepository(session)
@@ -118,4 +125,4 @@ async def list_all_prices(
             # Skip tokens without price data
             continue
 
-    return results
+    return Response(AggregatedPricesListAdapter.dump_json(results), media_type="application/json")
@@ -78,7 +78,7 @@ async def list_tokens(
             id=t.id,  # type: ignore[arg-type]
             symbol=t.symbol,
             name=t.name,
-            category=t.category.value,
+            category=t.category,
             issuer=t.issuer,
             chain=t.chain,
             contract_address=t.contract_address,
@@ -124,7 +124,7 @@ async def get_token(
         id=token.id,  # type: ignore[arg-type]
         symbol=token.symbol,
         name=token.name,
-        category=token.category.value,
+        category=token.category,
         issuer=token.issuer,
         chain=token.chain,
         contract_address=token.contract_address,
@@ -15,9 +15,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.rwa_aggregator.application.dto.price_dto import AggregatedPricesDTO
 from app.rwa_aggregator.application.exceptions import NoPriceDataError, TokenNotFoundError
 from app.rwa_aggregator.application.use_cases.get_aggregated_prices import GetAggregatedPricesUseCase
-from app.rwa_aggregator.domain.entities.token import MarketType, Token
+from app.rwa_aggregator.domain.entities.token import Token
 from app.rwa_aggregator.domain.services.price_calculator import PriceCalculator
 from app.rwa_aggregator.infrastructure.db.session import get_db_session
+from app.rwa_aggregator.infrastructure.repositories.cached_token_repository import CachedTokenRepository
+from app.rwa_aggregator.infrastructure.repositories.cached_venue_repository import CachedVenueRepository
 from app.rwa_aggregator.infrastructure.repositories.sql_price_repository import SqlPriceRepository
 from app.rwa_aggregator.infrastructure.repositories.sql_token_repository import SqlTokenRepository
 from app.rwa_aggregator.infrastructure.repositories.sql_venue_repository import SqlVenueRepository
@@ -35,9 +37,9 @@ templates = Jinja2Templates(directory=_TEMPLATES_DIR)
 def _create_use_case(session: AsyncSession) -> GetAggregatedPricesUseCase:
     """Factory function to create GetAggregatedPricesUseCase with dependencies."""
     return GetAggregatedPricesUseCase(
-        token_repository=SqlTokenRepository(session),
+        token_repository=CachedTokenRepository(SqlTokenRepository(session)),
         price_repository=SqlPriceRepository(session),
-        venue_repository=SqlVenueRepository(session),
+        venue_repository=CachedVenueRepository(SqlVenueRepository(session)),
         price_calculator=PriceCalculator(),
     )
 
@@ -85,7 +87,7 @@ async def dashboard(
     # Determine if current token is NAV-only
     is_nav_only = (
         current_token_entity is not None
-        and current_token_entity.market_type == MarketType.NAV_ONLY
+        and current_token_entity.is_nav_only
     )
 
     # Get initial price data for server-side rendering (fallback for no-JS)
@@ -93,7 +95,7 @@ async def dashboard(
     error_message: Optional[str] = None
 
     # Only fetch prices for tradable tokens
-    if current_token_entity and current_token_entity.market_type == MarketType.TRADABLE:
+    if current_token_entity and current_token_entity.is_tradable:
         use_case = _create_use_case(session)
         try:
             prices = await use_case.execute(
@@ -145,7 +147,7 @@ async def price_table_partial(
     token_entity = await token_repo.get_by_symbol(token_symbol.upper())
 
     # If token is NAV-only, return informational card instead of price table
-    if token_entity and token_entity.market_type == MarketType.NAV_ONLY:
+    if token_entity and token_entity.is_nav_only:
         return templates.TemplateResponse(
             request,
             "partials/price_table.html",
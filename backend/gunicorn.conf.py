@@ -0,0 +1,26 @@
+"""Gunicorn configuration for the production web service.
+
+Usage (from the backend directory):
+    gunicorn app.main:app -c gunicorn.conf.py
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+worker_class = "uvicorn.workers.UvicornWorker"
+# Explicit rather than one per core: each worker holds its own DB pool of
+# DB_POOL_SIZE + DB_MAX_OVERFLOW connections
+workers = int(os.environ.get("WEB_CONCURRENCY", "2"))
+keepalive = 5
+
+
+def on_starting(server) -> None:
+    """Migrate and seed in the master, before any worker is forked."""
+    from app.core.logging import flush_logging, setup_logging
+    from app.prestart import run_prestart
+
+    setup_logging()
+    try:
+        run_prestart()
+    finally:
+        flush_logging()
@@ -9,6 +9,7 @@ import pytest
 from app.rwa_aggregator.application.dto.alert_dto import CreateAlertRequest
 from app.rwa_aggregator.application.exceptions import InvalidEmailError, TokenNotFoundError
 from app.rwa_aggregator.application.use_cases.create_alert import (
+    CreateAlertsBatchUseCase,
     CreateAlertUseCase,
     DeleteAlertUseCase,
     GetAlertsByEmailUseCase,
@@ -168,6 +169,29 @@ class TestCreateAlertUseCase:
         result = await use_case.execute(request)
         assert result.email == "valid@example.com"
 
+    @pytest.mark.asyncio
+    async def test_execute_rejects_email_failing_deep_validation(
+        self,
+        create_use_case: CreateAlertUseCase,
+        mock_token_repository: AsyncMock,
+        mock_alert_repository: AsyncMock,
+        sample_token: Token,
+    ) -> None:
+        """Test that an email passing the DTO shape check can still be rejected."""
+        # Arrange
+        mock_token_repository.get_by_symbol.return_value = sample_token
+        request = CreateAlertRequest(
+            email="user@exa mple.com",
+            base_token_symbol="USDY",
+            threshold_pct=Decimal("0.05"),
+        )
+
+        # Act & Assert
+        with pytest.raises(InvalidEmailError):
+            await create_use_case.execute(request)
+        mock_token_repository.get_by_symbol.assert_not_called()
+        mock_alert_repository.save.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_execute_sets_default_values(
         self,
@@ -235,7 +259,7 @@ class TestGetAlertsByEmailUseCase:
         """Test retrieving alerts by email."""
         # Arrange
         mock_alert_repository.get_by_email.return_value = [sample_alert]
-        mock_token_repository.get_by_id.return_value = sample_token
+        mock_token_repository.get_by_ids.return_value = {sample_token.id: sample_token}
 
         # Act
         result = await get_alerts_use_case.execute("test@example.com")
@@ -272,7 +296,7 @@ class TestGetAlertsByEmailUseCase:
         """Test graceful handling when token is not found."""
         # Arrange
         mock_alert_repository.get_by_email.return_value = [sample_alert]
-        mock_token_repository.get_by_id.return_value = None  # Token not found
+        mock_token_repository.get_by_ids.return_value = {}  # Token not found
 
         # Act
         result = await get_alerts_use_case.execute("test@example.com")
@@ -326,3 +350,86 @@ class TestDeleteAlertUseCase:
 
         # Assert
         assert result is False
+
+
+class TestCreateAlertsBatchUseCase:
+    """Tests for CreateAlertsBatchUseCase."""
+
+    @pytest.fixture
+    def batch_use_case(
+        self,
+        mock_token_repository: AsyncMock,
+        mock_alert_repository: AsyncMock,
+    ) -> CreateAlertsBatchUseCase:
+        """Create the CreateAlertsBatchUseCase with mocked dependencies."""
+        return CreateAlertsBatchUseCase(
+            token_repository=mock_token_repository,
+            alert_repository=mock_alert_repository,
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_saves_all_alerts_in_one_call(
+        self,
+        batch_use_case: CreateAlertsBatchUseCase,
+        mock_token_repository: AsyncMock,
+        mock_alert_repository: AsyncMock,
+        sample_token: Token,
+    ) -> None:
+        """Test that tokens are resolved once and alerts are saved together."""
+        # Arrange
+        mock_token_repository.get_by_symbols.return_value = {"USDY": sample_token}
+        mock_alert_repository.save_many.side_effect = lambda alerts: [
+            Alert(
+                id=i,
+                email=a.email,
+                token_id=a.token_id,
+                threshold_pct=a.threshold_pct,
+            )
+            for i, a in enumerate(alerts, start=1)
+        ]
+        requests = [
+            CreateAlertRequest(
+                email=f"user{i}@example.com",
+                base_token_symbol="usdy",
+                threshold_pct=Decimal("0.05"),
+            )
+            for i in range(3)
+        ]
+
+        # Act
+        result = await batch_use_case.execute(requests)
+
+        # Assert
+        assert [r.id for r in result] == [1, 2, 3]
+        assert result[2].email == "user2@example.com"
+        mock_token_repository.get_by_symbols.assert_called_once()
+        mock_alert_repository.save_many.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_execute_saves_nothing_when_a_token_is_unknown(
+        self,
+        batch_use_case: CreateAlertsBatchUseCase,
+        mock_token_repository: AsyncMock,
+        mock_alert_repository: AsyncMock,
+        sample_token: Token,
+    ) -> None:
+        """Test that one unknown token aborts the whole batch."""
+        # Arrange
+        mock_token_repository.get_by_symbols.return_value = {"USDY": sample_token}
+        requests = [
+            CreateAlertRequest(
+                email="a@example.com",
+                base_token_symbol="USDY",
+                threshold_pct=Decimal("0.05"),
+            ),
+            CreateAlertRequest(
+                email="b@example.com",
+                base_token_symbol="NOPE",
+                threshold_pct=Decimal("0.05"),
+            ),
+        ]
+
+        # Act & Assert
+        with pytest.raises(TokenNotFoundError):
+            await batch_use_case.execute(requests)
+        mock_alert_repository.save_many.assert_not_called()
@@ -138,7 +138,9 @@ class TestGetAggregatedPricesUseCase:
         # Arrange
         mock_token_repository.get_by_symbol.return_value = sample_token
         mock_price_repository.get_latest_for_token.return_value = sample_snapshots
-        mock_venue_repository.get_by_id.side_effect = lambda vid: sample_venues.get(vid)
+        mock_venue_repository.get_by_ids.side_effect = lambda ids: {
+            vid: sample_venues[vid] for vid in ids if vid in sample_venues
+        }
 
         # Act
         result = await use_case.execute("USDY")
@@ -153,9 +155,9 @@ class TestGetAggregatedPricesUseCase:
 
         # Best prices should be calculated correctly
         # Best bid is from Coinbase (1.0012), best ask is from Kraken (1.0015)
-        assert result.best_prices.best_bid_price == Decimal("1.0012")
+        assert result.best_prices.best_bid_price == 1.0012
         assert result.best_prices.best_bid_venue == "Coinbase"
-        assert result.best_prices.best_ask_price == Decimal("1.0015")
+        assert result.best_prices.best_ask_price == 1.0015
         assert result.best_prices.best_ask_venue == "Kraken"
 
     @pytest.mark.asyncio
@@ -207,7 +209,7 @@ class TestGetAggregatedPricesUseCase:
         # Arrange
         mock_token_repository.get_by_symbol.return_value = sample_token
         mock_price_repository.get_latest_for_token.return_value = sample_snapshots
-        mock_venue_repository.get_by_id.return_value = None  # No venue found
+        mock_venue_repository.get_by_ids.return_value = {}  # No venue found
 
         # Act
         result = await use_case.execute("USDY")
@@ -251,7 +253,9 @@ class TestGetAggregatedPricesUseCase:
 
         mock_token_repository.get_by_symbol.return_value = sample_token
         mock_price_repository.get_latest_for_token.return_value = snapshots
-        mock_venue_repository.get_by_id.side_effect = lambda vid: sample_venues.get(vid)
+        mock_venue_repository.get_by_ids.side_effect = lambda ids: {
+            vid: sample_venues[vid] for vid in ids if vid in sample_venues
+        }
 
         use_case = GetAggregatedPricesUseCase(
             token_repository=mock_token_repository,
@@ -282,7 +286,9 @@ class TestGetAggregatedPricesUseCase:
         # Arrange
         mock_token_repository.get_by_symbol.return_value = sample_token
         mock_price_repository.get_latest_for_token.return_value = sample_snapshots
-        mock_venue_repository.get_by_id.side_effect = lambda vid: sample_venues.get(vid)
+        mock_venue_repository.get_by_ids.side_effect = lambda ids: {
+            vid: sample_venues[vid] for vid in ids if vid in sample_venues
+        }
 
         # Act
         result = await use_case.execute("USDY")
@@ -290,3 +296,29 @@ class TestGetAggregatedPricesUseCase:
         # Assert - Coinbase has higher bid (1.0012) so should be first
         assert result.venues[0].venue_name == "Coinbase"
         assert result.venues[1].venue_name == "Kraken"
+
+    @pytest.mark.asyncio
+    async def test_top_k_limits_venues_but_not_counts(
+        self,
+        use_case: GetAggregatedPricesUseCase,
+        mock_token_repository: AsyncMock,
+        mock_price_repository: AsyncMock,
+        mock_venue_repository: AsyncMock,
+        sample_token: Token,
+        sample_venues: dict[int, Venue],
+        sample_snapshots: list[PriceSnapshot],
+    ) -> None:
+        """Test that top_k keeps only the highest bids while counting all venues."""
+        # Arrange
+        mock_token_repository.get_by_symbol.return_value = sample_token
+        mock_price_repository.get_latest_for_token.return_value = sample_snapshots
+        mock_venue_repository.get_by_ids.side_effect = lambda ids: {
+            vid: sample_venues[vid] for vid in ids if vid in sample_venues
+        }
+
+        # Act
+        result = await use_case.execute("USDY", top_k=1)
+
+        # Assert
+        assert [v.venue_name for v in result.venues] == ["Coinbase"]
+        assert result.num_venues == 2
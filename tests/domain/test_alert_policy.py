@@ -0,0 +1,62 @@
+"""Unit tests for the AlertPolicy domain service."""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from app.rwa_aggregator.domain.entities.alert import Alert
+from app.rwa_aggregator.domain.services.alert_policy import AlertPolicy
+from app.rwa_aggregator.domain.value_objects.email_address import EmailAddress
+from app.rwa_aggregator.domain.value_objects.spread import Spread
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _alert(alert_id: int, token_id: int, threshold: str, **kwargs) -> Alert:
+    """Build an active alert for testing."""
+    return Alert(
+        id=alert_id,
+        email=EmailAddress("user@example.com"),
+        token_id=token_id,
+        threshold_pct=Decimal(threshold),
+        **kwargs,
+    )
+
+
+class TestAlertPolicyEvaluateBatch:
+    """Tests for AlertPolicy.evaluate_batch."""
+
+    def test_selects_alerts_below_threshold(self) -> None:
+        """Test that only alerts whose token spread is below threshold fire."""
+        # Arrange
+        policy = AlertPolicy()
+        alerts = [
+            _alert(1, token_id=1, threshold="0.50"),
+            _alert(2, token_id=1, threshold="0.10"),
+            _alert(3, token_id=2, threshold="0.50"),  # no spread for token 2
+        ]
+        current_by_token = {1: Spread(Decimal("0.2000"))}
+
+        # Act
+        triggered = policy.evaluate_batch(alerts, current_by_token, now=NOW)
+
+        # Assert
+        assert [a.id for a in triggered] == [1]
+
+    def test_respects_cooldown_and_crossing(self) -> None:
+        """Test that cooldown and previous-spread crossing rules still apply."""
+        # Arrange
+        policy = AlertPolicy()
+        alerts = [
+            _alert(1, token_id=1, threshold="0.50", last_triggered_at=NOW - timedelta(minutes=5)),
+            _alert(2, token_id=2, threshold="0.50"),
+        ]
+        current_by_token = {1: Spread(Decimal("0.2000")), 2: Spread(Decimal("0.2000"))}
+        previous_by_token = {2: Spread(Decimal("0.3000"))}  # already below
+
+        # Act
+        triggered = policy.evaluate_batch(
+            alerts, current_by_token, previous_by_token, now=NOW
+        )
+
+        # Assert
+        assert triggered == []
@@ -0,0 +1,61 @@
+"""Unit tests for the EmailAddress value object."""
+
+import pytest
+
+from app.rwa_aggregator.domain.value_objects.email_address import EmailAddress
+
+
+class TestEmailAddress:
+    """Tests for EmailAddress validation."""
+
+    @pytest.mark.parametrize(
+        "value",
+        ["user@example.com", "first.last+tag@sub-domain.example.org", "a_b%c@x.io"],
+    )
+    def test_accepts_valid_addresses(self, value: str) -> None:
+        """Test that well-formed addresses are accepted."""
+        # Act
+        email = EmailAddress(value)
+
+        # Assert
+        assert email.value == value
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "",
+            "user",
+            "@example.com",
+            "user@",
+            "user@example",
+            "user@.com",
+            "user@example.c",
+            "user@@example.com",
+            "user@example.c0m",
+            "us er@example.com",
+            "user@example.com\n",
+            "usér@example.com",
+        ],
+    )
+    def test_rejects_invalid_addresses(self, value: str) -> None:
+        """Test that malformed addresses raise ValueError."""
+        # Act / Assert
+        with pytest.raises(ValueError):
+            EmailAddress(value)
+
+    def test_from_trusted_skips_validation(self) -> None:
+        """Test that trusted values are wrapped without revalidation."""
+        # Act: EmailAddress("not-an-email") would raise ValueError
+        email = EmailAddress.from_trusted("not-an-email")
+
+        # Assert
+        assert email.value == "not-an-email"
+
+    def test_from_trusted_equals_validated_instance(self) -> None:
+        """Test that trusted and validated instances compare and hash equal."""
+        # Act
+        email = EmailAddress.from_trusted("user@example.com")
+
+        # Assert
+        assert email == EmailAddress("user@example.com")
+        assert hash(email) == hash(EmailAddress("user@example.com"))
@@ -0,0 +1,112 @@
+"""Unit tests for the PriceCalculator domain service."""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from app.rwa_aggregator.domain.entities.price_snapshot import PriceSnapshot
+from app.rwa_aggregator.domain.services.price_calculator import PriceCalculator
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _snapshot(venue_id: int, bid: str, ask: str, age_seconds: int = 0) -> PriceSnapshot:
+    """Build a snapshot fetched age_seconds before a fixed reference time."""
+    return PriceSnapshot(
+        id=None,
+        token_id=1,
+        venue_id=venue_id,
+        bid=Decimal(bid),
+        ask=Decimal(ask),
+        fetched_at=NOW - timedelta(seconds=age_seconds),
+    )
+
+
+class TestPriceCalculator:
+    """Tests for PriceCalculator.calculate_best_prices."""
+
+    def test_picks_best_bid_and_ask_from_fresh_venues(self) -> None:
+        """Test that stale venues are ignored when choosing best prices."""
+        # Arrange
+        calculator = PriceCalculator(max_staleness_seconds=60)
+        snapshots = [
+            _snapshot(1, "1.0010", "1.0020"),
+            _snapshot(2, "1.0015", "1.0030"),
+            _snapshot(3, "1.0100", "1.0000", age_seconds=120),  # stale
+        ]
+
+        # Act
+        result = calculator.calculate_best_prices(snapshots, now=NOW)
+
+        # Assert
+        assert result.best_bid.venue_id == 2
+        assert result.best_ask.venue_id == 1
+        assert result.venues_count == 2
+        assert result.effective_spread is not None
+
+    def test_ties_keep_the_first_venue(self) -> None:
+        """Test that equal prices resolve to the earliest snapshot."""
+        # Arrange
+        calculator = PriceCalculator()
+        snapshots = [_snapshot(1, "1.00", "1.01"), _snapshot(2, "1.00", "1.01")]
+
+        # Act
+        result = calculator.calculate_best_prices(snapshots, now=NOW)
+
+        # Assert
+        assert result.best_bid.venue_id == 1
+        assert result.best_ask.venue_id == 1
+
+    def test_all_stale_returns_empty_result(self) -> None:
+        """Test that no best prices are produced when every venue is stale."""
+        # Arrange
+        calculator = PriceCalculator(max_staleness_seconds=60)
+        snapshots = [_snapshot(1, "1.00", "1.01", age_seconds=61)]
+
+        # Act
+        result = calculator.calculate_best_prices(snapshots, now=NOW)
+
+        # Assert
+        assert result.best_bid is None
+        assert result.best_ask is None
+        assert result.effective_spread is None
+        assert result.venues_count == 0
+
+    def test_batch_matches_per_token_results(self) -> None:
+        """Test that the batch path returns one result per token."""
+        # Arrange
+        calculator = PriceCalculator(max_staleness_seconds=60)
+        snapshots_by_token = {
+            1: [_snapshot(1, "1.00", "1.01"), _snapshot(2, "1.02", "1.03")],
+            2: [_snapshot(1, "1.00", "1.01", age_seconds=61)],
+        }
+
+        # Act
+        result = calculator.calculate_best_prices_batch(snapshots_by_token, now=NOW)
+
+        # Assert
+        assert result[1] == calculator.calculate_best_prices(snapshots_by_token[1], now=NOW)
+        assert result[2].venues_count == 0
+
+    def test_single_fresh_snapshot_is_best_bid_and_ask(self) -> None:
+        """Test the single-venue fast path."""
+        # Arrange
+        calculator = PriceCalculator()
+        snapshot = _snapshot(1, "1.00", "1.02")
+
+        # Act
+        result = calculator.calculate_best_prices([snapshot], now=NOW)
+
+        # Assert
+        assert result.best_bid is snapshot
+        assert result.best_ask is snapshot
+        assert result.effective_spread == snapshot.spread
+        assert result.venues_count == 1
+
+    def test_empty_input_returns_empty_result(self) -> None:
+        """Test that no snapshots yield an empty result."""
+        # Act
+        result = PriceCalculator().calculate_best_prices([], now=NOW)
+
+        # Assert
+        assert result.best_bid is None
+        assert result.venues_count == 0
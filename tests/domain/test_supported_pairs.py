@@ -0,0 +1,54 @@
+"""Unit tests for the supported tradable pair lookups."""
+
+from app.rwa_aggregator.domain.supported_pairs import (
+    SUPPORTED_TRADABLE_PAIRS,
+    get_pairs_for_base,
+    get_primary_pair_for_base,
+    get_tradable_base_symbols,
+    get_venues_for_base,
+    is_tradable_symbol,
+)
+
+
+class TestSupportedPairLookups:
+    """Tests for the precomputed supported pair indexes."""
+
+    def test_pairs_for_base_preserve_declaration_order(self) -> None:
+        """Test that pairs are grouped by base symbol in config order."""
+        # Act
+        pairs = get_pairs_for_base("usdy")
+
+        # Assert
+        assert pairs == (
+            SUPPORTED_TRADABLE_PAIRS["USDY/USDT"],
+            SUPPORTED_TRADABLE_PAIRS["USDY/USDC"],
+        )
+
+    def test_primary_pair_and_venues(self) -> None:
+        """Test primary pair and venue union lookups for a base symbol."""
+        # Act
+        primary = get_primary_pair_for_base("PAXG")
+        venues = get_venues_for_base("PAXG")
+
+        # Assert
+        assert primary is SUPPORTED_TRADABLE_PAIRS["PAXG/USD"]
+        assert venues == frozenset({"Kraken", "Coinbase", "Bybit"})
+
+    def test_unknown_symbol(self) -> None:
+        """Test that unknown symbols yield empty results."""
+        # Act / Assert
+        assert get_pairs_for_base("OUSG") == ()
+        assert get_primary_pair_for_base("OUSG") is None
+        assert get_venues_for_base("OUSG") == frozenset()
+        assert not is_tradable_symbol("OUSG")
+
+    def test_tradable_base_symbols_is_shared_frozenset(self) -> None:
+        """Test that tradable bases come from the cached frozenset."""
+        # Act
+        first = get_tradable_base_symbols()
+        second = get_tradable_base_symbols()
+
+        # Assert
+        assert isinstance(first, frozenset)
+        assert first is second
+        assert first == {"USDY", "PAXG", "ETH"}
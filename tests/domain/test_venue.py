@@ -0,0 +1,44 @@
+"""Unit tests for the Venue entity."""
+
+from app.rwa_aggregator.domain.entities.venue import ApiType, Venue, VenueType
+
+
+def _venue(trade_url_template: str | None) -> Venue:
+    """Build a Kraken venue with the given trade URL template."""
+    return Venue(
+        id=1,
+        name="Kraken",
+        venue_type=VenueType.CEX,
+        api_type=ApiType.REST,
+        base_url="https://api.kraken.com",
+        trade_url_template=trade_url_template,
+    )
+
+
+class TestVenueTradeUrl:
+    """Tests for Venue.get_trade_url."""
+
+    def test_renders_symbol_placeholder(self) -> None:
+        """Test that the symbol is substituted into the template."""
+        # Act
+        url = _venue("https://kraken.com/trade/{symbol}-usd").get_trade_url("BTC")
+
+        # Assert
+        assert url == "https://kraken.com/trade/BTC-usd"
+
+    def test_reassigned_template_is_used(self) -> None:
+        """Test that changing the template after creation takes effect."""
+        # Arrange
+        venue = _venue("https://kraken.com/trade/{symbol}")
+        venue.get_trade_url("BTC")
+
+        # Act
+        venue.trade_url_template = "https://pro.kraken.com/{symbol}"
+
+        # Assert
+        assert venue.get_trade_url("BTC") == "https://pro.kraken.com/BTC"
+
+    def test_no_template_returns_none(self) -> None:
+        """Test that venues without a template have no trade URL."""
+        # Act / Assert
+        assert _venue(None).get_trade_url("BTC") is None
@@ -0,0 +1,97 @@
+"""Unit tests for multi-symbol quote fetching in the CEX clients."""
+
+from typing import Iterator
+
+import httpx
+import pytest
+
+from app.rwa_aggregator.infrastructure.external.bybit_client import BybitClient
+from app.rwa_aggregator.infrastructure.external.kraken_client import KrakenClient
+from app.rwa_aggregator.infrastructure.external.quote_cache import (
+    invalidate_quote_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_quote_cache() -> Iterator[None]:
+    """Isolate tests from the process-wide quote cache."""
+    invalidate_quote_cache()
+    yield
+    invalidate_quote_cache()
+
+
+def _bybit_ticker(symbol: str, bid: str, ask: str) -> dict:
+    """Build a Bybit V5 ticker entry."""
+    return {"symbol": symbol, "bid1Price": bid, "ask1Price": ask, "volume24h": "10"}
+
+
+def _kraken_ticker(bid: str, ask: str) -> dict:
+    """Build a Kraken ticker entry."""
+    return {"a": [ask, "1", "1"], "b": [bid, "1", "1"], "v": ["5", "10"]}
+
+
+class TestBybitFetchQuotes:
+    """Tests for BybitClient.fetch_quotes."""
+
+    @pytest.mark.asyncio
+    async def test_uses_one_all_tickers_request(self) -> None:
+        """Test that three symbols are served by a single request."""
+        # Arrange
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={
+                "retCode": 0,
+                "result": {"list": [
+                    _bybit_ticker("BTCUSDT", "100", "101"),
+                    _bybit_ticker("ETHUSDT", "10", "11"),
+                    _bybit_ticker("USDYUSDT", "1.02", "1.03"),
+                    _bybit_ticker("DOGEUSDT", "0.1", "0.2"),
+                ]},
+            })
+
+        client = BybitClient(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+        # Act
+        quotes = await client.fetch_quotes(["btc", "ETH", "USDY", "UNKNOWN"])
+
+        # Assert
+        assert len(requests) == 1
+        assert "symbol" not in requests[0].url.params
+        assert set(quotes) == {"BTC", "ETH", "USDY"}
+        assert quotes["USDY"].bid == 1.02
+
+
+class TestKrakenFetchQuotes:
+    """Tests for KrakenClient.fetch_quotes."""
+
+    @pytest.mark.asyncio
+    async def test_batches_pairs_and_falls_back_for_missing(self) -> None:
+        """Test that pairs absent from the batch are fetched individually."""
+        # Arrange
+        pair_params: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            pair = request.url.params["pair"]
+            pair_params.append(pair)
+            if "," in pair:
+                # Kraken answers SOLUSD under a different key
+                return httpx.Response(200, json={"error": [], "result": {
+                    "XXBTZUSD": _kraken_ticker("100", "101"),
+                    "SOL/USD": _kraken_ticker("20", "21"),
+                }})
+            return httpx.Response(200, json={"error": [], "result": {
+                "SOL/USD": _kraken_ticker("20", "21"),
+            }})
+
+        client = KrakenClient(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+        # Act
+        quotes = await client.fetch_quotes(["BTC", "SOL"])
+
+        # Assert
+        assert sorted(pair_params[0].split(",")) == ["SOLUSD", "XXBTZUSD"]
+        assert pair_params[1:] == ["SOLUSD"]
+        assert quotes["BTC"].ask == 101.0
+        assert quotes["SOL"].bid == 20.0
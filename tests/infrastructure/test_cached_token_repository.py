@@ -0,0 +1,117 @@
+"""Unit tests for CachedTokenRepository."""
+
+import asyncio
+from typing import Iterator, Optional
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.rwa_aggregator.domain.entities.token import Token, TokenCategory
+from app.rwa_aggregator.infrastructure.repositories.cached_token_repository import (
+    CachedTokenRepository,
+    invalidate_token_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache() -> Iterator[None]:
+    """Isolate tests from the process-wide token cache."""
+    invalidate_token_cache()
+    yield
+    invalidate_token_cache()
+
+
+@pytest.fixture
+def sample_token() -> Token:
+    """Create a sample token for testing."""
+    return Token(
+        id=1,
+        symbol="USDY",
+        name="Ondo US Dollar Yield",
+        category=TokenCategory.TBILL,
+        issuer="Ondo Finance",
+        is_active=True,
+    )
+
+
+class TestCachedTokenRepository:
+    """Tests for CachedTokenRepository."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_lookup(self, sample_token: Token) -> None:
+        """Test that simultaneous misses for a symbol hit the database once."""
+        # Arrange
+        inner = AsyncMock()
+
+        async def slow_lookup(symbol: str) -> Optional[Token]:
+            await asyncio.sleep(0)
+            return sample_token
+
+        inner.get_by_symbol.side_effect = slow_lookup
+        repo = CachedTokenRepository(inner)
+
+        # Act
+        results = await asyncio.gather(*(repo.get_by_symbol("USDY") for _ in range(5)))
+
+        # Assert
+        assert all(r is sample_token for r in results)
+        inner.get_by_symbol.assert_called_once_with("USDY")
+
+    @pytest.mark.asyncio
+    async def test_unknown_symbol_is_not_cached(self) -> None:
+        """Test that a missing token is looked up again on the next call."""
+        # Arrange
+        inner = AsyncMock()
+        inner.get_by_symbol.return_value = None
+        repo = CachedTokenRepository(inner)
+
+        # Act
+        await repo.get_by_symbol("NOPE")
+        await repo.get_by_symbol("NOPE")
+
+        # Assert
+        assert inner.get_by_symbol.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_symbol_lookup_also_fills_id_cache(self, sample_token: Token) -> None:
+        """Test that a token cached by symbol is served by ID without a query."""
+        # Arrange
+        inner = AsyncMock()
+        inner.get_by_symbol.return_value = sample_token
+        repo = CachedTokenRepository(inner)
+        await repo.get_by_symbol("usdy")
+
+        # Act
+        result = await repo.get_by_ids([1])
+
+        # Assert
+        assert result == {1: sample_token}
+        inner.get_by_ids.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_lookup_does_not_block_retry(self, sample_token: Token) -> None:
+        """Test that a lookup error reaches waiters and the next call retries."""
+        # Arrange
+        inner = AsyncMock()
+
+        async def failing_lookup(symbol: str) -> Optional[Token]:
+            await asyncio.sleep(0)
+            raise RuntimeError("db down")
+
+        inner.get_by_symbol.side_effect = failing_lookup
+        repo = CachedTokenRepository(inner)
+        results = await asyncio.gather(
+            repo.get_by_symbol("USDY"),
+            repo.get_by_symbol("USDY"),
+            return_exceptions=True,
+        )
+        inner.get_by_symbol.side_effect = None
+        inner.get_by_symbol.return_value = sample_token
+
+        # Act
+        token = await repo.get_by_symbol("USDY")
+
+        # Assert
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert token is sample_token
+        assert inner.get_by_symbol.call_count == 2
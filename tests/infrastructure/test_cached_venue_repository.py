@@ -0,0 +1,100 @@
+"""Unit tests for CachedVenueRepository."""
+
+from typing import Iterator
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.rwa_aggregator.domain.entities.venue import ApiType, Venue, VenueType
+from app.rwa_aggregator.infrastructure.repositories.cached_venue_repository import (
+    CachedVenueRepository,
+    invalidate_venue_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_venue_cache() -> Iterator[None]:
+    """Isolate tests from the process-wide venue cache."""
+    invalidate_venue_cache()
+    yield
+    invalidate_venue_cache()
+
+
+@pytest.fixture
+def sample_venue() -> Venue:
+    """Create a sample venue for testing."""
+    return Venue(
+        id=1,
+        name="Kraken",
+        venue_type=VenueType.CEX,
+        api_type=ApiType.REST,
+        base_url="https://api.kraken.com",
+    )
+
+
+@pytest.fixture
+def mock_inner() -> AsyncMock:
+    """Create a mock inner venue repository."""
+    return AsyncMock()
+
+
+class TestCachedVenueRepository:
+    """Tests for CachedVenueRepository."""
+
+    @pytest.mark.asyncio
+    async def test_get_by_ids_fetches_only_misses(
+        self,
+        mock_inner: AsyncMock,
+        sample_venue: Venue,
+    ) -> None:
+        """Test that cached venues are not fetched again."""
+        # Arrange
+        mock_inner.get_by_ids.return_value = {1: sample_venue}
+        repo = CachedVenueRepository(mock_inner)
+        await repo.get_by_ids([1])
+        mock_inner.get_by_ids.return_value = {}
+
+        # Act
+        result = await repo.get_by_ids([1, 2])
+
+        # Assert
+        assert result == {1: sample_venue}
+        mock_inner.get_by_ids.assert_called_with([2])
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_refetched(
+        self,
+        mock_inner: AsyncMock,
+        sample_venue: Venue,
+    ) -> None:
+        """Test that a zero TTL always goes to the inner repository."""
+        # Arrange
+        mock_inner.get_by_ids.return_value = {1: sample_venue}
+        repo = CachedVenueRepository(mock_inner, ttl=0)
+
+        # Act
+        await repo.get_by_id(1)
+        await repo.get_by_id(1)
+
+        # Assert
+        assert mock_inner.get_by_ids.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_save_evicts_entry(
+        self,
+        mock_inner: AsyncMock,
+        sample_venue: Venue,
+    ) -> None:
+        """Test that saving a venue invalidates its cached copy."""
+        # Arrange
+        mock_inner.get_by_ids.return_value = {1: sample_venue}
+        mock_inner.save.return_value = sample_venue
+        repo = CachedVenueRepository(mock_inner)
+        await repo.get_by_id(1)
+
+        # Act
+        await repo.save(sample_venue)
+        await repo.get_by_id(1)
+
+        # Assert
+        assert mock_inner.get_by_ids.call_count == 2
@@ -0,0 +1,25 @@
+"""Unit tests for database maintenance task helpers."""
+
+from datetime import date
+
+from app.rwa_aggregator.infrastructure.tasks.maintenance_tasks import _upcoming_months
+
+
+class TestUpcomingMonths:
+    """Tests for the partition month window."""
+
+    def test_includes_current_and_following_months(self) -> None:
+        """Test that the window starts at the current month."""
+        # Act
+        months = _upcoming_months(date(2026, 10, 15), months_ahead=2)
+
+        # Assert
+        assert months == [date(2026, 10, 1), date(2026, 11, 1), date(2026, 12, 1)]
+
+    def test_rolls_over_year_end(self) -> None:
+        """Test that December is followed by January of the next year."""
+        # Act
+        months = _upcoming_months(date(2026, 12, 31), months_ahead=1)
+
+        # Assert
+        assert months == [date(2026, 12, 1), date(2027, 1, 1)]
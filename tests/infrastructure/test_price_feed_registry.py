@@ -0,0 +1,80 @@
+"""Unit tests for PriceFeedRegistry."""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Optional
+
+import pytest
+
+from app.rwa_aggregator.application.interfaces.price_feed import (
+    NormalizedQuote,
+    PriceFeed,
+)
+from app.rwa_aggregator.infrastructure.external.price_feed_registry import (
+    PriceFeedRegistry,
+)
+
+
+class FakeFeed(PriceFeed):
+    """Price feed that answers every token after a fixed delay."""
+
+    def __init__(self, name: str, delay: float = 0.0) -> None:
+        self._name = name
+        self._delay = delay
+
+    @property
+    def venue_name(self) -> str:
+        return self._name
+
+    async def fetch_quote(self, token_symbol: str) -> Optional[NormalizedQuote]:
+        await asyncio.sleep(self._delay)
+        return NormalizedQuote(
+            venue_name=self._name,
+            token_symbol=token_symbol.upper(),
+            bid=1.0,
+            ask=1.1,
+            volume_24h=None,
+            timestamp=datetime.now(timezone.utc),
+        )
+
+    def supports_token(self, token_symbol: str) -> bool:
+        return True
+
+    async def close(self) -> None:
+        pass
+
+
+class TestPriceFeedRegistry:
+    """Tests for PriceFeedRegistry fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_slow_venue_does_not_drop_other_quotes(self) -> None:
+        """Test that a venue timing out only loses its own quote."""
+        # Arrange
+        registry = PriceFeedRegistry()
+        registry.register(FakeFeed("Fast"))
+        registry.register(FakeFeed("Slow", delay=1.0))
+
+        # Act
+        quotes = await registry.fetch_all_quotes("BTC", timeout_seconds=0.05)
+
+        # Assert
+        assert [q.venue_name for q in quotes] == ["Fast"]
+
+    @pytest.mark.asyncio
+    async def test_fetch_quotes_for_tokens_groups_by_symbol(self) -> None:
+        """Test that per-venue batches are regrouped per requested symbol."""
+        # Arrange
+        registry = PriceFeedRegistry()
+        registry.register(FakeFeed("A"))
+        registry.register(FakeFeed("B"))
+        registry.register(FakeFeed("Slow", delay=1.0))
+
+        # Act
+        result = await registry.fetch_quotes_for_tokens(
+            ["BTC", "ETH"], timeout_seconds=0.05
+        )
+
+        # Assert
+        assert set(result) == {"BTC", "ETH"}
+        assert sorted(q.venue_name for q in result["BTC"]) == ["A", "B"]
@@ -0,0 +1,42 @@
+"""Unit tests for price task helpers."""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from app.rwa_aggregator.application.interfaces.price_feed import NormalizedQuote
+from app.rwa_aggregator.infrastructure.tasks.price_tasks import _to_snapshot
+
+
+def _quote(bid: float, ask: float) -> NormalizedQuote:
+    """Build a Kraken quote with the given prices."""
+    return NormalizedQuote(
+        venue_name="Kraken",
+        token_symbol="BTC",
+        bid=bid,
+        ask=ask,
+        volume_24h=None,
+        timestamp=datetime.now(timezone.utc),
+    )
+
+
+class TestToSnapshot:
+    """Tests for converting venue quotes to snapshots."""
+
+    def test_converts_quote_prices_to_decimal(self) -> None:
+        """Test that float prices become their shortest decimal form."""
+        # Act
+        snapshot = _to_snapshot(1, 2, _quote(100.1, 100.3))
+
+        # Assert
+        assert snapshot.bid == Decimal("100.1")
+        assert snapshot.ask == Decimal("100.3")
+        assert snapshot.venue_id == 2
+
+    @pytest.mark.parametrize("bid, ask", [(0.0, 1.0), (1.0, -1.0)])
+    def test_rejects_non_positive_prices(self, bid: float, ask: float) -> None:
+        """Test that a quote without a storable spread raises ValueError."""
+        # Act / Assert
+        with pytest.raises(ValueError):
+            _to_snapshot(1, 2, _quote(bid, ask))
@@ -0,0 +1,255 @@
+"""Unit tests for TTLQuoteCacheMixin."""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Iterator
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.rwa_aggregator.application.interfaces.price_feed import NormalizedQuote
+from app.rwa_aggregator.infrastructure.external.kraken_client import KrakenClient
+from app.rwa_aggregator.infrastructure.external.quote_cache import (
+    RedisQuoteCache,
+    invalidate_quote_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_quote_cache() -> Iterator[None]:
+    """Isolate tests from the process-wide quote cache."""
+    invalidate_quote_cache()
+    yield
+    invalidate_quote_cache()
+
+
+@pytest.fixture
+def sample_quote() -> NormalizedQuote:
+    """Create a sample Kraken quote for testing."""
+    return NormalizedQuote(
+        venue_name="Kraken",
+        token_symbol="BTC",
+        bid=100.0,
+        ask=101.0,
+        volume_24h=None,
+        timestamp=datetime.now(timezone.utc),
+    )
+
+
+class TestTTLQuoteCacheMixin:
+    """Tests for TTLQuoteCacheMixin via KrakenClient."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_fetch(
+        self,
+        sample_quote: NormalizedQuote,
+    ) -> None:
+        """Test that a burst for the same symbol issues a single fetch."""
+        # Arrange
+        client = KrakenClient()
+        client._fetch_quote_uncached = AsyncMock(return_value=sample_quote)
+
+        # Act
+        results = await asyncio.gather(
+            client.fetch_quote("btc"),
+            client.fetch_quote("BTC"),
+            client.fetch_quote("BTC"),
+        )
+
+        # Assert
+        assert results == [sample_quote] * 3
+        client._fetch_quote_uncached.assert_awaited_once()
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_disables_caching(
+        self,
+        sample_quote: NormalizedQuote,
+    ) -> None:
+        """Test that a zero TTL always goes to the venue."""
+        # Arrange
+        client = KrakenClient(quote_ttl_seconds=0)
+        client._fetch_quote_uncached = AsyncMock(return_value=sample_quote)
+
+        # Act
+        await client.fetch_quote("BTC")
+        await client.fetch_quote("BTC")
+
+        # Assert
+        assert client._fetch_quote_uncached.await_count == 2
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_coalesce_without_ttl(
+        self,
+        sample_quote: NormalizedQuote,
+    ) -> None:
+        """Test that in-flight fetches are shared even with caching off."""
+        # Arrange
+        client = KrakenClient(quote_ttl_seconds=0)
+
+        async def slow_fetch(token_symbol: str) -> NormalizedQuote:
+            await asyncio.sleep(0.01)
+            return sample_quote
+
+        client._fetch_quote_uncached = AsyncMock(side_effect=slow_fetch)
+
+        # Act
+        results = await asyncio.gather(
+            client.fetch_quote("BTC"),
+            client.fetch_quote("BTC"),
+        )
+
+        # Assert
+        assert results == [sample_quote, sample_quote]
+        client._fetch_quote_uncached.assert_awaited_once()
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_joins_inflight_single_fetch(
+        self,
+        sample_quote: NormalizedQuote,
+    ) -> None:
+        """Test that a batch overlapping a single-symbol fetch reuses it."""
+        # Arrange
+        client = KrakenClient(quote_ttl_seconds=0)
+        requested: list[str] = []
+
+        async def slow_fetch(token_symbol: str) -> NormalizedQuote:
+            requested.append(token_symbol)
+            await asyncio.sleep(0.01)
+            return sample_quote
+
+        client._fetch_quote_uncached = AsyncMock(side_effect=slow_fetch)
+
+        # Act
+        single, batch = await asyncio.gather(
+            client.fetch_quote("BTC"),
+            client.fetch_quotes(["BTC", "ETH"]),
+        )
+
+        # Assert
+        assert single == sample_quote
+        assert batch["BTC"] == sample_quote
+        assert sorted(requested) == ["BTC", "ETH"]
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_waiter_survives_cancelled_leader(
+        self,
+        sample_quote: NormalizedQuote,
+    ) -> None:
+        """Test that cancelling the fetching caller makes a waiter retry."""
+        # Arrange
+        client = KrakenClient()
+        leader_started = asyncio.Event()
+
+        async def fetch(token_symbol: str) -> NormalizedQuote:
+            if not leader_started.is_set():
+                leader_started.set()
+                await asyncio.sleep(10)
+            return sample_quote
+
+        client._fetch_quote_uncached = AsyncMock(side_effect=fetch)
+        leader = asyncio.create_task(client.fetch_quote("BTC"))
+        await leader_started.wait()
+        waiter = asyncio.create_task(client.fetch_quote("BTC"))
+        await asyncio.sleep(0)
+
+        # Act
+        leader.cancel()
+        quote = await waiter
+
+        # Assert
+        assert leader.cancelled()
+        assert quote == sample_quote
+        assert client._fetch_quote_uncached.await_count == 2
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_is_not_cached(self) -> None:
+        """Test that a None result is retried on the next call."""
+        # Arrange
+        client = KrakenClient()
+        client._fetch_quote_uncached = AsyncMock(return_value=None)
+
+        # Act
+        await client.fetch_quote("BTC")
+        await client.fetch_quote("BTC")
+
+        # Assert
+        assert client._fetch_quote_uncached.await_count == 2
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_shared_cache_hit_skips_fetch(
+        self,
+        sample_quote: NormalizedQuote,
+    ) -> None:
+        """Test that a quote found in Redis is not fetched from the venue."""
+        # Arrange
+        shared_cache = AsyncMock(spec=RedisQuoteCache)
+        shared_cache.get_many.return_value = {"BTC": sample_quote}
+        client = KrakenClient(shared_cache=shared_cache)
+        client._fetch_quote_uncached = AsyncMock()
+
+        # Act
+        quote = await client.fetch_quote("BTC")
+
+        # Assert
+        assert quote == sample_quote
+        client._fetch_quote_uncached.assert_not_awaited()
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_fetched_quotes_are_written_to_shared_cache(
+        self,
+        sample_quote: NormalizedQuote,
+    ) -> None:
+        """Test that venue fetches fill Redis with the venue's TTL."""
+        # Arrange
+        shared_cache = AsyncMock(spec=RedisQuoteCache)
+        shared_cache.get_many.return_value = {}
+        client = KrakenClient(quote_ttl_seconds=3.0, shared_cache=shared_cache)
+        client._fetch_quote_uncached = AsyncMock(return_value=sample_quote)
+
+        # Act
+        await client.fetch_quote("BTC")
+
+        # Assert
+        quotes, ttl = shared_cache.set_many.await_args.args
+        assert list(quotes) == [sample_quote]
+        assert ttl == 3.0
+        await client.close()
+
+
+class TestRedisQuoteCache:
+    """Tests for RedisQuoteCache serialization."""
+
+    def test_encode_decode_round_trip(self, sample_quote: NormalizedQuote) -> None:
+        """Test that a quote survives encoding for Redis."""
+        # Act
+        decoded = RedisQuoteCache._decode(RedisQuoteCache._encode(sample_quote))
+
+        # Assert
+        assert decoded == sample_quote
+
+    @pytest.mark.asyncio
+    async def test_undecodable_entry_is_a_miss(
+        self, sample_quote: NormalizedQuote
+    ) -> None:
+        """Test that a malformed cached value is skipped, not raised."""
+        # Arrange
+        client = AsyncMock()
+        client.mget.return_value = [
+            RedisQuoteCache._encode(sample_quote),
+            b"not json",
+            b'{"venue_name": "Kraken"}',
+        ]
+        cache = RedisQuoteCache(client)
+
+        # Act
+        quotes = await cache.get_many("Kraken", ["BTC", "ETH", "SOL"])
+
+        # Assert
+        assert quotes == {"BTC": sample_quote}
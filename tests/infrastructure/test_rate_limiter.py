@@ -0,0 +1,87 @@
+"""Unit tests for AsyncRateLimiter."""
+
+import asyncio
+
+import pytest
+
+from app.rwa_aggregator.infrastructure.external.rate_limiter import AsyncRateLimiter
+
+
+class FakeClock:
+    """Manual clock whose sleep advances time instead of waiting."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestAsyncRateLimiter:
+    """Tests for AsyncRateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_burst_up_to_max_rate_is_not_delayed(self) -> None:
+        """Test that a full bucket lets max_rate requests through at once."""
+        # Arrange
+        clock = FakeClock()
+        limiter = AsyncRateLimiter(max_rate=5, clock=clock, sleep=clock.sleep)
+
+        # Act
+        for _ in range(5):
+            async with limiter:
+                pass
+
+        # Assert
+        assert clock.sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_requests_beyond_budget_wait_for_refill(self) -> None:
+        """Test that extra requests are spaced by the refill rate."""
+        # Arrange
+        clock = FakeClock()
+        limiter = AsyncRateLimiter(
+            max_rate=2, time_period=0.1, clock=clock, sleep=clock.sleep
+        )
+
+        # Act
+        await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+
+        # Assert: two immediate, then one every 50ms
+        assert clock.sleeps == pytest.approx([0.05, 0.05])
+
+    @pytest.mark.asyncio
+    async def test_burst_overrides_bucket_size(self) -> None:
+        """Test that burst allows more back-to-back requests than max_rate."""
+        # Arrange
+        clock = FakeClock()
+        limiter = AsyncRateLimiter(
+            max_rate=1, burst=3, clock=clock, sleep=clock.sleep
+        )
+
+        # Act
+        await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+
+        # Assert
+        assert clock.sleeps == pytest.approx([1.0])
+
+    def test_usable_from_successive_event_loops(self) -> None:
+        """Test that a module-level limiter is not bound to its first loop."""
+        # Arrange
+        clock = FakeClock()
+        limiter = AsyncRateLimiter(max_rate=1, clock=clock, sleep=clock.sleep)
+
+        async def contended() -> None:
+            await asyncio.gather(limiter.acquire(), limiter.acquire())
+
+        # Act
+        asyncio.run(contended())
+        asyncio.run(contended())
+
+        # Assert
+        assert len(clock.sleeps) == 3